@@ -0,0 +1,545 @@
+import array
+import collections
+import gzip
+import json
+from belief import Facet, PersonMentalModel, BusinessMentalModel, DwellingPlaceModel
+from evidence import PieceOfEvidence
+from vocabulary import Vocabulary
+
+
+# The classes of mental models and evidence, whose positions in these tuples are their codes in an archive
+MENTAL_MODEL_CLASSES = (PersonMentalModel, BusinessMentalModel, DwellingPlaceModel)
+EVIDENCE_CLASSES = tuple(PieceOfEvidence.__subclasses__())
+# The columns of an archive, mapped to their array typecodes; references to people, places,
+# and artifacts are indices into KnowledgeArchive.entities, references to strings (feature types,
+# facet values, and so forth) are their codes in the game's vocabulary if they're in it, and else
+# -2 minus their codes in the archive's local vocabulary (see KnowledgeArchive.string_code()),
+# references to facets and evidence are their rows, and -1 stands in for None throughout;
+# variable-length lists (e.g., the evidence for each facet) are stored as a flat column plus a
+# column of offsets into it, which has an extra final entry, so that the list for row i is
+# flat[offsets[i]:offsets[i+1]]
+COLUMNS = (
+    # One row per mental model
+    ('model owner', 'i'),
+    ('model subject', 'i'),
+    ('model type', 'b'),
+    ('model held facets offset', 'i'),  # Into the 'held ...' columns
+    ('model trajectory offset', 'i'),  # Into the 'trajectory ...' columns
+    # The facets currently held by each mental model, keyed by feature type
+    ('held feature type', 'i'),
+    ('held facet', 'i'),
+    # The belief trajectories of each mental model, as (feature type, facet) entries in order; an
+    # entry for a facet that was pruned (see MentalModel.prune_superseded_belief_facets()) has
+    # no facet (-1) and instead the code of its value
+    ('trajectory feature type', 'i'),
+    ('trajectory facet', 'i'),
+    ('trajectory pruned value', 'i'),
+    # One row per facet
+    ('facet owner', 'i'),
+    ('facet subject', 'i'),
+    ('facet feature type', 'i'),
+    ('facet value', 'i'),
+    ('facet strength', 'd'),
+    ('facet flags', 'b'),  # See FACET_IS_CHALLENGER and FACET_IS_IN_ALL_BELIEF_FACETS
+    ('facet predecessor', 'i'),
+    ('facet pruned predecessor', 'i'),  # The code of the value of a pruned predecessor, else -1
+    ('facet object itself', 'i'),
+    ('facet evidence offset', 'i'),
+    ('facet evidence', 'i'),
+    ('facet challengers offset', 'i'),
+    ('facet challengers', 'i'),
+    # One row per piece of evidence
+    ('evidence type', 'b'),
+    ('evidence event number', 'i'),
+    ('evidence ordinal date', 'i'),
+    ('evidence date', 'i'),
+    ('evidence location', 'i'),
+    ('evidence subject', 'i'),
+    ('evidence source', 'i'),
+    ('evidence recipient', 'i'),
+    ('evidence eavesdropper', 'i'),
+    ('evidence artifact', 'i'),
+    ('evidence attribute transferred', 'i'),
+    ('evidence base strength', 'd'),  # NaN stands in for None in these float columns
+    ('evidence total interactions', 'd'),  # Implants only
+    ('evidence salience of subject', 'd'),  # Implants only
+    ('evidence mutated belief str', 'i'),  # Mutations only
+    ('evidence integer flags', 'b'),  # Which of the float columns above held integers; see EVIDENCE_INTEGER_COLUMNS
+)
+# The columns of numbers that evidence may hold as either integers or floats, which are distinguished
+# in the 'evidence integer flags' column, where the bit for each of these is 1 << its position here
+EVIDENCE_INTEGER_COLUMNS = (
+    ('evidence base strength', 'base_strength'),
+    ('evidence total interactions', 'total_interactions'),
+    ('evidence salience of subject', 'salience_of_subject'),
+)
+FACET_IS_CHALLENGER = 1
+FACET_IS_IN_ALL_BELIEF_FACETS = 2
+NAN = float('nan')
+
+
+class KnowledgeArchive(object):
+    """A compact, columnar encoding of people's mental models, their belief facets, and the evidence for those.
+
+    Archiving a game's knowledge (see archive_knowledge()) replaces each person's mental
+    models and belief facets with stand-ins that rehydrate them from the archive upon first
+    being accessed, so that only the knowledge that gameplay actually touches ever becomes
+    objects again. An archive pickles compactly (as when a game is snapshotted), and its
+    columns can also be exported for analysis outside of the simulation (see export()).
+    """
+
+    def __init__(self, vocabulary):
+        """Initialize a KnowledgeArchive object.
+
+        @param vocabulary: The game's Vocabulary, whose codes will encode the archive's strings that are in it.
+        """
+        self.columns = {column: array.array(typecode) for column, typecode in COLUMNS}
+        # The people, places, and artifacts that the archive references, and the vocabularies for its
+        # strings; strings that aren't already in the game's vocabulary (e.g., the per-timestep
+        # whereabouts feature types and evidence dates) go in the local one, so that archiving
+        # never grows the game's vocabulary, which holds onto its strings for good
+        self.entities = []
+        self.vocabulary = vocabulary
+        self.local_vocabulary = Vocabulary()
+        # Maps each owner (as an entity index) to the range of rows of their mental models
+        self.model_rows_of_owner = {}
+        # Objects that have been rehydrated from the archive, keyed by their rows
+        self.rehydrated_facets = {}
+        self.rehydrated_evidence = {}
+        # Map each owner (as an entity index) to the rows of their facets, and each owner (by
+        # object ID) to their entity index; these are built upon the first rehydration
+        self.facet_rows_of_owner = None
+        self._owner_indices = None
+        # Lookup tables that are used only while encoding
+        self._entity_indices = {}
+        self._facet_rows = {}
+        self._evidence_rows = {}
+        self._facets_to_encode = []
+        self._evidence_to_encode = []
+        self._ids_of_facets_in_all_belief_facets = set()
+
+    def __getstate__(self):
+        """Return the state of this object for pickling, which leaves out rehydrated objects and lookup tables."""
+        return {'columns': self.columns, 'entities': self.entities, 'vocabulary': self.vocabulary,
+                'local_vocabulary': self.local_vocabulary, 'model_rows_of_owner': self.model_rows_of_owner}
+
+    def __setstate__(self, state):
+        """Restore this object from its pickled state."""
+        self.__init__(vocabulary=state['vocabulary'])
+        self.__dict__.update(state)
+
+    @property
+    def n_facets(self):
+        """Return the number of belief facets in this archive."""
+        return len(self.columns['facet owner'])
+
+    @property
+    def n_evidence(self):
+        """Return the number of pieces of evidence in this archive."""
+        return len(self.columns['evidence type'])
+
+    def string_code(self, string):
+        """Return the code that encodes the given string in this archive (see COLUMNS)."""
+        try:
+            return self.vocabulary.codes[string]
+        except KeyError:
+            return -2 - self.local_vocabulary.code(string)
+
+    def string(self, code):
+        """Return the string that the given code encodes in this archive."""
+        return self.vocabulary.strings[code] if code >= 0 else self.local_vocabulary.strings[-2 - code]
+
+    def encode_minds(self, people):
+        """Encode the mental models and belief facets of the given people, and all the evidence for those.
+
+        An archive holds the knowledge of a single batch of people, and so this may only be called once.
+        """
+        columns = self.columns
+        held_feature_types, held_facets = columns['held feature type'], columns['held facet']
+        trajectory_feature_types, trajectory_facets = (
+            columns['trajectory feature type'], columns['trajectory facet']
+        )
+        for person in people:
+            owner = self._entity(person)
+            first_model_row = len(columns['model owner'])
+            for subject, mental_model in person.mind.mental_models.iteritems():
+                columns['model owner'].append(owner)
+                columns['model subject'].append(self._entity(subject))
+                columns['model type'].append(MENTAL_MODEL_CLASSES.index(mental_model.__class__))
+                columns['model held facets offset'].append(len(held_facets))
+                columns['model trajectory offset'].append(len(trajectory_facets))
+                for feature_type, trajectory in mental_model.belief_trajectories.iteritems():
+                    feature_type_code = self.string_code(feature_type)
+                    held_facet = mental_model.get_belief_facet(feature_type=feature_type)
+                    if held_facet is not None:
+                        held_feature_types.append(feature_type_code)
+                        held_facets.append(self._facet(held_facet))
+                    for facet in trajectory:
+                        trajectory_feature_types.append(feature_type_code)
+                        if type(facet) is Facet:
+                            trajectory_facets.append(self._facet(facet))
+                            columns['trajectory pruned value'].append(-1)
+                        else:
+                            trajectory_facets.append(-1)
+                            columns['trajectory pruned value'].append(self.string_code(facet))
+            self.model_rows_of_owner[owner] = (first_model_row, len(columns['model owner']))
+            for facet in person.all_belief_facets:
+                # Note that, because facets are strings, this set holds at most one facet of a given
+                # value, so membership in it must be checked by identity rather than equality
+                self._ids_of_facets_in_all_belief_facets.add(id(facet))
+                self._facet(facet)
+        columns['model held facets offset'].append(len(held_facets))
+        columns['model trajectory offset'].append(len(trajectory_facets))
+        # Encode every facet and piece of evidence that was referenced above; since these
+        # reference one another, encoding one may reference others that are yet to be encoded
+        i = j = 0
+        while i < len(self._facets_to_encode) or j < len(self._evidence_to_encode):
+            while i < len(self._facets_to_encode):
+                self._encode_facet(self._facets_to_encode[i])
+                i += 1
+            while j < len(self._evidence_to_encode):
+                self._encode_evidence(self._evidence_to_encode[j])
+                j += 1
+        columns['facet evidence offset'].append(len(columns['facet evidence']))
+        columns['facet challengers offset'].append(len(columns['facet challengers']))
+        # Encoding is complete, so release the lookup tables (and the objects they keep alive)
+        self._entity_indices = {}
+        self._facet_rows = {}
+        self._evidence_rows = {}
+        self._facets_to_encode = []
+        self._evidence_to_encode = []
+        self._ids_of_facets_in_all_belief_facets = set()
+
+    def _encode_facet(self, facet):
+        """Encode a belief facet as the next row."""
+        columns = self.columns
+        owner = self._entity(facet.owner)
+        columns['facet owner'].append(owner)
+        columns['facet subject'].append(self._entity(facet.subject))
+        columns['facet feature type'].append(self.string_code(facet.feature_type))
+        columns['facet value'].append(self.string_code(str(facet)))
+        columns['facet strength'].append(facet.strength)
+        flags = FACET_IS_CHALLENGER if facet.challenger else 0
+        if id(facet) in self._ids_of_facets_in_all_belief_facets:
+            flags |= FACET_IS_IN_ALL_BELIEF_FACETS
+        columns['facet flags'].append(flags)
+        if facet.predecessor is None or type(facet.predecessor) is Facet:
+            columns['facet predecessor'].append(self._facet(facet.predecessor))
+            columns['facet pruned predecessor'].append(-1)
+        else:
+            columns['facet predecessor'].append(-1)
+            columns['facet pruned predecessor'].append(self.string_code(facet.predecessor))
+        columns['facet object itself'].append(self._entity(facet.object_itself))
+        columns['facet evidence offset'].append(len(columns['facet evidence']))
+        for piece_of_evidence in facet.evidence:
+            columns['facet evidence'].append(self._piece_of_evidence(piece_of_evidence))
+        columns['facet challengers offset'].append(len(columns['facet challengers']))
+        for challenger in facet.challengers:
+            columns['facet challengers'].append(self._facet(challenger))
+
+    def _encode_evidence(self, piece_of_evidence):
+        """Encode a piece of evidence as the next row."""
+        columns = self.columns
+        columns['evidence type'].append(EVIDENCE_CLASSES.index(piece_of_evidence.__class__))
+        columns['evidence event number'].append(piece_of_evidence.event_number)
+        columns['evidence ordinal date'].append(piece_of_evidence.ordinal_date)
+        columns['evidence date'].append(self.string_code(piece_of_evidence.date))
+        columns['evidence location'].append(self._entity(piece_of_evidence.location))
+        columns['evidence subject'].append(self._entity(piece_of_evidence.subject))
+        columns['evidence source'].append(self._entity(piece_of_evidence.source))
+        columns['evidence recipient'].append(self._entity(piece_of_evidence.recipient))
+        columns['evidence eavesdropper'].append(self._entity(piece_of_evidence.eavesdropper))
+        columns['evidence artifact'].append(self._entity(piece_of_evidence.artifact))
+        columns['evidence attribute transferred'].append(self._facet(piece_of_evidence.attribute_transferred))
+        integer_flags = 0
+        for i, (column, attribute) in enumerate(EVIDENCE_INTEGER_COLUMNS):
+            value = getattr(piece_of_evidence, attribute, None)
+            columns[column].append(NAN if value is None else value)
+            if isinstance(value, (int, long)):
+                integer_flags |= 1 << i
+        columns['evidence integer flags'].append(integer_flags)
+        mutated_belief_str = getattr(piece_of_evidence, 'mutated_belief_str', None)
+        columns['evidence mutated belief str'].append(
+            -1 if mutated_belief_str is None else self.string_code(mutated_belief_str)
+        )
+
+    def _entity(self, entity):
+        """Return the index of the given entity (a person, place, or artifact), adding it if need be."""
+        if entity is None:
+            return -1
+        try:
+            return self._entity_indices[id(entity)]
+        except KeyError:
+            self._entity_indices[id(entity)] = len(self.entities)
+            self.entities.append(entity)
+            return len(self.entities) - 1
+
+    def _facet(self, facet):
+        """Return the row of the given facet, queuing it for encoding if need be."""
+        if facet is None:
+            return -1
+        try:
+            return self._facet_rows[id(facet)]
+        except KeyError:
+            self._facet_rows[id(facet)] = len(self._facets_to_encode)
+            self._facets_to_encode.append(facet)
+            return len(self._facets_to_encode) - 1
+
+    def _piece_of_evidence(self, piece_of_evidence):
+        """Return the row of the given piece of evidence, queuing it for encoding if need be."""
+        try:
+            return self._evidence_rows[id(piece_of_evidence)]
+        except KeyError:
+            self._evidence_rows[id(piece_of_evidence)] = len(self._evidence_to_encode)
+            self._evidence_to_encode.append(piece_of_evidence)
+            return len(self._evidence_to_encode) - 1
+
+    def rehydrate_mind(self, person):
+        """Rehydrate a person's mental models and belief facets from this archive."""
+        if self.facet_rows_of_owner is None:
+            self._index_facet_rows_by_owner()
+        owner = self._owner_indices[id(person)]
+        columns = self.columns
+        string, entities = self.string, self.entities
+        # Replace the stand-ins with the real thing before doing anything else, in case rehydrating
+        # these facets requires rehydrating someone else's, which might reference these in turn
+        person.mind.mental_models = collections.OrderedDict()
+        person.all_belief_facets = set()
+        # Create each of this person's facets, and then fill in their references to one another
+        facet_rows = self.facet_rows_of_owner.get(owner, ())
+        for row in facet_rows:
+            facet = Facet.__new__(Facet, string(columns['facet value'][row]))
+            facet.owner = person
+            facet.subject = entities[columns['facet subject'][row]]
+            facet.feature_type = string(columns['facet feature type'][row])
+            facet.strength = columns['facet strength'][row]
+            facet.decays = bool(columns['facet flags'][row] & FACET_IS_IN_ALL_BELIEF_FACETS)
+            facet.challenger = bool(columns['facet flags'][row] & FACET_IS_CHALLENGER)
+            object_itself = columns['facet object itself'][row]
+            facet.object_itself = None if object_itself == -1 else entities[object_itself]
+            self.rehydrated_facets[row] = facet
+        for row in facet_rows:
+            facet = self.rehydrated_facets[row]
+            pruned_predecessor = columns['facet pruned predecessor'][row]
+            if pruned_predecessor == -1:
+                facet.predecessor = self.facet(columns['facet predecessor'][row])
+            else:
+                facet.predecessor = string(pruned_predecessor)
+            facet.challengers = {
+                self.facet(challenger_row) for challenger_row in
+                columns['facet challengers'][columns['facet challengers offset'][row]:
+                                             columns['facet challengers offset'][row+1]]
+            }
+            facet.evidence = set()
+            for evidence_row in columns['facet evidence'][columns['facet evidence offset'][row]:
+                                                          columns['facet evidence offset'][row+1]]:
+                piece_of_evidence = self.piece_of_evidence(evidence_row)
+                facet.evidence.add(piece_of_evidence)
+                piece_of_evidence.beliefs_evidenced.add(facet)
+            if columns['facet flags'][row] & FACET_IS_IN_ALL_BELIEF_FACETS:
+                person.all_belief_facets.add(facet)
+        # Now create this person's mental models, in their original order (which Mind.mental_models keeps)
+        first_model_row, last_model_row = self.model_rows_of_owner.get(owner, (0, 0))
+        for row in xrange(first_model_row, last_model_row):
+            mental_model_class = MENTAL_MODEL_CLASSES[columns['model type'][row]]
+            subject = entities[columns['model subject'][row]]
+            if mental_model_class is PersonMentalModel:
+                mental_model = PersonMentalModel(owner=person, subject=subject, observation_or_reflection=None)
+            else:
+                mental_model = mental_model_class(owner=person, subject=subject, observation=None)
+            for i in xrange(columns['model held facets offset'][row], columns['model held facets offset'][row+1]):
+                mental_model.set_belief_facet(
+                    feature_type=string(columns['held feature type'][i]), facet=self.facet(columns['held facet'][i])
+                )
+            for i in xrange(columns['model trajectory offset'][row], columns['model trajectory offset'][row+1]):
+                feature_type = string(columns['trajectory feature type'][i])
+                if feature_type not in mental_model.belief_trajectories:
+                    mental_model.belief_trajectories[feature_type] = []
+                pruned_value = columns['trajectory pruned value'][i]
+                mental_model.belief_trajectories[feature_type].append(
+                    self.facet(columns['trajectory facet'][i]) if pruned_value == -1 else string(pruned_value)
+                )
+        # Lastly, link each facet to its owner's mental model of the object it resolves to
+        for row in facet_rows:
+            facet = self.rehydrated_facets[row]
+            facet.mental_model = person.mind.mental_models[facet.object_itself] if facet.object_itself else None
+
+    def facet(self, row):
+        """Return the facet at the given row, rehydrating its owner's mind if need be."""
+        if row == -1:
+            return None
+        if row not in self.rehydrated_facets:
+            owner = self.entities[self.columns['facet owner'][row]]
+            owner.mind.mental_models.rehydrate()
+        return self.rehydrated_facets[row]
+
+    def piece_of_evidence(self, row):
+        """Return the piece of evidence at the given row, rehydrating it if need be."""
+        try:
+            return self.rehydrated_evidence[row]
+        except KeyError:
+            pass
+        columns, entities = self.columns, self.entities
+
+        def entity(column):
+            index = columns[column][row]
+            return None if index == -1 else entities[index]
+        evidence_class = EVIDENCE_CLASSES[columns['evidence type'][row]]
+        piece_of_evidence = evidence_class.__new__(evidence_class)
+        self.rehydrated_evidence[row] = piece_of_evidence
+        piece_of_evidence.location = entity('evidence location')
+        piece_of_evidence.date = self.string(columns['evidence date'][row])
+        piece_of_evidence.ordinal_date = columns['evidence ordinal date'][row]
+        piece_of_evidence.event_number = columns['evidence event number'][row]
+        piece_of_evidence.subject = entity('evidence subject')
+        piece_of_evidence.source = entity('evidence source')
+        piece_of_evidence.recipient = entity('evidence recipient')
+        piece_of_evidence.eavesdropper = entity('evidence eavesdropper')
+        piece_of_evidence.artifact = entity('evidence artifact')
+        piece_of_evidence.beliefs_evidenced = set()
+        integer_flags = columns['evidence integer flags'][row]
+        for i, (column, attribute) in enumerate(EVIDENCE_INTEGER_COLUMNS):
+            value = columns[column][row]
+            if value != value:  # NaN, which stands for None, or else for an attribute that only Implants have
+                if attribute == 'base_strength':
+                    piece_of_evidence.base_strength = None
+            else:
+                setattr(piece_of_evidence, attribute, int(value) if integer_flags & 1 << i else value)
+        if columns['evidence mutated belief str'][row] != -1:
+            piece_of_evidence.mutated_belief_str = self.string(columns['evidence mutated belief str'][row])
+        # This goes last, since it may require rehydrating the source's mind
+        piece_of_evidence.attribute_transferred = self.facet(columns['evidence attribute transferred'][row])
+        return piece_of_evidence
+
+    def _index_facet_rows_by_owner(self):
+        """Index the rows of this archive's facets by their owners."""
+        self.facet_rows_of_owner = {}
+        for row, owner in enumerate(self.columns['facet owner']):
+            if owner not in self.facet_rows_of_owner:
+                self.facet_rows_of_owner[owner] = array.array('i')
+            self.facet_rows_of_owner[owner].append(row)
+        self._owner_indices = {id(self.entities[owner]): owner for owner in self.model_rows_of_owner}
+
+    def export(self, path):
+        """Write this archive's columns to the given path, for analysis outside of the simulation.
+
+        The file is gzipped, and holds a line of JSON describing the columns, strings (those of the
+        game's vocabulary, and the archive's local ones), and entities (as [type, ID] pairs), followed
+        by the raw bytes of each column in turn; see load_export().
+        """
+        header = {
+            "columns": [[column, typecode, len(self.columns[column])] for column, typecode in COLUMNS],
+            "strings": self.vocabulary.strings,
+            "local strings": self.local_vocabulary.strings,
+            "entities": [[entity.type, getattr(entity, 'id', None)] for entity in self.entities],
+            "mental model types": [cls.__name__ for cls in MENTAL_MODEL_CLASSES],
+            "evidence types": [cls.__name__ for cls in EVIDENCE_CLASSES],
+        }
+        with gzip.open(path, 'wb', compresslevel=1) as f:
+            f.write(json.dumps(header) + '\n')
+            for column, _ in COLUMNS:
+                f.write(self.columns[column].tostring())
+
+
+class _ArchivedKnowledge(object):
+    """A base class for the stand-ins that rehydrate a person's knowledge from an archive upon first access."""
+
+    def __init__(self, archive, person):
+        """Initialize an _ArchivedKnowledge object."""
+        self.archive = archive
+        self.person = person
+
+    def rehydrate(self):
+        """This method gets overridden by the subclasses to this base class."""
+        pass
+
+    def __getattr__(self, name):
+        # Special methods (and this object's own attributes, when it is being unpickled) are looked up
+        # before its state is restored, and so these must never trigger rehydration
+        if name.startswith('__') or name in ('archive', 'person'):
+            raise AttributeError(name)
+        return getattr(self.rehydrate(), name)
+
+    def __contains__(self, item):
+        return item in self.rehydrate()
+
+    def __iter__(self):
+        return iter(self.rehydrate())
+
+    def __len__(self):
+        return len(self.rehydrate())
+
+
+class _ArchivedMentalModels(_ArchivedKnowledge):
+    """A stand-in for a person's mental models that rehydrates them from an archive upon first access."""
+
+    def rehydrate(self):
+        """Return the person's real mental models, rehydrating them if need be."""
+        if self.person.mind.mental_models is self:
+            self.archive.rehydrate_mind(self.person)
+        return self.person.mind.mental_models
+
+    def __getitem__(self, key):
+        return self.rehydrate()[key]
+
+    def __setitem__(self, key, value):
+        self.rehydrate()[key] = value
+
+    def __delitem__(self, key):
+        del self.rehydrate()[key]
+
+
+class _ArchivedBeliefFacets(_ArchivedKnowledge):
+    """A stand-in for a person's set of all belief facets that rehydrates it from an archive upon first access."""
+
+    def rehydrate(self):
+        """Return the person's real set of belief facets, rehydrating it if need be."""
+        if self.person.all_belief_facets is self:
+            self.archive.rehydrate_mind(self.person)
+        return self.person.all_belief_facets
+
+
+def archive_knowledge(game):
+    """Archive the knowledge of everyone in a game, and return the archive.
+
+    Each person's mental models and belief facets are encoded into the archive and replaced
+    by stand-ins that rehydrate them from it upon first being accessed. The game's evidence log
+    is also cleared, since it would otherwise keep all the archived evidence alive; archived
+    evidence is ordered by its 'evidence event number' column instead. This should be called
+    between timesteps, when nothing outside of people's minds holds onto facets or evidence.
+    (If the game's knowledge was archived before, whatever is still archived is rehydrated and
+    then encoded anew.)
+    """
+    people = _people_with_knowledge(game=game)
+    knowledge_archive = KnowledgeArchive(vocabulary=game.vocabulary)
+    knowledge_archive.encode_minds(people=people)
+    for person in people:
+        person.mind.mental_models = _ArchivedMentalModels(archive=knowledge_archive, person=person)
+        person.all_belief_facets = _ArchivedBeliefFacets(archive=knowledge_archive, person=person)
+    game.evidence_log.clear()
+    return knowledge_archive
+
+
+def export_knowledge(game, path):
+    """Export the knowledge of everyone in a game to the given path, without archiving it (see KnowledgeArchive.export())."""
+    knowledge_archive = KnowledgeArchive(vocabulary=game.vocabulary)
+    knowledge_archive.encode_minds(people=_people_with_knowledge(game=game))
+    knowledge_archive.export(path=path)
+
+
+def load_export(path):
+    """Return the header and columns of an archive that was exported to the given path."""
+    with gzip.open(path, 'rb') as f:
+        header = json.loads(f.readline())
+        columns = {}
+        for column, typecode, length in header["columns"]:
+            columns[column] = array.array(typecode)
+            columns[column].fromstring(f.read(length * columns[column].itemsize))
+    return header, columns
+
+
+def _people_with_knowledge(game):
+    """Return everyone in a game who may hold knowledge, in a deterministic order."""
+    city = game.city
+    return sorted(city.residents | city.departed | city.deceased, key=lambda person: person.id)
+
@@ -1,7 +1,5 @@
-from corpora import GravestoneDetails
 from belief import PersonMentalModel
 from evidence import Examination
-import random
 
 
 # ARTIFACTS ARE LIKE ITEMS IN THE SIMS, EXCEPT THEY ARE NOT COLLECTIONS OF AFFORDANCES,
@@ -76,11 +74,11 @@ class Gravestone(Artifact):
         super(Gravestone, self).__init__()
         self.subject = subject
         if self.subject.extended_family:
-            self.header = GravestoneDetails.a_header() + '\n'
+            self.header = self.subject.game.gravestone_details.a_header() + '\n'
             self.family_inscription = self._generate_family_inscription()
-            self.epitaph = GravestoneDetails.an_epitaph() + '\n'
+            self.epitaph = self.subject.game.gravestone_details.an_epitaph() + '\n'
         else:
-            self.header = random.choice(['Here lies buried', 'Rest in peace']) + '\n'
+            self.header = self.subject.game.random.choice(['Here lies buried', 'Rest in peace']) + '\n'
             self.family_inscription = ''
             self.epitaph = ''
         if (self.subject.occupations and
@@ -1,6 +1,5 @@
-import random
+import operator
 from evidence import *
-from corpora import Names
 
 
 # TODO StreetMentalModel, BlockMentalModel, CityMentalModel?
@@ -11,8 +10,35 @@ from corpora import Names
 # TODO IF PEOPLE ARE WORKING ARE PEOPLE OBSERVING THEIR JOB?
 
 
+def _compile_belief_facet_accessors(attributes_holding_facets):
+    """Return a table mapping feature types to accessors for the attributes that hold their belief facets.
+
+    Each accessor is a (getter, parent getter, attribute name) triple: the getter returns the
+    facet held by a given mental model, and the parent getter returns the object (e.g., a
+    mental model's HairBelief) whose attribute of that name should be set to adopt a new facet.
+
+    @param attributes_holding_facets: A dictionary mapping each feature type to the dotted path,
+                                      relative to a mental model, of the attribute holding its facet.
+    """
+    accessors = {}
+    for feature_type, path in attributes_holding_facets.iteritems():
+        parent_path, _, attribute_name = path.rpartition('.')
+        parent_getter = operator.attrgetter(parent_path) if parent_path else lambda mental_model: mental_model
+        accessors[feature_type] = (operator.attrgetter(path), parent_getter, attribute_name)
+    return accessors
+
+
+def _parse_whereabouts_feature_type(feature_type):
+    """Return the (ordinal date, day-or-night bit) key of a whereabouts feature type like 'whereabouts 723099-1'."""
+    ordinal_date, day_or_night_bit = feature_type[12:].split('-')
+    return int(ordinal_date), int(day_or_night_bit)
+
+
 class MentalModel(object):
     """A person's mental model of a person or place."""
+    # Maps each feature type of this mental model to accessors for the attribute holding its
+    # belief facet (see _compile_belief_facet_accessors()); this gets overridden by the subclasses
+    belief_facet_accessors = {}
 
     def __init__(self, owner, subject):
         """Initialize a MentalModel object."""
@@ -23,7 +49,8 @@ class MentalModel(object):
         # trajectories, meaning a list of the belief facets they've held for that attribute of the
         # subject in the order that they were held; facets may appear multiple times in the case
         # that they were overtaken and then subsequently were reinstated; this attribute gets
-        # modified every time a new Facet object initializes or takes over
+        # modified every time a new Facet object initializes or takes over, and superseded facets
+        # that get pruned (see prune_superseded_belief_facets()) remain in it only as their values
         self.belief_trajectories = {}
 
     def __str__(self):
@@ -39,7 +66,7 @@ class MentalModel(object):
         """
         config = self.owner.game.config
         for feature_type in config.salience_of_features_with_regard_to_implants:
-            if (random.random() <
+            if (self.owner.game.knowledge_random.random() <
                     config.salience_of_features_with_regard_to_implants[feature_type] * implant.base_strength):
                 # Note: this Facet will automatically be adopted because it will be this character's
                 # first belief about this attribute; specifically, this will happen by a series of
@@ -101,10 +128,7 @@ class MentalModel(object):
                                       e.g., a belief of what dwelling place a person lives in.
         @param new_evidence: A Statement or Lie object that reifies this new evidence.
         """
-        command_to_access_my_current_belief = self.get_command_to_access_a_belief_facet(
-            feature_type=feature_type
-        )
-        current_belief_facet = eval(command_to_access_my_current_belief)
+        current_belief_facet = self.get_belief_facet(feature_type=feature_type)
         if current_belief_facet == feature_value:
             # This new evidence supports an existing belief, so attribute it accordingly
             current_belief_facet.attribute_new_evidence(new_evidence=new_evidence)
@@ -128,10 +152,7 @@ class MentalModel(object):
     def _consider_contradictory_evidence(self, feature_type, feature_value, feature_object_itself, new_evidence):
         """Consider new evidence that contradicts the currently held belief facet."""
         # Access the currently held belief facet
-        command_to_access_my_current_belief = self.get_command_to_access_a_belief_facet(
-            feature_type=feature_type
-        )
-        current_belief_facet = eval(command_to_access_my_current_belief)
+        current_belief_facet = self.get_belief_facet(feature_type=feature_type)
         # Check if this evidence supports any challenger to the currently held belief facet
         if any(challenger for challenger in current_belief_facet.challengers if challenger == feature_value):
             # It does, so attribute this new evidence, which may cause this challenger to overtake
@@ -151,11 +172,7 @@ class MentalModel(object):
 
     def adopt_belief(self, new_belief_facet, old_belief_facet=None):
         """Adopt a new belief facet; if an old facet is being overtaken, update it accordingly."""
-        command_to_access_my_current_belief = self.get_command_to_access_a_belief_facet(
-            feature_type=new_belief_facet.feature_type
-        )
-        command_to_instantiate_new_belief_facet = command_to_access_my_current_belief + ' = new_belief_facet'
-        exec command_to_instantiate_new_belief_facet
+        self.set_belief_facet(feature_type=new_belief_facet.feature_type, facet=new_belief_facet)
         # Update your belief trajectory
         self._update_belief_trajectory(new_belief_facet=new_belief_facet)
         # Attribute a predecessor (or lack thereof) to the new belief facet
@@ -186,6 +203,43 @@ class MentalModel(object):
         else:
             self.belief_trajectories[feature_type].append(new_belief_facet)
 
+    def prune_superseded_belief_facets(self, threshold):
+        """Prune the superseded belief facets of this mental model whose strength has decayed below the
+        given threshold, and return them.
+
+        A superseded facet is one that has been relegated to challenger status (or that never
+        overtook the currently held facet). Pruning detaches such a facet from the currently held
+        facet's challengers and from the evidence for it, so that it may be garbage-collected,
+        and leaves only its value (as a plain string) in this mental model's belief trajectories
+        and as the predecessor of the facet that superseded it. Note that a pruned facet can no
+        longer be reinstated by new evidence supporting it; such evidence begets a new facet.
+        """
+        vocabulary = self.owner.game.vocabulary
+        pruned_facets = {}
+        for trajectory in self.belief_trajectories.itervalues():
+            for i, facet in enumerate(trajectory):
+                if _superseded_facet_has_decayed(facet=facet, threshold=threshold):
+                    trajectory[i] = vocabulary.intern(facet)
+                    pruned_facets[id(facet)] = facet
+            # The last facet in a trajectory is the one currently held
+            currently_held_facet = trajectory[-1]
+            for challenger in list(currently_held_facet.challengers):
+                if _superseded_facet_has_decayed(facet=challenger, threshold=threshold):
+                    currently_held_facet.challengers.remove(challenger)
+                    pruned_facets[id(challenger)] = challenger
+        if pruned_facets:
+            for facet in pruned_facets.itervalues():
+                for piece_of_evidence in facet.evidence:
+                    # Because facets are strings, this set holds at most one facet of a given value,
+                    # which may not be this one, and so its membership must be checked by identity
+                    if any(belief_evidenced is facet for belief_evidenced in piece_of_evidence.beliefs_evidenced):
+                        piece_of_evidence.beliefs_evidenced.remove(facet)
+            for trajectory in self.belief_trajectories.itervalues():
+                for facet in trajectory:
+                    if type(facet) is Facet and id(facet.predecessor) in pruned_facets:
+                        facet.predecessor = vocabulary.intern(facet.predecessor)
+        return pruned_facets.values()
+
     def init_belief_facet(self, feature_type, observation_or_reflection):
         """Determine a belief facet pertaining to a feature of the given type."""
         if not observation_or_reflection:
@@ -287,10 +341,9 @@ class MentalModel(object):
         """This method gets overridden by the subclasses to this base class."""
         pass
 
-    @staticmethod
-    def _decide_how_knowledge_will_pollute_or_be_forgotten(config):
+    def _decide_how_knowledge_will_pollute_or_be_forgotten(self, config):
         """Decide whether knowledge will succumb to degradation or transference or forgetting."""
-        x = random.random()
+        x = self.owner.game.knowledge_random.random()
         pollution_type_probabilities = config.memory_pollution_probabilities
         result = next(  # See config.py to understand what this is doing
             pollution_type[1] for pollution_type in pollution_type_probabilities if
@@ -311,14 +364,38 @@ class MentalModel(object):
             chance_it_gets_remembered_perfectly = chance_cap
         return chance_it_gets_remembered_perfectly
 
-    @staticmethod
-    def get_command_to_access_a_belief_facet(feature_type):
-        """This method gets overridden by the subclasses to this base class."""
-        return ''
+    def get_belief_facet(self, feature_type):
+        """Return the belief facet currently held for this feature type; if none, return None."""
+        try:
+            return self.belief_facet_accessors[feature_type][0](self)
+        except AttributeError:
+            # This error gets raised when this mental model has not even been fully constructed
+            # yet -- i.e., the facet is one of the initial belief facets that will make up the initial
+            # mental model, so attribute hierarchies like MentalModel.Face.Hair.Color are not even
+            # constructed yet (and thus cannot be accessed); in this case, we can safely assert that
+            # there is no currently held belief for this attribute
+            return None
+
+    def set_belief_facet(self, feature_type, facet):
+        """Set the belief facet currently held for this feature type."""
+        _, parent_getter, attribute_name = self.belief_facet_accessors[feature_type]
+        setattr(parent_getter(self), attribute_name, facet)
 
 
 class BusinessMentalModel(MentalModel):
     """A person's mental model of a business."""
+    # Maps each feature type of this mental model to accessors for the attribute holding its belief facet
+    belief_facet_accessors = _compile_belief_facet_accessors({
+        "business name": "name",
+        "business block": "block",
+        "business address": "address",
+    })
+    # Maps each attribute of this mental model to its feature type
+    feature_types_of_attributes = {
+        "name": "business name",
+        "block": "business block",
+        "address": "business address",
+    }
 
     def __init__(self, owner, subject, observation):
         """Initialize a BusinessMentalModel object.
@@ -401,7 +478,7 @@ class BusinessMentalModel(MentalModel):
                 else:  # Could still confabulate
                     feature_type_str = self.attribute_to_feature_type(attribute=feature)
                     chance_of_memory_deterioration = config.chance_of_confabulation_on_a_given_timestep
-                if random.random() < chance_of_memory_deterioration:
+                if self.owner.game.knowledge_random.random() < chance_of_memory_deterioration:
                     # Instantiate a new belief facet that represents a deterioration of
                     # the existing one (which itself may be a deterioration already) --
                     # when the facet object's init() method is called, it will call
@@ -420,15 +497,15 @@ class BusinessMentalModel(MentalModel):
             confabulated_feature_str = "CONFABULATED BUSINESS NAME"
             confabulated_object_itself = None
         elif feature_type == "business block":
-            random_block = random.choice(list(self.owner.city.blocks))
+            random_block = self.owner.game.knowledge_random.choice(list(self.owner.city.blocks))
             confabulated_feature_str = str(random_block)
             confabulated_object_itself = None
         else:  # business address
-            house_number = int(random.random() * config.largest_possible_house_number) + 1
+            house_number = int(self.owner.game.knowledge_random.random() * config.largest_possible_house_number) + 1
             while house_number < config.smallest_possible_house_number:
-                house_number += int(random.random() * 500)
+                house_number += int(self.owner.game.knowledge_random.random() * 500)
             house_number = min(house_number, config.largest_possible_house_number)
-            random_street = random.choice(list(self.owner.city.streets))
+            random_street = self.owner.game.knowledge_random.choice(list(self.owner.city.streets))
             confabulated_feature_str = "{} {}".format(house_number, random_street)
             confabulated_object_itself = None
         belief_facet_object = Facet(
@@ -465,16 +542,16 @@ class BusinessMentalModel(MentalModel):
         """Mutate a belief facet pertaining to a person's home block."""
         # Add 100-300 to block number
         block_number_first_digit = int(str(facet_being_mutated)[0])
-        if random.random() < 0.5:
-            change_to_block_number = random.randint(1, 3)
+        if self.owner.game.knowledge_random.random() < 0.5:
+            change_to_block_number = self.owner.game.knowledge_random.randint(1, 3)
         else:
-            change_to_block_number = random.randint(-3, -1)
+            change_to_block_number = self.owner.game.knowledge_random.randint(-3, -1)
         block_number_first_digit += change_to_block_number
         if block_number_first_digit < 1:
             block_number_first_digit = 1
         elif block_number_first_digit > 8:
             block_number_first_digit = 8
-        if random.random() < 0.5:
+        if self.owner.game.knowledge_random.random() < 0.5:
             # Also mutate street to a nearby street
             street_of_current_facet = next(
                 s for s in self.owner.city.streets if s.name == str(facet_being_mutated).split(' of ')[1]
@@ -495,8 +572,8 @@ class BusinessMentalModel(MentalModel):
         # Change the house number
         digits_of_house_number = list(str(facet_being_mutated)[:3])
         for i in xrange(3):
-            if random.random() < 0.3:
-                if random.random() < 0.5:
+            if self.owner.game.knowledge_random.random() < 0.3:
+                if self.owner.game.knowledge_random.random() < 0.5:
                     change_to_digit = 1
                 else:
                     change_to_digit = -1
@@ -514,7 +591,7 @@ class BusinessMentalModel(MentalModel):
         while mutated_house_number > config.largest_possible_house_number:
             mutated_house_number -= 100
         mutated_house_number = str(mutated_house_number)
-        if random.random() < 0.1:
+        if self.owner.game.knowledge_random.random() < 0.1:
             # Also mutate street to a nearby street
             street_of_current_facet = next(
                 # Get out just the street name (strip away house number and apartment unit number, if any)
@@ -550,7 +627,7 @@ class BusinessMentalModel(MentalModel):
                     biz for biz in other_business_mental_models if biz.__class__ is self.subject.__class__
                 )
             else:
-                business_belief_will_transfer_from = random.choice(other_business_mental_models)
+                business_belief_will_transfer_from = self.owner.game.knowledge_random.choice(other_business_mental_models)
         else:
             business_belief_will_transfer_from = None
         return business_belief_will_transfer_from
@@ -562,15 +639,10 @@ class BusinessMentalModel(MentalModel):
         else:
             return None
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the belief type of an attribute."""
-        attribute_to_belief_type = {
-            "name": "business name",
-            "block": "business block",
-            "address": "business address"
-        }
-        return attribute_to_belief_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
     def get_facet_to_this_belief_of_type(self, feature_type):
         """Return the facet to this mental model of the given type."""
@@ -581,19 +653,21 @@ class BusinessMentalModel(MentalModel):
         elif feature_type == "business address":
             return self.address
 
-    @staticmethod
-    def get_command_to_access_a_belief_facet(feature_type):
-        """Return a command that will allow the belief facet for this feature type to be directly modified."""
-        feature_type_to_command = {
-            "business name": "self.name",
-            "business block": "self.block",
-            "business address": "self.address",
-        }
-        return feature_type_to_command[feature_type]
-
 
 class DwellingPlaceModel(MentalModel):
     """A person's mental model of a business."""
+    # Maps each feature type of this mental model to accessors for the attribute holding its belief facet
+    belief_facet_accessors = _compile_belief_facet_accessors({
+        "home is apartment": "apartment",
+        "home block": "block",
+        "home address": "address",
+    })
+    # Maps each attribute of this mental model to its feature type
+    feature_types_of_attributes = {
+        "apartment": "home is apartment",
+        "block": "home block",
+        "address": "home address",
+    }
 
     def __init__(self, owner, subject, observation):
         """Initialize a DwellingPlaceMentalModel object.
@@ -676,7 +750,7 @@ class DwellingPlaceModel(MentalModel):
                     self.owner.mind.memory /
                     belief_facet_strength
                 )
-                if random.random() < chance_of_memory_deterioration:
+                if self.owner.game.knowledge_random.random() < chance_of_memory_deterioration:
                     # Instantiate a new belief facet that represents a deterioration of
                     # the existing one (which itself may be a deterioration already) --
                     # when the facet object's init() method is called, it will call
@@ -691,20 +765,20 @@ class DwellingPlaceModel(MentalModel):
         config = self.owner.game.config
         confabulation = Confabulation(subject=self.subject, source=self.owner)
         if feature_type == "home is apartment":
-            confabulated_feature_str = random.choice(["yes", "no"])
+            confabulated_feature_str = self.owner.game.knowledge_random.choice(["yes", "no"])
             confabulated_object_itself = None
         elif feature_type == "home block":
-            random_block = random.choice(list(self.owner.city.blocks))  # 98989
+            random_block = self.owner.game.knowledge_random.choice(list(self.owner.city.blocks))  # 98989
             confabulated_feature_str = str(random_block)
             confabulated_object_itself = None
         else:  # home address
-            house_number = int(random.random() * config.largest_possible_house_number) + 1
+            house_number = int(self.owner.game.knowledge_random.random() * config.largest_possible_house_number) + 1
             while house_number < config.smallest_possible_house_number:
-                house_number += int(random.random() * 500)
+                house_number += int(self.owner.game.knowledge_random.random() * 500)
             house_number = min(house_number, config.largest_possible_house_number)
-            random_street = random.choice(list(self.owner.city.streets))
-            if random.random() > 0.5:
-                unit_number = int(random.random() * config.number_of_apartment_units_in_new_complex_max)
+            random_street = self.owner.game.knowledge_random.choice(list(self.owner.city.streets))
+            if self.owner.game.knowledge_random.random() > 0.5:
+                unit_number = int(self.owner.game.knowledge_random.random() * config.number_of_apartment_units_in_new_complex_max)
                 confabulated_feature_str = "{} {} (Unit #{})".format(house_number, random_street, unit_number)
             else:
                 confabulated_feature_str = "{} {}".format(house_number, random_street)
@@ -746,16 +820,16 @@ class DwellingPlaceModel(MentalModel):
         """Mutate a belief facet pertaining to a person's home block."""
         # Add 100-300 to block number
         block_number_first_digit = int(str(facet_being_mutated)[0])
-        if random.random() < 0.5:
-            change_to_block_number = random.randint(1, 3)
+        if self.owner.game.knowledge_random.random() < 0.5:
+            change_to_block_number = self.owner.game.knowledge_random.randint(1, 3)
         else:
-            change_to_block_number = random.randint(-3, -1)
+            change_to_block_number = self.owner.game.knowledge_random.randint(-3, -1)
         block_number_first_digit += change_to_block_number
         if block_number_first_digit < 1:
             block_number_first_digit = 1
         elif block_number_first_digit > 8:
             block_number_first_digit = 8
-        if random.random() < 0.5:
+        if self.owner.game.knowledge_random.random() < 0.5:
             # Also mutate street to a nearby street
             street_of_current_facet = next(
                 s for s in self.owner.city.streets if s.name == str(facet_being_mutated).split(' of ')[1]
@@ -776,8 +850,8 @@ class DwellingPlaceModel(MentalModel):
         # Change the house number
         digits_of_house_number = list(str(facet_being_mutated)[:3])
         for i in xrange(3):
-            if random.random() < 0.3:
-                if random.random() < 0.5:
+            if self.owner.game.knowledge_random.random() < 0.3:
+                if self.owner.game.knowledge_random.random() < 0.5:
                     change_to_digit = 1
                 else:
                     change_to_digit = -1
@@ -795,7 +869,7 @@ class DwellingPlaceModel(MentalModel):
         while mutated_house_number > config.largest_possible_house_number:
             mutated_house_number -= 100
         mutated_house_number = str(mutated_house_number)
-        if random.random() < 0.1:
+        if self.owner.game.knowledge_random.random() < 0.1:
             # Also mutate street to a nearby street
             street_of_current_facet = next(
                 # Get out just the street name (strip away house number and apartment unit number, if any)
@@ -830,7 +904,7 @@ class DwellingPlaceModel(MentalModel):
                     res for res in other_dwelling_place_mental_models if res.house == self.subject.house
                 )
             else:
-                dwelling_place_belief_will_transfer_from = random.choice(other_dwelling_place_mental_models)
+                dwelling_place_belief_will_transfer_from = self.owner.game.knowledge_random.choice(other_dwelling_place_mental_models)
         else:
             dwelling_place_belief_will_transfer_from = None
         return dwelling_place_belief_will_transfer_from
@@ -842,15 +916,10 @@ class DwellingPlaceModel(MentalModel):
         else:
             return None
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the belief type of an attribute."""
-        attribute_to_belief_type = {
-            "apartment": "home is apartment",
-            "block": "home block",
-            "address": "home address"
-        }
-        return attribute_to_belief_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
     def get_facet_to_this_belief_of_type(self, feature_type):
         """Return the facet to this mental model of the given type."""
@@ -861,19 +930,64 @@ class DwellingPlaceModel(MentalModel):
         elif feature_type == "home address":
             return self.address
 
-    @staticmethod
-    def get_command_to_access_a_belief_facet(feature_type):
-        """Return a command that will allow the belief facet for this feature type to be directly modified."""
-        feature_type_to_command = {
-            "home is apartment": "self.apartment",
-            "home block": "self.block",
-            "home address": "self.address",
-        }
-        return feature_type_to_command[feature_type]
-
 
 class PersonMentalModel(MentalModel):
     """A person's mental model of a person, representing everything she believes about her."""
+    # Maps each feature type of this mental model to accessors for the attribute holding its belief
+    # facet; whereabouts beliefs are accessed separately (see get_belief_facet()), since they're indexed by date
+    belief_facet_accessors = _compile_belief_facet_accessors({
+        # Status
+        "status": "status.status",
+        "marital status": "status.marital_status",
+        "departure year": "status.departure_year",
+        # Age
+        "birth year": "age.birth_year",
+        "death year": "age.death_year",
+        "approximate age": "age.approximate",
+        # Name
+        "first name": "name.first_name",
+        "middle name": "name.middle_name",
+        "last name": "name.last_name",
+        "suffix": "name.suffix",
+        "surname ethnicity": "name.surname_ethnicity",
+        "hyphenated surname": "name.hyphenated_surname",
+        # Occupation
+        "workplace": "occupation.company",
+        "job title": "occupation.job_title",
+        "job shift": "occupation.shift",
+        "job status": "occupation.status",
+        # Home
+        "home": "home",
+        # Appearance
+        "skin color": "face.skin.color",
+        "head size": "face.head.size",
+        "head shape": "face.head.shape",
+        "hair length": "face.hair.length",
+        "hair color": "face.hair.color",
+        "eyebrow size": "face.eyebrows.size",
+        "eyebrow color": "face.eyebrows.color",
+        "mouth size": "face.mouth.size",
+        "ear size": "face.ears.size",
+        "ear angle": "face.ears.angle",
+        "nose size": "face.nose.size",
+        "nose shape": "face.nose.shape",
+        "eye size": "face.eyes.size",
+        "eye shape": "face.eyes.shape",
+        "eye color": "face.eyes.color",
+        "eye horizontal settedness": "face.eyes.horizontal_settedness",
+        "eye vertical settedness": "face.eyes.vertical_settedness",
+        "facial hair style": "face.facial_hair.style",
+        "freckles": "face.distinctive_features.freckles",
+        "birthmark": "face.distinctive_features.birthmark",
+        "scar": "face.distinctive_features.scar",
+        "tattoo": "face.distinctive_features.tattoo",
+        "glasses": "face.distinctive_features.glasses",
+        "sunglasses": "face.distinctive_features.sunglasses",
+    })
+    # Maps each attribute of this mental model to its feature type
+    feature_types_of_attributes = {
+        "home": "home",
+    }
 
     def __init__(self, owner, subject, observation_or_reflection, implant=None):
         """Initialize a PersonMentalModel object.
@@ -981,7 +1095,7 @@ class PersonMentalModel(MentalModel):
                 self.owner.mind.memory /
                 belief_facet_strength
             )
-            if random.random() < chance_of_memory_deterioration:
+            if self.owner.game.knowledge_random.random() < chance_of_memory_deterioration:
                 # Instantiate a new belief facet that represents a deterioration of
                 # the existing one (which itself may be a deterioration already) --
                 # when the facet object's init() method is called, it will call
@@ -1020,7 +1134,7 @@ class PersonMentalModel(MentalModel):
                 distribution = config.facial_feature_distributions_male[feature_type]
             else:
                 distribution = config.facial_feature_distributions_female[feature_type]
-            x = random.random()
+            x = self.owner.game.knowledge_random.random()
             confabulated_feature_str = next(  # See config.py to understand what this is doing
                 feature_type[1] for feature_type in distribution if
                 feature_type[0][0] <= x <= feature_type[0][1]
@@ -1039,7 +1153,7 @@ class PersonMentalModel(MentalModel):
             # I guess just confabulate a random choice? Unfortunately confabulation
             # is currently a fallback, so every feature type has to have a way to be
             # confabulated
-            return random.choice(['alive', 'dead', 'departed'])
+            return self.owner.game.knowledge_random.choice(['alive', 'dead', 'departed'])
         elif feature_type == "marital status":
             # Confabulate a roughly likely status given the subject's age
             subject = self.subject
@@ -1058,8 +1172,8 @@ class PersonMentalModel(MentalModel):
             else:  # You are confabulating that they recently departed when they didn't
                 base_year = self.subject.game.year
             max_offset = self.owner.game.config.age_confabulation_max_offset(subject=self.subject)
-            offset = min(1, int(random.random() * max_offset))
-            if random.random() < 0.5:
+            offset = min(1, int(self.owner.game.knowledge_random.random() * max_offset))
+            if self.owner.game.knowledge_random.random() < 0.5:
                 offset *= -1
             confabulated_year = base_year + offset
             if confabulated_year > self.subject.game.year-1:
@@ -1080,8 +1194,8 @@ class PersonMentalModel(MentalModel):
             else:  # You are confabulating that they recently died when they didn't
                 birth_or_death_year = self.subject.game.year
             max_offset = self.owner.game.config.age_confabulation_max_offset(subject=self.subject)
-            offset = min(1, int(random.random() * max_offset))
-            if random.random() < 0.5:
+            offset = min(1, int(self.owner.game.knowledge_random.random() * max_offset))
+            if self.owner.game.knowledge_random.random() < 0.5:
                 offset *= -1
             confabulated_year = birth_or_death_year + offset
             if confabulated_year > self.subject.game.year-1:
@@ -1089,7 +1203,7 @@ class PersonMentalModel(MentalModel):
             confabulated_feature_str = str(confabulated_year)
         else:  # approximate
             subject_age_decade = self.subject.age / 10  # Don't use float here
-            offset = random.choice([-1, 1])
+            offset = self.owner.game.knowledge_random.choice([-1, 1])
             confabulated_age_decade = subject_age_decade + offset
             confabulated_feature_str = '{}0s'.format(confabulated_age_decade)
         return confabulated_feature_str
@@ -1097,21 +1211,21 @@ class PersonMentalModel(MentalModel):
     def _confabulate_name_facet(self, feature_type):
         """Confabulate a facet to a belief about a person's name."""
         if feature_type == "last name":
-            confabulated_feature_str = Names.any_surname()
+            confabulated_feature_str = self.owner.game.names.any_surname()
         elif feature_type == "first name" or feature_type == "middle name":
             if self.subject.male:
                 # Confabulate a name that is appropriate given the subject's birth year
-                confabulated_feature_str = Names.a_masculine_name(year=self.subject.birth_year)
+                confabulated_feature_str = self.owner.game.names.a_masculine_name(year=self.subject.birth_year)
             else:
-                confabulated_feature_str = Names.a_feminine_name(year=self.subject.birth_year)
+                confabulated_feature_str = self.owner.game.names.a_feminine_name(year=self.subject.birth_year)
         elif feature_type == "suffix":
-            if self.subject.male and random.random() < self.owner.game.config.chance_someone_confabulates_a_suffix:
-                confabulated_feature_str = random.choice(['II', 'III'])
+            if self.subject.male and self.owner.game.knowledge_random.random() < self.owner.game.config.chance_someone_confabulates_a_suffix:
+                confabulated_feature_str = self.owner.game.knowledge_random.choice(['II', 'III'])
             else:
                 confabulated_feature_str = 'None'
         elif feature_type == "surname ethnicity":
             # Randomly choose another ethnicity  -- TODO choose according to distribution in the town
-            confabulated_feature_str = random.choice(['English', 'French', 'German', 'Irish', 'Scandinavian'])
+            confabulated_feature_str = self.owner.game.knowledge_random.choice(['English', 'French', 'German', 'Irish', 'Scandinavian'])
         else:  # hyphenated surname
             # Confabulate according to the distribution in the town
             n_people_in_town_with_hyphenated_surnames = len([
@@ -1120,7 +1234,7 @@ class PersonMentalModel(MentalModel):
             percentage_of_people_in_town_with_hyphenated_surnames = (
                 n_people_in_town_with_hyphenated_surnames/float(self.owner.city.population)
             )
-            if random.random() < percentage_of_people_in_town_with_hyphenated_surnames:
+            if self.owner.game.knowledge_random.random() < percentage_of_people_in_town_with_hyphenated_surnames:
                 confabulated_feature_str = 'yes'
             else:
                 confabulated_feature_str = 'no'
@@ -1129,15 +1243,15 @@ class PersonMentalModel(MentalModel):
     def _confabulate_work_facet(self, feature_type):
         """Confabulate a facet to a belief about a person's work life."""
         if feature_type == "workplace":
-            confabulated_company = random.choice(list(self.subject.city.companies))
+            confabulated_company = self.owner.game.knowledge_random.choice(list(self.subject.city.companies))
             confabulated_feature_str = confabulated_company.name
             confabulated_object_itself = confabulated_company
         elif feature_type == "job shift":
-            confabulated_feature_str = random.choice(["day", "day", "night"])
+            confabulated_feature_str = self.owner.game.knowledge_random.choice(["day", "day", "night"])
             confabulated_object_itself = None
         elif feature_type == "job title":
-            random_company = random.choice(list(self.owner.city.companies))
-            random_job_title = random.choice(list(random_company.employees)).__class__.__name__
+            random_company = self.owner.game.knowledge_random.choice(list(self.owner.city.companies))
+            random_job_title = self.owner.game.knowledge_random.choice(list(random_company.employees)).__class__.__name__
             confabulated_feature_str = random_job_title
             confabulated_object_itself = None
         else:  # job status
@@ -1153,7 +1267,7 @@ class PersonMentalModel(MentalModel):
 
     def _confabulate_home_facet(self, feature_type):
         """Confabulate a facet to a belief about a person's home."""
-        confabulated_home = random.choice(list(self.subject.city.dwelling_places))
+        confabulated_home = self.owner.game.knowledge_random.choice(list(self.subject.city.dwelling_places))
         confabulated_feature_str = confabulated_home.name
         confabulated_object_itself = confabulated_home
         return confabulated_feature_str, confabulated_object_itself
@@ -1185,7 +1299,7 @@ class PersonMentalModel(MentalModel):
                 feature_type=feature_type, facet_being_mutated=facet_being_mutated
             )
         else:  # Appearance facet
-            x = random.random()
+            x = self.owner.game.knowledge_random.random()
             possible_mutations = config.memory_mutations[feature_type][str(facet_being_mutated)]
             mutated_feature_str = next(  # See config.py to understand what this is doing
                 mutation[1] for mutation in possible_mutations if
@@ -1211,8 +1325,8 @@ class PersonMentalModel(MentalModel):
         else:  # You are confabulating that they recently departed when they didn't
             base_year = self.subject.game.year
         max_offset = self.owner.game.config.age_confabulation_max_offset(subject=self.subject)
-        offset = min(1, int(random.random() * max_offset))
-        if random.random() < 0.5:
+        offset = min(1, int(self.owner.game.knowledge_random.random() * max_offset))
+        if self.owner.game.knowledge_random.random() < 0.5:
             offset *= -1
         mutated_year = base_year + offset
         if mutated_year > self.subject.game.year-1:
@@ -1232,8 +1346,8 @@ class PersonMentalModel(MentalModel):
         else:  # You are confabulating that they recently died when they didn't
             birth_or_death_year = self.subject.game.year
         max_offset = self.owner.game.config.age_confabulation_max_offset(subject=self.subject)
-        offset = min(1, int(random.random() * max_offset))
-        if random.random() < 0.5 or self.subject.game:
+        offset = min(1, int(self.owner.game.knowledge_random.random() * max_offset))
+        if self.owner.game.knowledge_random.random() < 0.5 or self.subject.game:
             offset *= -1
         mutated_year = birth_or_death_year + offset
         if mutated_year > self.subject.game.year-1:
@@ -1247,21 +1361,21 @@ class PersonMentalModel(MentalModel):
             # Mutate to a name that sounds like the subject's name (shares the same first
             # letter) and is appropriate given the subject's birth year
             if self.subject.male:
-                mutated_feature_str = Names.a_masculine_name_starting_with(
+                mutated_feature_str = self.owner.game.names.a_masculine_name_starting_with(
                     letter=feature_being_mutated_from_str[0], year=self.subject.birth_year
                 )
             else:
-                mutated_feature_str = Names.a_feminine_name_starting_with(
+                mutated_feature_str = self.owner.game.names.a_feminine_name_starting_with(
                     letter=feature_being_mutated_from_str[0], year=self.subject.birth_year
                 )
         elif feature_type == "last name":
             # Choose a surname of the same ethnicity that starts with the same letter
-            mutated_feature_str = Names.a_surname_sounding_like(source_name=feature_being_mutated_from_str)
+            mutated_feature_str = self.owner.game.names.a_surname_sounding_like(source_name=feature_being_mutated_from_str)
         elif feature_type == "surname ethnicity":
             # Randomly choose another ethnicity
             mutated_feature_str = feature_being_mutated_from_str
             while mutated_feature_str == feature_being_mutated_from_str:
-                mutated_feature_str = random.choice(['English', 'French', 'German', 'Irish', 'Scandinavian'])
+                mutated_feature_str = self.owner.game.knowledge_random.choice(['English', 'French', 'German', 'Irish', 'Scandinavian'])
         else:  # "hyphenated surname"
             # Switch from yes to no, or vice versa
             mutated_feature_str = 'yes' if feature_being_mutated_from_str == 'no' else 'no'
@@ -1292,7 +1406,7 @@ class PersonMentalModel(MentalModel):
                     mutated_feature_str = 'employed'
                     mutated_object_itself = None
             else:  # 'retired'
-                mutated_feature_str = random.choice(['employed', 'unemployed'])
+                mutated_feature_str = self.owner.game.knowledge_random.choice(['employed', 'unemployed'])
                 mutated_object_itself = None
         return mutated_feature_str, mutated_object_itself
 
@@ -1308,7 +1422,7 @@ class PersonMentalModel(MentalModel):
                 b is not facet_being_mutated
             )
         else:
-            mutated_object_itself = random.choice(list(self.owner.city.companies))
+            mutated_object_itself = self.owner.game.knowledge_random.choice(list(self.owner.city.companies))
         mutated_feature_str = mutated_object_itself.name
         return mutated_feature_str, mutated_object_itself
 
@@ -1316,7 +1430,7 @@ class PersonMentalModel(MentalModel):
         """Mutate a belief facet pertaining to a person's home."""
         # TODO make this more realistic, e.g., mutate to a relative's house
         # For now, only thing that makes sense is to just do the same thing as Confabulating a new home
-        random_home = random.choice(list(self.subject.city.dwelling_places))
+        random_home = self.owner.game.knowledge_random.choice(list(self.subject.city.dwelling_places))
         mutated_feature_str = random_home.name
         mutated_object_itself = random_home
         return mutated_feature_str, mutated_object_itself
@@ -1339,7 +1453,7 @@ class PersonMentalModel(MentalModel):
                     person for person in other_people_mental_models if person.male == self.subject.male
                 )
             else:
-                person_belief_will_transfer_from = random.choice(other_people_mental_models)
+                person_belief_will_transfer_from = self.owner.game.knowledge_random.choice(other_people_mental_models)
         else:
             person_belief_will_transfer_from = None
         return person_belief_will_transfer_from
@@ -1539,76 +1653,31 @@ class PersonMentalModel(MentalModel):
             else:
                 return None
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the belief type of an attribute."""
-        attribute_to_belief_type = {
-            "home": "home",
-        }
-        return attribute_to_belief_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
-    @staticmethod
-    def get_command_to_access_a_belief_facet(feature_type):
-        """Return a command that will allow the belief facet for this feature type to be directly modified."""
-        feature_type_to_command = {
-            # Status
-            "status": "self.status.status",
-            "marital status": "self.status.marital_status",
-            "departure year": "self.status.departure_year",
-            # Age
-            "birth year": "self.age.birth_year",
-            "death year": "self.age.death_year",
-            "approximate age": "self.age.approximate",
-            # Name
-            "first name": "self.name.first_name",
-            "middle name": "self.name.middle_name",
-            "last name": "self.name.last_name",
-            "suffix": "self.name.suffix",
-            "surname ethnicity": "self.name.surname_ethnicity",
-            "hyphenated surname": "self.name.hyphenated_surname",
-            # Occupation
-            "workplace": "self.occupation.company",
-            "job title": "self.occupation.job_title",
-            "job shift": "self.occupation.shift",
-            "job status": "self.occupation.status",
-            # Home
-            "home": "self.home",
-            # Appearance
-            "skin color": "self.face.skin.color",
-            "head size": "self.face.head.size",
-            "head shape": "self.face.head.shape",
-            "hair length": "self.face.hair.length",
-            "hair color": "self.face.hair.color",
-            "eyebrow size": "self.face.eyebrows.size",
-            "eyebrow color": "self.face.eyebrows.color",
-            "mouth size": "self.face.mouth.size",
-            "ear size": "self.face.ears.size",
-            "ear angle": "self.face.ears.angle",
-            "nose size": "self.face.nose.size",
-            "nose shape": "self.face.nose.shape",
-            "eye size": "self.face.eyes.size",
-            "eye shape": "self.face.eyes.shape",
-            "eye color": "self.face.eyes.color",
-            "eye horizontal settedness": "self.face.eyes.horizontal_settedness",
-            "eye vertical settedness": "self.face.eyes.vertical_settedness",
-            "facial hair style": "self.face.facial_hair.style",
-            "freckles": "self.face.distinctive_features.freckles",
-            "birthmark": "self.face.distinctive_features.birthmark",
-            "scar": "self.face.distinctive_features.scar",
-            "tattoo": "self.face.distinctive_features.tattoo",
-            "glasses": "self.face.distinctive_features.glasses",
-            "sunglasses": "self.face.distinctive_features.sunglasses",
-        }
-        # Have to do special thing for whereabouts, because they are indexed by date;
-        # specifically, we parse the feature type, which will look something like
-        # 'whereabouts 723099-1'
+    def get_belief_facet(self, feature_type):
+        """Return the belief facet currently held for this feature type; if none, return None."""
+        # Whereabouts beliefs are indexed by timestep, which is parsed from the feature type (see
+        # _parse_whereabouts_feature_type()); if there is no entry for that timestep, there is
+        # no currently held belief for it
         if 'whereabouts' in feature_type:
-            timestep = feature_type[12:]
-            ordinal_date, day_or_night_bit = timestep.split('-')
-            tuple_string = '({}, {})'.format(ordinal_date, day_or_night_bit)
-            return 'self.whereabouts.date[{}]'.format(tuple_string)
+            try:
+                return self.whereabouts.date.get(_parse_whereabouts_feature_type(feature_type=feature_type))
+            except AttributeError:
+                # As in MentalModel.get_belief_facet(), this means that this mental model's
+                # whereabouts belief has not been constructed yet, and so no facet is held
+                return None
+        return super(PersonMentalModel, self).get_belief_facet(feature_type=feature_type)
+
+    def set_belief_facet(self, feature_type, facet):
+        """Set the belief facet currently held for this feature type."""
+        if 'whereabouts' in feature_type:
+            self.whereabouts.date[_parse_whereabouts_feature_type(feature_type=feature_type)] = facet
         else:
-            return feature_type_to_command[feature_type]
+            super(PersonMentalModel, self).set_belief_facet(feature_type=feature_type, facet=facet)
 
     @property
     def basic_description(self):
@@ -1661,7 +1730,7 @@ class PersonMentalModel(MentalModel):
             elif feature_type == 'skin color':
                 self._outline_skin_tone()
             else:
-                facet = eval(self.get_command_to_access_a_belief_facet(feature_type=feature_type))
+                facet = self.get_belief_facet(feature_type=feature_type)
                 if facet == '':
                     facet = '[forgot]'
                 print "{feature_type}: {value} ({confidence})".format(
@@ -1842,7 +1911,7 @@ class Belief(object):
                     self.person_model.owner.mind.memory /
                     belief_facet_strength
                 )
-                if random.random() < chance_of_memory_deterioration:
+                if self.person_model.owner.game.knowledge_random.random() < chance_of_memory_deterioration:
                     # Instantiate a new belief facet that represents a deterioration of
                     # the existing one (which itself may be a deterioration already) --
                     # when the facet object's init() method is called, it will call
@@ -1861,6 +1930,12 @@ class Belief(object):
 class StatusBelief(Belief):
     """A person's mental model of a person's basic status, namely, whether they are in town and alive."""
     attributes = ("status", "departure_year", "marital_status")
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "status": "status",
+        "departure_year": "departure year",
+        "marital_status": "marital status",
+    }
 
     def __init__(self, person_model):
         """Initialize a StatusBelief object."""
@@ -1869,20 +1944,21 @@ class StatusBelief(Belief):
         self.departure_year = None
         self.marital_status = None  # 'single', 'married', 'divorced', 'widowed'
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the belief type of an attribute."""
-        attribute_to_belief_type = {
-            "status": "status",
-            "departure_year": "departure year",
-            "marital_status": "marital status",
-        }
-        return attribute_to_belief_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class AgeBelief(Belief):
     """A person's mental model of a person's age."""
     attributes = ("birth_year", "death_year", "approximate")
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "birth_year": "birth year",
+        "death_year": "death year",
+        "approximate": "approximate age",
+    }
 
     def __init__(self, person_model):
         """Initialize a NameBelief object."""
@@ -1891,15 +1967,10 @@ class AgeBelief(Belief):
         self.death_year = None
         self.approximate = None
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the belief type of an attribute."""
-        attribute_to_belief_type = {
-            "birth_year": "birth year",
-            "death_year": "death year",
-            "approximate": "approximate age",
-        }
-        return attribute_to_belief_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
     @property
     def exact(self):
@@ -1919,6 +1990,15 @@ class NameBelief(Belief):
         "first_name", "middle_name", "last_name", "suffix",
         "surname_ethnicity", "hyphenated_surname"
     )
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "first_name": "first name",
+        "middle_name": "middle name",
+        "last_name": "last name",
+        "suffix": "suffix",
+        "surname_ethnicity": "surname ethnicity",
+        "hyphenated_surname": "hyphenated surname",
+    }
 
     def __init__(self, person_model):
         """Initialize a NameBelief object."""
@@ -1953,23 +2033,22 @@ class NameBelief(Belief):
             first_name=first_name, middle_name=middle_name, last_name=last_name, suffix=suffix
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the belief type of an attribute."""
-        attribute_to_belief_type = {
-            "first_name": "first name",
-            "middle_name": "middle name",
-            "last_name": "last name",
-            "suffix": "suffix",
-            "surname_ethnicity": "surname ethnicity",
-            "hyphenated_surname": "hyphenated surname"
-        }
-        return attribute_to_belief_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class WorkBelief(Belief):
     """A person's mental model of a person's work life."""
     attributes = ("company", "job_title", "shift", "status")
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "company": "workplace",
+        "job_title": "job title",
+        "shift": "job shift",
+        "status": "job status",
+    }
 
     def __init__(self, person_model):
         """Initialize a WorkBelief object."""
@@ -1980,16 +2059,10 @@ class WorkBelief(Belief):
         self.shift = None
         self.status = None  # 'employed', 'unemployed', 'retired'
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the belief type of an attribute."""
-        attribute_to_belief_type = {
-            "company": "workplace",
-            "job_title": "job title",
-            "shift": "job shift",
-            "status": "job status",
-        }
-        return attribute_to_belief_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class WhereaboutsBelief(Belief):
@@ -2008,8 +2081,8 @@ class WhereaboutsBelief(Belief):
         location_str = self.person_model.owner.location.name
         location_obj = self.person_model.owner.location
         day_or_night_id = 0 if self.person_model.owner.game.time_of_day == "day" else 1
-        # Generate a unique key so that we can maintain a trajectory for this belief
-        feature_type = "whereabouts {}-{}".format(self.person_model.owner.game.ordinal_date, day_or_night_id)
+        # Get a unique key so that we can maintain a trajectory for this belief
+        feature_type = self.person_model.owner.game.whereabouts_feature_type()
         self.date[(self.person_model.owner.game.ordinal_date, day_or_night_id)] = Facet(
             value=location_str, owner=self.person_model.owner, subject=self.person_model.subject,
             feature_type=feature_type, initial_evidence=observation_or_reflection,
@@ -2022,8 +2095,8 @@ class WhereaboutsBelief(Belief):
             location_str = self.person_model.owner.location.name
             location_obj = self.person_model.owner.location
             day_or_night_id = 0 if self.person_model.owner.game.time_of_day == "day" else 1
-            # Generate a unique hash so that we can maintain a trajectory for this belief
-            feature_type = "whereabouts {}-{}".format(self.person_model.owner.game.ordinal_date, day_or_night_id)
+            # Get a unique key so that we can maintain a trajectory for this belief
+            feature_type = self.person_model.owner.game.whereabouts_feature_type()
             self.date[(self.person_model.owner.game.ordinal_date, day_or_night_id)] = Facet(
                 value=location_str, owner=self.person_model.owner, subject=self.person_model.subject,
                 feature_type=feature_type, initial_evidence=new_observation_or_reflection,
@@ -2114,7 +2187,7 @@ class FaceBelief(Belief):
                             self.person_model.owner.mind.memory /
                             belief_facet_strength
                         )
-                        if random.random() < chance_of_memory_deterioration:
+                        if self.person_model.owner.game.knowledge_random.random() < chance_of_memory_deterioration:
                             # Instantiate a new belief facet that represents a deterioration of
                             # the existing one (which itself may be a deterioration already)
                             deteriorated_belief_facet = self.person_model.deteriorate_belief_facet(
@@ -2125,6 +2198,10 @@ class FaceBelief(Belief):
 
 class SkinBelief(object):
     """A person's mental model of a person's skin."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "color": "skin color",
+    }
 
     def __init__(self, face_belief):
         """Initialize a Skin object.
@@ -2139,17 +2216,19 @@ class SkinBelief(object):
             feature_type="skin color", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "color": "skin color"
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class HeadBelief(object):
     """A person's mental model of a person's head."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "size": "head size",
+        "shape": "head shape",
+    }
 
     def __init__(self, face_belief):
         """Initialize a Head object.
@@ -2168,18 +2247,19 @@ class HeadBelief(object):
             feature_type="head shape", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "size": "head size",
-            "shape": "head shape"
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class HairBelief(object):
     """A person's mental model of a person's hair (on his or her head)."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "length": "hair length",
+        "color": "hair color",
+    }
 
     def __init__(self, face_belief):
         """Initialize a Hair object.
@@ -2198,18 +2278,19 @@ class HairBelief(object):
             feature_type="hair color", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "length": "hair length",
-            "color": "hair color"
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class EyebrowsBelief(object):
     """A person's mental model of a person's eyebrows."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "size": "eyebrow size",
+        "color": "eyebrow color",
+    }
 
     def __init__(self, face_belief):
         """Initialize a Eyebrows object.
@@ -2228,18 +2309,18 @@ class EyebrowsBelief(object):
             feature_type="eyebrow color", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "size": "eyebrow size",
-            "color": "eyebrow color"
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class MouthBelief(object):
     """A person's mental model of a person's mouth."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "size": "mouth size",
+    }
 
     def __init__(self, face_belief):
         """Initialize a Mouth object.
@@ -2254,17 +2335,19 @@ class MouthBelief(object):
             feature_type="mouth size", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "size": "mouth size",
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class EarsBelief(object):
     """A person's mental model of a person's ears."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "size": "ear size",
+        "angle": "ear angle",
+    }
 
     def __init__(self, face_belief):
         """Initialize an Ears object.
@@ -2283,18 +2366,19 @@ class EarsBelief(object):
             feature_type="ear angle", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "size": "ear size",
-            "angle": "ear angle",
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class NoseBelief(object):
     """A person's mental model of a person's nose."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "size": "nose size",
+        "shape": "nose shape",
+    }
 
     def __init__(self, face_belief):
         """Initialize a Nose object.
@@ -2313,18 +2397,22 @@ class NoseBelief(object):
             feature_type="nose shape", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "size": "nose size",
-            "shape": "nose shape",
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class EyesBelief(object):
     """A person's mental model of a person's eyes."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "size": "eye size",
+        "shape": "eye shape",
+        "horizontal_settedness": "eye horizontal settedness",
+        "vertical_settedness": "eye vertical settedness",
+        "color": "eye color",
+    }
 
     def __init__(self, face_belief):
         """Initialize an Eyes object.
@@ -2355,21 +2443,18 @@ class EyesBelief(object):
             feature_type="eye color", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "size": "eye size",
-            "shape": "eye shape",
-            "horizontal_settedness": "eye horizontal settedness",
-            "vertical_settedness": "eye vertical settedness",
-            "color": "eye color",
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class FacialHairBelief(object):
     """A person's mental model of a person's facial hair."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "style": "facial hair style",
+    }
 
     def __init__(self, face_belief):
         """Initialize a FacialHair style.
@@ -2384,17 +2469,23 @@ class FacialHairBelief(object):
             feature_type="facial hair style", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "style": "facial hair style"
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
 
 
 class DistinctiveFeaturesBelief(object):
     """A person's mental model of a person's distinguishing features."""
+    # Maps each attribute of this belief to its feature type
+    feature_types_of_attributes = {
+        "freckles": "freckles",
+        "birthmark": "birthmark",
+        "scar": "scar",
+        "tattoo": "tattoo",
+        "glasses": "glasses",
+        "sunglasses": "sunglasses",
+    }
 
     def __init__(self, face_belief):
         """Initialize a DistinctiveFeatures object.
@@ -2429,18 +2520,19 @@ class DistinctiveFeaturesBelief(object):
             feature_type="sunglasses", observation_or_reflection=observation_or_reflection
         )
 
-    @staticmethod
-    def attribute_to_feature_type(attribute):
+    @classmethod
+    def attribute_to_feature_type(cls, attribute):
         """Return the feature type associated with the attribute."""
-        attribute_to_feature_type = {
-            "freckles": "freckles",
-            "birthmark": "birthmark",
-            "scar": "scar",
-            "tattoo": "tattoo",
-            "glasses": "glasses",
-            "sunglasses": "sunglasses",
-        }
-        return attribute_to_feature_type[attribute]
+        return cls.feature_types_of_attributes[attribute]
+
+
+def _superseded_facet_has_decayed(facet, threshold):
+    """Return whether the given trajectory entry is a superseded facet whose strength has decayed below the threshold.
+
+    Superseded facets may have negative strength (see Facet.attribute_new_evidence()), which decays
+    toward zero just the same, and so it is the magnitude of strength that is compared.
+    """
+    return type(facet) is Facet and facet.challenger and abs(facet.strength) < threshold
 
 
 class Facet(str):
@@ -2464,8 +2556,18 @@ class Facet(str):
         """
         super(Facet, self).__init__()
         self.owner = owner
-        self.owner.all_belief_facets.add(self)  # Used to make batch calls to decay_strength()
+        # Only facets in this set decay (see strength); because facets are strings, the set holds
+        # at most one facet of a given value, and so a facet whose value is shared by one of its
+        # owner's existing facets does not get added, and does not decay
+        self.decays = self not in self.owner.all_belief_facets
+        if self.decays:
+            self.owner.all_belief_facets.add(self)
         self.subject = subject
+        # Share the game's interned copy of this feature type, which many other facets will also hold;
+        # whereabouts feature types, of which there is a new one every timestep, are instead shared
+        # without being interned (see Game.whereabouts_feature_type())
+        if not feature_type.startswith('whereabouts'):
+            feature_type = owner.game.vocabulary.intern(feature_type)
         self.feature_type = feature_type
         # Only currently held belief facets are attributed a predecessor -- if you are merely
         # challenging some held facet, the latter is not your predecessor; the default value
@@ -2512,15 +2614,15 @@ class Facet(str):
             self.mental_model = None
         # The strength of a belief will increment commensurately to the strength of each
         # new piece of evidence that gets attributed (by attribute_new_evidence) and will
-        # decay as time passes (by decay_strength)
+        # decay as time passes (lazily, upon being read; see strength)
         self.strength = 0.0
         # Finally, attribute the initial evidence to this new belief facet, which may cause a
         # currently held belief to shift to challenger status, and this new belief to the
         # character's actual current belief
         self.attribute_new_evidence(new_evidence=initial_evidence)
 
-    def __new__(cls, value, owner, subject, feature_type, initial_evidence, object_itself):
-        """Do str stuff."""
+    def __new__(cls, value, owner=None, subject=None, feature_type=None, initial_evidence=None, object_itself=None):
+        """Do str stuff (the other arguments may be omitted, as when unpickling)."""
         return str.__new__(cls, value)
 
     @property
@@ -2548,9 +2650,38 @@ class Facet(str):
         else:
             return "not confident"
 
-    def decay_strength(self):
-        """Decay the strength of this belief due to time passing."""
-        self.strength *= self.owner.game.config.decay_rate_of_belief_strength_per_day
+    @property
+    def strength(self):
+        """Return the strength of this belief, having decayed it for the time passed since it was last read or set.
+
+        Rather than every facet decaying every day, a facet records how many days of belief decay
+        its owner had undergone (see Game.decay_beliefs()) when its strength was last brought up
+        to date, and catches up on the days since upon being read. Each day's decay is applied as
+        its own multiplication, as it would be if done daily, so that strengths come out exactly
+        the same as they would have (rate ** days is not bit-identical to this). A read thus costs
+        one multiplication per day since the last one, which over a facet's life never adds up to
+        more than daily decay would have cost, and a single read after a long gap is bounded by
+        the strength underflowing to zero, which takes about 15,000 days at the default rate (see
+        benchmark_belief_decay_catch_up() in benchmark.py for timings).
+        """
+        if self.decays:
+            days_of_decay_elapsed = self.owner.days_of_belief_decay - self.days_of_belief_decay_when_strength_updated
+            if days_of_decay_elapsed:
+                decay_rate = self.owner.game.config.decay_rate_of_belief_strength_per_day
+                strength = self._strength
+                for _ in xrange(days_of_decay_elapsed):
+                    strength *= decay_rate
+                    if not strength:  # Zero stays zero, so there's no more decay to apply
+                        break
+                self._strength = strength
+                self.days_of_belief_decay_when_strength_updated = self.owner.days_of_belief_decay
+        return self._strength
+
+    @strength.setter
+    def strength(self, strength):
+        """Set the strength of this belief as of now."""
+        self._strength = strength
+        self.days_of_belief_decay_when_strength_updated = self.owner.days_of_belief_decay
 
     def attribute_new_evidence(self, new_evidence):
         """Attribute new evidence that supports this belief facet."""
@@ -2600,38 +2731,7 @@ class Facet(str):
     def _get_currently_held_belief(self):
         """Return the belief facet that is currently held for this feature type; if none, return None."""
         mental_model = self.owner.mind.mental_models[self.subject]
-        command_to_access_currently_held_belief = mental_model.get_command_to_access_a_belief_facet(
-            feature_type=self.feature_type
-        )
-        # Have to swap out 'self' in this command, because the return value for
-        # mental_model.get_command_to_access_a_belief_facet() is relative to mental model
-        # being referenceable by 'self'
-        command_to_access_currently_held_belief = (
-            command_to_access_currently_held_belief.replace('self', 'mental_model')
-        )
-        try:
-            currently_held_belief = eval(command_to_access_currently_held_belief)
-        except AttributeError:
-            # This error gets raised when the mental model has not even been fully constructed
-            # yet -- i.e., this is one of the initial belief facets that will make up the initial
-            # mental model, so attribute hierarchies like MentalModel.Face.Hair.Color are not even
-            # constructed yet (and thus cannot be accessed); in this case, we can safely assert that
-            # there is no currently held belief for this attribute
-            currently_held_belief = None
-        except KeyError:
-            # This error gets raised when an attempt is made (by evaluating command_to_access_
-            # currently_held_belief) to access a non-existent whereabouts belief; i.e., the
-            # command will specify accessing a WhereaboutsBelief.date dictionary with a key for
-            # the timestep in question, but if this person did not already hold some belief about
-            # subject's whereabouts on that timestep, then a KeyError will be raised, since there
-            # will be no entry in the dictionary associated with that key;  in this case, we can
-            # safely assert that there is no currently held belief for this attribute
-            assert 'whereabouts' in self.feature_type, (
-                "A KeyError was raised outside of the context of an attempt to access a "
-                "non-existent whereabouts belief."
-            )
-            currently_held_belief = None
-        return currently_held_belief
+        return mental_model.get_belief_facet(feature_type=self.feature_type)
 
     def why(self):
         """Pretty-print why this character holds this particular belief."""
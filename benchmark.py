@@ -0,0 +1,877 @@
+import argparse
+import datetime
+import gc
+import json
+import math
+import platform
+import resource
+import sys
+import time
+from game import Game
+from city import City
+from business import Business
+from person import Person
+from belief import Facet, MentalModel
+from evidence import EvidenceLog
+
+
+def peak_rss_kb():
+    """Return the peak resident set size of this process, in kilobytes."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':  # macOS reports bytes rather than kilobytes
+        peak_rss /= 1024
+    return peak_rss
+
+
+def a_game_after_lo_fi_years(seed, n_years):
+    """Return a game whose city has been founded with the given seed and then simulated at lo-fi for the given years.
+
+    @param seed: The seed for the game's random number generator.
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    """
+    game = Game(seed=seed)
+    game.found_city()
+    game.enact_lo_fi_simulation(n_timesteps=n_years*730)
+    return game
+
+
+def benchmark_city_generation(quadtree_sizes=(16, 32, 64), seed=0):
+    """Time the generation of a city at each of the given quadtree sizes.
+
+    @param quadtree_sizes: The values of config.quadtree_size to generate cities at.
+    @param seed: The seed for the game's random number generator prior to each city generation.
+    """
+    game = Game(seed=seed)
+    results = []
+    for quadtree_size in quadtree_sizes:
+        game.config.quadtree_size = quadtree_size
+        game.random.seed(seed)
+        rss_before = peak_rss_kb()
+        start_time = time.time()
+        city = City(game)
+        build_time = time.time() - start_time
+        results.append({
+            "quadtree size": quadtree_size,
+            "parcels": len(city.parcels),
+            "lots": len(city.lots) + len(city.tracts),
+            "build time (s)": build_time,
+            "distance matrix (kb)": city.paths.itemsize * len(city.paths) / 1024.0,
+            "peak rss growth (kb)": peak_rss_kb() - rss_before,
+        })
+    return results
+
+
+def benchmark_distance_between(n_calls=200000, seed=0):
+    """Compare the speed of City.distance_between with and without the precomputed lot distance table.
+
+    @param n_calls: The number of calls to time in each configuration.
+    @param seed: The seed for the game's random number generator.
+    """
+    game = Game(seed=seed)
+    city = City(game)
+    all_lots = list(city.lots | city.tracts)
+    lot_pairs = [(game.random.choice(all_lots), game.random.choice(all_lots)) for _ in xrange(n_calls)]
+    lot_distances = city.lot_distances
+    calls_per_second = {}
+    for configuration in ("parcel distances", "lot distance table"):
+        # Emptying the table makes City.distance_between fall back to the parcel distances,
+        # as it does when config.precompute_lot_distances is False
+        city.lot_distances = lot_distances if configuration == "lot distance table" else lot_distances[:0]
+        start_time = time.time()
+        for lot1, lot2 in lot_pairs:
+            city.distance_between(lot1, lot2)
+        calls_per_second[configuration] = n_calls / (time.time() - start_time)
+    city.lot_distances = lot_distances
+    return calls_per_second
+
+
+def assemble_job_candidates_by_full_scan(company, occupation_of_need):
+    """Assemble job candidates the way Business._assemble_job_candidates did before the city kept a
+    job-candidate index, i.e., by checking every employee of every company and every unemployed person.
+    """
+    candidates = set()
+    for other_company in company.city.companies:
+        for position in other_company.employees:
+            if company.check_if_person_is_qualified_for_the_position(
+                candidate=position.person, occupation_of_need=occupation_of_need
+            ):
+                candidates.add(position.person)
+    for person in company.city.unemployed:
+        if company.check_if_person_is_qualified_for_the_position(
+            candidate=person, occupation_of_need=occupation_of_need
+        ):
+            candidates.add(person)
+    return candidates
+
+
+def benchmark_hiring(n_years=50, seed=0):
+    """Time job-candidate assembly over a lo-fi simulation, with and without the city's job-candidate index.
+
+    Every time a company assembles job candidates during the simulation, candidates are
+    assembled both ways from the same state of the world, so that the two timings are
+    directly comparable.
+
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    @param seed: The seed for the game's random number generator.
+    """
+    timings = {"full scan (s)": 0.0, "job-candidate index (s)": 0.0, "hirings": 0}
+    assemble_job_candidates_by_index = Business._assemble_job_candidates
+
+    def assemble_job_candidates_both_ways(company, occupation_of_need):
+        start_time = time.time()
+        assemble_job_candidates_by_full_scan(company=company, occupation_of_need=occupation_of_need)
+        timings["full scan (s)"] += time.time() - start_time
+        start_time = time.time()
+        candidates = assemble_job_candidates_by_index(company, occupation_of_need=occupation_of_need)
+        timings["job-candidate index (s)"] += time.time() - start_time
+        timings["hirings"] += 1
+        return candidates
+
+    Business._assemble_job_candidates = assemble_job_candidates_both_ways
+    try:
+        game = a_game_after_lo_fi_years(seed=seed, n_years=n_years)
+    finally:
+        Business._assemble_job_candidates = assemble_job_candidates_by_index
+    return timings
+
+
+def rate_potential_lot_by_lot(person, lot):
+    """Rate the desirability of living at a lot the way Person.rate_potential_lot did before
+    lots were rated all at once as a desirability field, i.e., with a call to
+    City.distance_between for every relative and friend of the person.
+    """
+    config = person.game.config
+    desire_to_live_near_family = person._determine_desire_to_move_near_family()
+    relatives_in_town = {f for f in person.extended_family if f.present and f.home is not person.home}
+    score = 0
+    for relative in relatives_in_town:
+        relation_to_me = person._common_familial_relation_to_me(person=relative)
+        pull_toward_someone_of_that_relation = config.pull_to_live_near_family.get(relation_to_me, 0.0)
+        dist = person.city.distance_between(relative.home.lot, lot) + 1.0
+        score += (desire_to_live_near_family * pull_toward_someone_of_that_relation) / dist
+    for friend in person.friends:
+        dist = person.city.distance_between(friend.home.lot, lot) + 1.0
+        score += config.pull_to_live_near_a_friend / dist
+    if person.occupation:
+        dist = person.city.distance_between(person.occupation.company.lot, lot) + 1.0
+        score += config.pull_to_live_near_workplace / dist
+    return score
+
+
+def benchmark_housing_choice(n_years=70, seed=0):
+    """Time the rating of every lot in town by every adult resident, lot by lot and as a desirability field.
+
+    Also count the lots whose two ratings differ, which should be zero, since both ways
+    sum the same terms in the same order.
+
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    @param seed: The seed for the game's random number generator.
+    """
+    game = a_game_after_lo_fi_years(seed=seed, n_years=n_years)
+    all_lots = list(game.city.lots)
+    raters = [person for person in game.city.residents if person.adult]
+    start_time = time.time()
+    scores_lot_by_lot = [[rate_potential_lot_by_lot(person, lot) for lot in all_lots] for person in raters]
+    time_lot_by_lot = time.time() - start_time
+    start_time = time.time()
+    scores_as_field = [person.rate_potential_lots(lots=all_lots) for person in raters]
+    time_as_field = time.time() - start_time
+    mismatches = sum(
+        score_lot_by_lot != score_as_field for person_scores_lot_by_lot, person_scores_as_field in
+        zip(scores_lot_by_lot, scores_as_field) for score_lot_by_lot, score_as_field in
+        zip(person_scores_lot_by_lot, person_scores_as_field)
+    )
+    return {
+        "raters": len(raters),
+        "lots": len(all_lots),
+        "lot by lot (s)": time_lot_by_lot,
+        "desirability field (s)": time_as_field,
+        "mismatches": mismatches,
+    }
+
+
+def rate_all_vacant_homes_and_vacant_lots_lot_by_lot(person):
+    """Rate all vacant homes and vacant lots the way Person._rate_all_vacant_homes_and_vacant_lots() did
+    before lots were rated all at once as a desirability field.
+    """
+    penalty_for_building = person.game.config.penalty_for_having_to_build_a_home_vs_buying_one
+    scores = {}
+    for home in person.city.vacant_homes:
+        spouse_score = rate_potential_lot_by_lot(person.spouse, home.lot) if person.spouse else 0
+        scores[home] = rate_potential_lot_by_lot(person, home.lot) + spouse_score
+    for lot in person.city.vacant_lots:
+        spouse_score = rate_potential_lot_by_lot(person.spouse, lot) if person.spouse else 0
+        scores[lot] = (rate_potential_lot_by_lot(person, lot) + spouse_score) * penalty_for_building
+    return scores
+
+
+def check_housing_choice(n_years=70, seed=0):
+    """Check that every choice of a home or lot in a simulated town is what it would be if lots were rated lot by lot.
+
+    Whenever someone chooses a vacant home or lot during the simulation, they also choose from
+    lot-by-lot ratings, starting from the same state of the game's random number generator; any
+    mismatched score or choice fails an assertion. Returns the number of choices checked.
+
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    @param seed: The seed for the game's random number generator.
+    """
+    choose_vacant_home_or_vacant_lot = Person._choose_vacant_home_or_vacant_lot
+    rate_all_vacant_homes_and_vacant_lots = Person._rate_all_vacant_homes_and_vacant_lots
+    choices_checked = [0]
+
+    def choose_vacant_home_or_vacant_lot_both_ways(person):
+        random_state = person.game.random.getstate()
+        Person._rate_all_vacant_homes_and_vacant_lots = rate_all_vacant_homes_and_vacant_lots_lot_by_lot
+        try:
+            choice_lot_by_lot = choose_vacant_home_or_vacant_lot(person)
+        finally:
+            Person._rate_all_vacant_homes_and_vacant_lots = rate_all_vacant_homes_and_vacant_lots
+        person.game.random.setstate(random_state)
+        scores = rate_all_vacant_homes_and_vacant_lots(person)
+        assert scores == rate_all_vacant_homes_and_vacant_lots_lot_by_lot(person), (
+            "{} rated the vacant homes and lots differently as a desirability field".format(person.name)
+        )
+        choice = choose_vacant_home_or_vacant_lot(person)
+        assert choice is choice_lot_by_lot, (
+            "{} chose {} rather than {} by rating lots as a desirability field".format(
+                person.name, choice, choice_lot_by_lot
+            )
+        )
+        choices_checked[0] += 1
+        return choice
+
+    Person._choose_vacant_home_or_vacant_lot = choose_vacant_home_or_vacant_lot_both_ways
+    try:
+        game = a_game_after_lo_fi_years(seed=seed, n_years=n_years)
+    finally:
+        Person._choose_vacant_home_or_vacant_lot = choose_vacant_home_or_vacant_lot
+    return choices_checked[0]
+
+
+def check_same_seed_games_are_identical(n_years=15, seed=0):
+    """Check that two games simulated with the same seed in the same process produce the same town.
+
+    The IDs of people, places, streets, parcels, and lots (which determine how sets of them iterate)
+    are assigned per game, so nothing a process has simulated beforehand should change which town a
+    seed produces; any difference between the two games' events, residents, or vacant lots fails an
+    assertion. Returns the number of events that matched.
+
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    @param seed: The seed for both games' random number generators.
+    """
+    def describe_town(game):
+        return {
+            "events": [(event.event_number, event.__class__.__name__, event.date) for event in game.events],
+            "residents": sorted((person.id, person.name, person.home.address) for person in game.city.residents),
+            "vacant lots": sorted(lot.address for lot in game.city.vacant_lots),
+        }
+    town = describe_town(a_game_after_lo_fi_years(seed=seed, n_years=n_years))
+    other_town = describe_town(a_game_after_lo_fi_years(seed=seed, n_years=n_years))
+    for aspect in town:
+        assert town[aspect] == other_town[aspect], (
+            "Two games simulated with seed {} differ in their {}".format(seed, aspect)
+        )
+    return len(town["events"])
+
+
+def check_lazy_belief_decay(n_years=30, n_hi_fi_days=15, seed=0):
+    """Check that belief facets decaying lazily have exactly the strengths they would have decaying daily.
+
+    Alongside the simulation, a shadow copy of every facet's strength is decayed eagerly, the
+    way Game.decay_beliefs() used to decay every facet every day; every read of a facet's strength,
+    and the final strength of every facet, must equal its shadow strength, or else an assertion
+    fails. Returns counts of what was checked, along with the longest gap (in days of decay) that
+    a read caught up on and how many multiplications catching up took versus decaying daily.
+
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    @param n_hi_fi_days: The number of days of hi-fi simulation to enact after knowledge implantation.
+    @param seed: The seed for the game's random number generator.
+    """
+    strength = Facet.strength
+    decay_beliefs = Game.decay_beliefs
+    # Maps the ID of each facet to the facet (which keeps its ID from being reused) and its shadow strength
+    shadow_strengths = {}
+    counts = {"reads": 0, "longest gap (days)": 0, "catch-up multiplications": 0, "daily multiplications": 0}
+
+    def get_strength_and_check_it(facet):
+        if facet.decays:
+            gap = facet.owner.days_of_belief_decay - facet.days_of_belief_decay_when_strength_updated
+            counts["longest gap (days)"] = max(counts["longest gap (days)"], gap)
+            counts["catch-up multiplications"] += gap
+        value = strength.fget(facet)
+        assert value == shadow_strengths[id(facet)][1], (
+            "{}'s belief facet '{}' for {}'s {} has strength {!r} rather than {!r}".format(
+                facet.owner.name, facet, facet.subject.name, facet.feature_type, value, shadow_strengths[id(facet)][1]
+            )
+        )
+        counts["reads"] += 1
+        return value
+
+    def set_strength_and_shadow_strength(facet, value):
+        strength.fset(facet, value)
+        shadow_strengths[id(facet)] = [facet, value]
+
+    def decay_beliefs_and_shadow_strengths(game):
+        decay_beliefs(game)
+        decay_rate = game.config.decay_rate_of_belief_strength_per_day
+        for person in game.city.residents:
+            for facet in person.all_belief_facets:
+                shadow_strengths[id(facet)][1] *= decay_rate
+                counts["daily multiplications"] += 1
+
+    Facet.strength = property(get_strength_and_check_it, set_strength_and_shadow_strength)
+    Game.decay_beliefs = decay_beliefs_and_shadow_strengths
+    try:
+        game = a_game_after_lo_fi_years(seed=seed, n_years=n_years)
+        implant_knowledge_in_everyone(game)
+        for _ in xrange(n_hi_fi_days):
+            enact_a_day_of_hi_fi_simulation(game)
+        for facet, _ in shadow_strengths.itervalues():
+            get_strength_and_check_it(facet)
+    finally:
+        Facet.strength = strength
+        Game.decay_beliefs = decay_beliefs
+    counts["facets"] = len(shadow_strengths)
+    return counts
+
+
+def check_pruning_of_superseded_belief_facets(threshold=1.0, n_years=20, n_hi_fi_days=20, seed=0):
+    """Check that pruning superseded belief facets detaches exactly those facets, and never a held one.
+
+    Whenever a mental model is pruned during the simulation, no facet that it held may have been
+    pruned, each trajectory entry and predecessor that was a pruned facet must now be a plain
+    string of its value, and no pruned facet may remain (by identity) among the challengers of a
+    held facet, among the beliefs evidenced by its own evidence, or in its owner's set of all
+    belief facets; otherwise, an assertion fails. The evidence log retains only referenced
+    evidence, so that evidence behind pruned facets alone may be let go. Returns counts of the
+    mental models gone over and the facets pruned.
+
+    @param threshold: The value of config.strength_below_which_superseded_belief_facets_get_pruned;
+                      the default is high, so that facets get pruned within a few simulated days.
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    @param n_hi_fi_days: The number of days of hi-fi simulation to enact after knowledge implantation.
+    @param seed: The seed for the game's random number generator.
+    """
+    prune_mental_model = MentalModel.prune_superseded_belief_facets
+    prune_person = Person.prune_superseded_belief_facets
+    counts = {"mental models": 0, "pruned facets": 0}
+    # The facets pruned from the mental models of the person currently being pruned
+    facets_pruned_from_person = []
+
+    def prune_mental_model_and_check_it(mental_model, threshold):
+        held_facets = {
+            feature_type: mental_model.get_belief_facet(feature_type=feature_type)
+            for feature_type in mental_model.belief_trajectories
+        }
+        trajectories = {
+            feature_type: list(trajectory) for feature_type, trajectory in mental_model.belief_trajectories.iteritems()
+        }
+        pruned_facets = prune_mental_model(mental_model, threshold=threshold)
+        ids_of_pruned_facets = {id(facet) for facet in pruned_facets}
+        for feature_type, held_facet in held_facets.iteritems():
+            assert id(held_facet) not in ids_of_pruned_facets, (
+                "{}'s held belief facet '{}' for {}'s {} got pruned".format(
+                    mental_model.owner.name, held_facet, mental_model.subject.name, feature_type
+                )
+            )
+            assert mental_model.get_belief_facet(feature_type=feature_type) is held_facet
+            if held_facet is not None:
+                assert not any(id(challenger) in ids_of_pruned_facets for challenger in held_facet.challengers), (
+                    "A pruned facet is still a challenger to {}'s belief facet '{}'".format(
+                        mental_model.owner.name, held_facet
+                    )
+                )
+        for feature_type, trajectory in mental_model.belief_trajectories.iteritems():
+            for entry_before, entry in zip(trajectories[feature_type], trajectory):
+                if id(entry_before) in ids_of_pruned_facets:
+                    assert type(entry) is str and entry == entry_before, (
+                        "The pruned facet '{}' remains in {}'s belief trajectory for {}'s {}".format(
+                            entry_before, mental_model.owner.name, mental_model.subject.name, feature_type
+                        )
+                    )
+                elif type(entry) is Facet:
+                    assert entry is entry_before
+                    assert id(entry.predecessor) not in ids_of_pruned_facets, (
+                        "The pruned facet '{}' remains the predecessor of '{}'".format(entry.predecessor, entry)
+                    )
+        for facet in pruned_facets:
+            for piece_of_evidence in facet.evidence:
+                assert not any(belief_evidenced is facet for belief_evidenced in piece_of_evidence.beliefs_evidenced), (
+                    "The pruned facet '{}' is still among the beliefs evidenced by its {}".format(
+                        facet, piece_of_evidence.__class__.__name__
+                    )
+                )
+        facets_pruned_from_person.extend(pruned_facets)
+        counts["mental models"] += 1
+        counts["pruned facets"] += len(pruned_facets)
+        return pruned_facets
+
+    def prune_person_and_check_them(person, threshold):
+        del facets_pruned_from_person[:]
+        n_pruned_facets = prune_person(person, threshold=threshold)
+        assert n_pruned_facets == len(facets_pruned_from_person)
+        ids_of_all_belief_facets = {id(facet) for facet in person.all_belief_facets}
+        for facet in facets_pruned_from_person:
+            assert id(facet) not in ids_of_all_belief_facets, (
+                "The pruned facet '{}' is still among {}'s belief facets".format(facet, person.name)
+            )
+        return n_pruned_facets
+
+    MentalModel.prune_superseded_belief_facets = prune_mental_model_and_check_it
+    Person.prune_superseded_belief_facets = prune_person_and_check_them
+    try:
+        game = a_game_after_lo_fi_years(seed=seed, n_years=n_years)
+        game.config.strength_below_which_superseded_belief_facets_get_pruned = threshold
+        # Knowledge has yet to be implanted, so the log can still be swapped for one with another retention policy
+        game.evidence_log = EvidenceLog(retention='referenced')
+        implant_knowledge_in_everyone(game)
+        for _ in xrange(n_hi_fi_days):
+            enact_a_day_of_hi_fi_simulation(game)
+    finally:
+        MentalModel.prune_superseded_belief_facets = prune_mental_model
+        Person.prune_superseded_belief_facets = prune_person
+    return counts
+
+
+def describe_knowledge(game):
+    """Return everyone's mental models, in the order they iterate, with the belief facets each holds and their strengths."""
+    knowledge = []
+    for person in sorted(game.city.residents | game.city.departed | game.city.deceased, key=lambda p: p.id):
+        for subject, mental_model in person.mind.mental_models.iteritems():
+            held_facets = []
+            for feature_type in sorted(mental_model.belief_trajectories):
+                facet = mental_model.get_belief_facet(feature_type=feature_type)
+                if facet is not None:
+                    held_facets.append((feature_type, str(facet), facet.strength))
+            knowledge.append((person.id, subject.type, subject.id, held_facets))
+    return knowledge
+
+
+def check_knowledge_archive_round_trip(n_years=20, n_hi_fi_days_before=2, n_hi_fi_days_after=2, seed=5):
+    """Check that archiving everyone's knowledge partway through a simulation leaves its outcome unchanged.
+
+    The same world is simulated twice, once with its knowledge archived (see archive.py) after
+    some days of hi-fi simulation and once without; the events of the days that follow (and the
+    number of events and pieces of evidence, which share a count), and everyone's knowledge at the
+    end (including the order of their mental models), must be the same either way, or else an
+    assertion fails. Returns the numbers of event numbers and mental models that matched.
+
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    @param n_hi_fi_days_before: The number of days of hi-fi simulation to enact before archiving knowledge.
+    @param n_hi_fi_days_after: The number of days of hi-fi simulation to enact after archiving knowledge.
+    @param seed: The seed for the game's random number generator.
+    """
+    outcomes = []
+    for archiving in (False, True):
+        game = a_game_after_lo_fi_years(seed=seed, n_years=n_years)
+        implant_knowledge_in_everyone(game)
+        for _ in xrange(n_hi_fi_days_before):
+            enact_a_day_of_hi_fi_simulation(game)
+        n_events_before_archiving = len(game.events)
+        if archiving:
+            game.archive_knowledge()
+        for _ in xrange(n_hi_fi_days_after):
+            enact_a_day_of_hi_fi_simulation(game)
+        events = [
+            (event.event_number, event.__class__.__name__, event.date) for event in game.events[n_events_before_archiving:]
+        ]
+        outcomes.append((game.event_number, events, describe_knowledge(game)))
+    (event_number, events, knowledge), (event_number_with_archiving, events_with_archiving, knowledge_with_archiving) = (
+        outcomes
+    )
+    assert event_number == event_number_with_archiving and events == events_with_archiving, (
+        "Archiving knowledge changed the events that followed, ending at event number {} rather than {}".format(
+            event_number_with_archiving, event_number
+        )
+    )
+    assert knowledge == knowledge_with_archiving, "Archiving knowledge changed what people know"
+    return {"event numbers": event_number, "mental models": len(knowledge)}
+
+
+def benchmark_belief_decay_catch_up(gaps=(1, 10, 100, 1000, 10000), n_reads=1000, seed=0):
+    """Time reading the strength of a belief facet that has gone unread for each of the given numbers of days.
+
+    Facets decay lazily, catching up on the days of decay since they were last read (see
+    Facet.strength), and so this is the cost of a read after a gap of that length.
+
+    @param gaps: The numbers of days of belief decay since the facet's strength was last read.
+    @param n_reads: The number of reads to time at each gap.
+    @param seed: The seed for the game's random number generator.
+    """
+    game = a_game_after_lo_fi_years(seed=seed, n_years=10)
+    person = next(person for person in game.city.residents if person.age > 3)
+    person.implant_knowledge()
+    facet = next(facet for facet in person.all_belief_facets if facet.strength)
+    initial_strength = facet.strength
+    seconds_per_read = {}
+    for gap in gaps:
+        elapsed_time = 0.0
+        for _ in xrange(n_reads):
+            facet.strength = initial_strength
+            person.days_of_belief_decay += gap
+            start_time = time.time()
+            facet.strength
+            elapsed_time += time.time() - start_time
+        seconds_per_read[gap] = elapsed_time / n_reads
+    return seconds_per_read
+
+
+class DictBackedEvidence(object):
+    """A piece of evidence laid out the way evidence was before its classes declared slots, i.e., with a
+    dictionary of attributes, including a type string of its own.
+    """
+
+    def __init__(self, piece_of_evidence):
+        """Initialize a DictBackedEvidence object that mirrors the given piece of evidence."""
+        self.type = piece_of_evidence.__class__.__name__.lower()
+        for cls in piece_of_evidence.__class__.__mro__:
+            for attribute in getattr(cls, '__slots__', ()):
+                if hasattr(piece_of_evidence, attribute):
+                    setattr(self, attribute, getattr(piece_of_evidence, attribute))
+
+
+def benchmark_evidence_memory(n_years=30, n_hi_fi_days=1, seed=0):
+    """Measure the bytes taken up by each piece of evidence in a simulated world, as laid out with slots and before.
+
+    Only the evidence objects themselves (and, before, their attribute dictionaries and type
+    strings) are counted, not the people, places, dates, and sets of facets that they reference.
+
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    @param n_hi_fi_days: The number of days of hi-fi simulation to enact after knowledge implantation.
+    @param seed: The seed for the game's random number generator.
+    """
+    game = a_game_after_lo_fi_years(seed=seed, n_years=n_years)
+    implant_knowledge_in_everyone(game)
+    for _ in xrange(n_hi_fi_days):
+        enact_a_day_of_hi_fi_simulation(game)
+    evidence = list(game.evidence_log)
+    bytes_with_slots = sum(sys.getsizeof(piece_of_evidence) for piece_of_evidence in evidence)
+    bytes_before = 0
+    for piece_of_evidence in evidence:
+        dict_backed_piece_of_evidence = DictBackedEvidence(piece_of_evidence)
+        bytes_before += (
+            sys.getsizeof(dict_backed_piece_of_evidence) + sys.getsizeof(dict_backed_piece_of_evidence.__dict__) +
+            sys.getsizeof(dict_backed_piece_of_evidence.type)
+        )
+    return {
+        "pieces of evidence": len(evidence),
+        "bytes per object (before)": bytes_before / float(len(evidence)),
+        "bytes per object (slots)": bytes_with_slots / float(len(evidence)),
+    }
+
+
+def count_world_objects(game):
+    """Return counts of the kinds of objects that accumulate over the course of world generation."""
+    city = game.city
+    residents = city.residents
+    return {
+        "residents": len(residents),
+        "departed": len(city.departed),
+        "deceased": len(city.deceased),
+        "companies": len(city.companies),
+        "former companies": len(city.former_companies),
+        "dwelling places": len(city.dwelling_places),
+        "events": len(game.events),
+        "logged evidence": len(game.evidence_log),
+        "relationships": sum(len(person.relationships) for person in residents),
+        "mental models": sum(len(person.mind.mental_models) for person in residents),
+        "belief facets": sum(len(person.all_belief_facets) for person in residents),
+        "gc-tracked objects": len(gc.get_objects()),
+    }
+
+
+def measure_phase(game, phase, enact, *args):
+    """Enact a phase of world generation and return a record of its wall time, peak RSS, and object counts.
+
+    @param game: The Game object that is generating a world.
+    @param phase: A string naming the phase.
+    @param enact: The function or Game method that enacts this phase.
+    @param args: Arguments to call that function with.
+    """
+    rss_before = peak_rss_kb()
+    start_time = time.time()
+    enact(*args)
+    wall_time = time.time() - start_time
+    record = {
+        "phase": phase,
+        "date": str(game.date),
+        "wall time (s)": wall_time,
+        "peak rss (kb)": peak_rss_kb(),
+        "peak rss growth (kb)": peak_rss_kb() - rss_before,
+    }
+    record.update(count_world_objects(game))
+    return record
+
+
+def implant_knowledge_in_everyone(game):
+    """Implant knowledge into everyone over the age of three, as Game.establish_setting does."""
+    for person in game.city.residents:
+        if person.age > 3:
+            person.implant_knowledge()
+
+
+def enact_a_day_of_hi_fi_simulation(game):
+    """Enact the day and night timesteps of a day of hi-fi simulation."""
+    game.enact_hi_fi_simulation()
+    game.enact_hi_fi_simulation()
+
+
+def benchmark_worldgen(seed=0, quadtree_size=16, n_lo_fi_years=None, n_hi_fi_days=7, profile=False):
+    """Generate a world the way Game.establish_setting does, measuring each of its phases.
+
+    The phases are city-plan generation, the settling of the city, the lo-fi simulation
+    (measured per simulated decade), knowledge implantation, and the hi-fi simulation.
+
+    @param seed: The seed for the game's random number generator.
+    @param quadtree_size: The value of config.quadtree_size to generate the city plan at.
+    @param n_lo_fi_years: The number of years of lo-fi simulation to enact, or None to simulate
+                          (as Game.establish_setting does) until a week before gameplay begins.
+    @param n_hi_fi_days: The number of days of hi-fi simulation to enact after knowledge implantation.
+    @param profile: Whether to also report the game profiler's counters for each phase of the simulation.
+    """
+    game = Game(seed=seed)
+    game.config.quadtree_size = quadtree_size
+    if profile:
+        game.profiler.enable()
+    phases = [
+        measure_phase(game, "city plan", game.generate_city_plan),
+        measure_phase(game, "settling", game.settle_city),
+    ]
+    # Enact the lo-fi simulation a decade at a time (or less, for the first and last
+    # decades), which is equivalent to enacting it all at once
+    lo_fi_begins = game.ordinal_date
+    if n_lo_fi_years is None:
+        lo_fi_ends = game.ordinal_date_that_gameplay_begins - 7
+    else:
+        lo_fi_ends = lo_fi_begins + int(n_lo_fi_years * 365.25)
+    while game.ordinal_date < lo_fi_ends:
+        decade = game.year - game.year % 10
+        start_of_next_decade = datetime.date(decade+10, 1, 1).toordinal()
+        n_days = min(start_of_next_decade, lo_fi_ends) - game.ordinal_date
+        phases.append(
+            measure_phase(
+                game, "lo-fi simulation ({}s)".format(decade), game.enact_lo_fi_simulation, n_days*2
+            )
+        )
+    phases.append(measure_phase(game, "knowledge implantation", implant_knowledge_in_everyone, game))
+    for day in xrange(n_hi_fi_days):
+        phases.append(
+            measure_phase(game, "hi-fi simulation (day {})".format(day+1), enact_a_day_of_hi_fi_simulation, game)
+        )
+    report = {
+        "seed": seed,
+        "quadtree size": quadtree_size,
+        "total wall time (s)": sum(record["wall time (s)"] for record in phases),
+        "phases": phases,
+    }
+    if profile:
+        report["profile"] = game.profiler.report()
+        game.profiler.disable()
+    return report
+
+
+def benchmark_worldgen_suite(seeds=(0, 1, 2), quadtree_sizes=(16,), n_lo_fi_years=None, n_hi_fi_days=7,
+                             profile=False):
+    """Generate a world at each combination of the given seeds and sizes, and return a report on all of them.
+
+    Because peak RSS is that of the whole process, worlds generated later in the suite
+    will report a peak RSS at least as high as those generated earlier; compare peak RSS
+    growth instead, or generate one world per process.
+    """
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "date run": str(datetime.datetime.now()),
+        "worlds": [
+            benchmark_worldgen(
+                seed=seed, quadtree_size=quadtree_size, n_lo_fi_years=n_lo_fi_years, n_hi_fi_days=n_hi_fi_days,
+                profile=profile
+            )
+            for quadtree_size in quadtree_sizes for seed in seeds
+        ],
+    }
+
+
+def compare_worldgen_reports(report_before, report_after):
+    """Return the wall time of each phase in two worldgen reports, summed across their common worlds.
+
+    The result maps each phase to a (time before, time after) tuple; lo-fi decades and
+    hi-fi days are each summed into a single phase.
+    """
+    def phase_times(report, worlds):
+        times = {}
+        for world in report["worlds"]:
+            if (world["seed"], world["quadtree size"]) in worlds:
+                for record in world["phases"]:
+                    phase = record["phase"].split(" (")[0]
+                    times[phase] = times.get(phase, 0.0) + record["wall time (s)"]
+        return times
+    worlds_before = {(world["seed"], world["quadtree size"]) for world in report_before["worlds"]}
+    worlds_after = {(world["seed"], world["quadtree size"]) for world in report_after["worlds"]}
+    common_worlds = worlds_before & worlds_after
+    times_before = phase_times(report_before, common_worlds)
+    times_after = phase_times(report_after, common_worlds)
+    return {phase: (times_before[phase], times_after.get(phase, 0.0)) for phase in times_before}
+
+
+def summarize_town(game):
+    """Return the statistics of a town that compare_lo_fi_schedulers() compares across schedulers."""
+    city = game.city
+    return {
+        "population": city.population,
+        "companies": len(city.companies),
+        "former companies": len(city.former_companies),
+        "births": sum(1 for event in game.events if event.__class__.__name__ == "Birth"),
+        "deaths": len(city.deceased),
+        "departures": len(city.departed),
+        "marriages": sum(1 for event in game.events if event.__class__.__name__ == "Marriage"),
+    }
+
+
+def welch_t_test(values, other_values):
+    """Return Welch's t statistic for the difference in means of two samples, and its two-sided p-value.
+
+    The p-value comes from the normal approximation to the t distribution, which is close enough
+    for samples of a few dozen or more.
+    """
+    n, other_n = len(values), len(other_values)
+    mean, other_mean = sum(values) / float(n), sum(other_values) / float(other_n)
+    variance = sum((value - mean) ** 2 for value in values) / (n - 1.0)
+    other_variance = sum((value - other_mean) ** 2 for value in other_values) / (other_n - 1.0)
+    standard_error = (variance / n + other_variance / other_n) ** 0.5
+    if not standard_error:
+        return 0.0, 1.0
+    t = (mean - other_mean) / standard_error
+    return t, math.erfc(abs(t) / 2 ** 0.5)
+
+
+def compare_lo_fi_schedulers(seeds=range(40), n_years=100):
+    """Simulate a town with each seed both by stepping through every timestep and by jumping ahead, and compare them.
+
+    Jumping ahead (see Game._enact_lo_fi_simulation_jumping_ahead()) is meant to produce towns that
+    are statistically equivalent to those produced by stepping through every timestep, so this
+    reports the mean and standard deviation of the statistics of the towns produced each way (see
+    summarize_town()), Welch's t-test of whether each statistic differs between the two ways,
+    and the wall time of each way's lo-fi simulation. The towns simulated with a given seed aren't
+    the same either way, and so they are compared as independent samples.
+
+    @param seeds: The seeds to simulate a town with, each way.
+    @param n_years: The number of years of lo-fi simulation to enact after founding the city.
+    """
+    report = {}
+    for scheduler in ("stepping", "jumping ahead"):
+        towns = []
+        wall_time = 0.0
+        for seed in seeds:
+            game = Game(seed=seed)
+            game.config.jump_ahead_during_lo_fi_simulation = scheduler == "jumping ahead"
+            game.found_city()
+            start_time = time.time()
+            game.enact_lo_fi_simulation(n_timesteps=n_years*730)
+            wall_time += time.time() - start_time
+            towns.append(summarize_town(game))
+        statistics = {}
+        for statistic in towns[0]:
+            values = [town[statistic] for town in towns]
+            mean = sum(values) / float(len(values))
+            standard_deviation = (sum((value - mean) ** 2 for value in values) / float(len(values))) ** 0.5
+            statistics[statistic] = (mean, standard_deviation)
+        report[scheduler] = {"statistics": statistics, "wall time (s)": wall_time, "towns": towns}
+    report["t-tests"] = {
+        statistic: welch_t_test(
+            [town[statistic] for town in report["stepping"]["towns"]],
+            [town[statistic] for town in report["jumping ahead"]["towns"]]
+        )
+        for statistic in report["stepping"]["statistics"]
+    }
+    report["speedup"] = report["stepping"]["wall time (s)"] / report["jumping ahead"]["wall time (s)"]
+    return report
+
+
+def run_micro_benchmarks():
+    """Run the benchmarks of individual optimizations and print their results."""
+    for result in benchmark_city_generation():
+        print "quadtree size {quadtree size}: {parcels} parcels, {lots} lots, built in {build time (s):.2f}s " \
+              "(distance matrix {distance matrix (kb):.1f}kb, peak rss +{peak rss growth (kb)}kb)".format(**result)
+    for configuration, calls_per_second in sorted(benchmark_distance_between().items()):
+        print "distance_between using {}: {:.0f} calls/s".format(configuration, calls_per_second)
+    print "job-candidate assembly over {hirings} hirings: {full scan (s):.2f}s by full scan, " \
+          "{job-candidate index (s):.2f}s using the job-candidate index".format(**benchmark_hiring())
+    print "rating {lots} lots for {raters} adults: {lot by lot (s):.2f}s lot by lot, {desirability field (s):.2f}s " \
+          "as a desirability field ({mismatches} mismatched scores)".format(**benchmark_housing_choice())
+    print "{pieces of evidence} pieces of evidence: {bytes per object (before):.0f} bytes per object before, " \
+          "{bytes per object (slots):.0f} with slots".format(**benchmark_evidence_memory())
+    for gap, seconds_per_read in sorted(benchmark_belief_decay_catch_up().items()):
+        print "reading a belief's strength after {} days of decay: {:.1f}us".format(gap, seconds_per_read * 1e6)
+
+
+def run_checks():
+    """Run the checks that optimizations left the simulation's outcomes unchanged, and print their results."""
+    print "same-seed games: {} events matched".format(check_same_seed_games_are_identical())
+    print "housing choice: {} choices made the same way lot by lot".format(check_housing_choice())
+    print "lazy belief decay: {reads} reads of {facets} facets' strengths matched daily decay; longest gap " \
+          "{longest gap (days)} days, {catch-up multiplications} multiplications catching up versus " \
+          "{daily multiplications} decaying daily".format(**check_lazy_belief_decay())
+    print "pruning superseded belief facets: {pruned facets} facets pruned from {mental models} mental models " \
+          "without touching held facets".format(**check_pruning_of_superseded_belief_facets())
+    print "knowledge archive: {event numbers} event numbers and {mental models} mental models matched those of a game whose " \
+          "knowledge was never archived".format(**check_knowledge_archive_round_trip())
+
+
+def main():
+    """Run the benchmarks named on the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark Talk of the Town.")
+    parser.add_argument(
+        "suite", nargs="?", choices=("micro", "worldgen", "lo-fi", "checks"), default="micro",
+        help="micro: benchmarks of individual optimizations; worldgen: per-phase world-generation benchmark; "
+             "lo-fi: comparison of the towns simulated by stepping through every timestep and by jumping ahead; "
+             "checks: assertions that optimizations left the simulation's outcomes unchanged"
+    )
+    parser.add_argument(
+        "--seeds", type=int, nargs="+", default=None, help="seeds to simulate (default: 0-2, or 0-39 for lo-fi)"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[16], help="values of config.quadtree_size")
+    parser.add_argument("--years", type=int, default=None, help="years of lo-fi simulation (default: all of them)")
+    parser.add_argument("--hi-fi-days", type=int, default=7)
+    parser.add_argument("--output", default="worldgen_benchmark.json", help="where to write the worldgen report")
+    parser.add_argument("--compare", metavar="EARLIER_REPORT", help="a worldgen report to compare against")
+    parser.add_argument(
+        "--profile", action="store_true", help="include the profiler's counters for each simulation phase"
+    )
+    args = parser.parse_args()
+    if args.suite == "micro":
+        run_micro_benchmarks()
+        return
+    if args.suite == "checks":
+        run_checks()
+        return
+    if args.suite == "lo-fi":
+        report = compare_lo_fi_schedulers(seeds=args.seeds or range(40), n_years=args.years or 100)
+        for statistic in sorted(report["stepping"]["statistics"]):
+            print "{}: {:.1f} (sd {:.1f}) stepping, {:.1f} (sd {:.1f}) jumping ahead; t = {:.2f}, p = {:.3f}".format(
+                statistic, *(report["stepping"]["statistics"][statistic] +
+                             report["jumping ahead"]["statistics"][statistic] + report["t-tests"][statistic])
+            )
+        print "lo-fi simulation: {:.1f}s stepping, {:.1f}s jumping ahead ({:.2f}x)".format(
+            report["stepping"]["wall time (s)"], report["jumping ahead"]["wall time (s)"], report["speedup"]
+        )
+        return
+    report = benchmark_worldgen_suite(
+        seeds=args.seeds or [0, 1, 2], quadtree_sizes=args.sizes, n_lo_fi_years=args.years, n_hi_fi_days=args.hi_fi_days,
+        profile=args.profile
+    )
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    for world in report["worlds"]:
+        print "seed {seed}, quadtree size {quadtree size}: {total wall time (s):.2f}s".format(**world)
+    if args.compare:
+        with open(args.compare) as f:
+            earlier_report = json.load(f)
+        for phase, (time_before, time_after) in sorted(compare_worldgen_reports(earlier_report, report).items()):
+            print "{}: {:.2f}s -> {:.2f}s ({:.2f}x)".format(
+                phase, time_before, time_after, time_before / time_after if time_after else float('inf')
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -27,7 +27,7 @@ class Business(object):
         # 'Services' is a tuple specifying the services offered by this business, given its type
         self.services = config.services_provided_by_business_of_type[self.__class__]
         self.city = owner.game.city
-        self.city.companies.add(self)
+        self.city.add_company(self)
         self.founded = self.city.game.year
         if self.city.vacant_lots or self.__class__ in config.companies_that_get_established_on_tracts:
             self.lot = self._init_choose_vacant_lot()
@@ -37,7 +37,7 @@ class Business(object):
             # and then construct this company's building on that lot
             acquired_lot = self._init_acquire_currently_occupied_lot()
             if self.city.businesses_of_type('ConstructionFirm'):
-                demolition_company = random.choice(self.city.businesses_of_type('ConstructionFirm'))
+                demolition_company = self.city.game.random.choice(self.city.businesses_of_type('ConstructionFirm'))
             else:
                 demolition_company = None
             demolition_preceding_construction_of_this_business = Demolition(
@@ -45,6 +45,7 @@ class Business(object):
             )
             self.lot = acquired_lot
         self.lot.building = self
+        self.city.update_vacancy_of_lot(self.lot)
         # First, hire employees -- this is done first because the first-ever business, a
         # construction firm started by the city founder, will need to hire the city's
         # first architect before it can construct its own building
@@ -106,6 +107,7 @@ class Business(object):
         if owner.occupation:
             owner.occupation.terminate(reason=hiring)
         owner.occupation = new_position
+        owner.game.city.update_employment_status(owner)
         # Lastly, if the person was hired from outside the city, have them move to it
         if owner.city is not self.city:
             owner.move_into_the_city(hiring_that_instigated_move=hiring)
@@ -175,7 +177,7 @@ class Business(object):
             Restaurant, University, Park, Farm
         )
         if self.__class__ not in classes_that_get_special_names:
-            if random.random() < config.chance_company_gets_named_after_owner:
+            if self.city.game.random.random() < config.chance_company_gets_named_after_owner:
                 prefix = self.owner.person.last_name
             else:
                 prefix = self.street_address_is_on.name
@@ -193,17 +195,17 @@ class Business(object):
             )
             name = "{0} {1}".format(class_to_company_name_component[LawFirm], suffix)
         elif self.__class__ is Bar:
-            name = Names.a_bar_name()
+            name = self.city.game.names.a_bar_name()
             # if self.city.game.year > 1968:
             #     # Choose a name from the corpus of bar names
-            #     name = Names.a_bar_name()
+            #     name = self.city.game.names.a_bar_name()
             # else:
             #     name = self.owner.person.last_name + "'s"
         elif self.__class__ is Restaurant:
-            name = Names.a_restaurant_name()
+            name = self.city.game.names.a_restaurant_name()
             # if self.city.game.year > 1968:
             #     # Choose a name from the corpus of restaurant names
-            #     name = Names.a_restaurant_name()
+            #     name = self.city.game.names.a_restaurant_name()
             # else:
             #     name = self.owner.person.last_name + "'s"
         elif self.__class__ is University:
@@ -213,7 +215,7 @@ class Business(object):
                 business_here_previously = list(self.lot.former_buildings)[-1]
                 owner = business_here_previously.owner.person
                 if business_here_previously.__class__ is Farm:
-                    x = random.random()
+                    x = self.city.game.random.random()
                     if x < 0.25:
                         name = '{} {} Park'.format(
                             owner.first_name, owner.last_name
@@ -240,7 +242,7 @@ class Business(object):
                     else:
                         name = '{} Park'.format(self.city.name)
                 elif business_here_previously.__class__ is Quarry:
-                    x = random.random()
+                    x = self.city.game.random.random()
                     if x < 0.25:
                         name = '{} {} Park'.format(
                             owner.first_name, owner.last_name
@@ -267,7 +269,7 @@ class Business(object):
                     else:
                         name = '{} Park'.format(self.city.name)
                 elif business_here_previously.__class__ is CoalMine:
-                    x = random.random()
+                    x = self.city.game.random.random()
                     if x < 0.25:
                         name = '{} {} Park'.format(
                             owner.first_name, owner.last_name
@@ -301,6 +303,10 @@ class Business(object):
             raise Exception("A company of class {} was unable to be named.".format(self.__class__.__name__))
         self.name = name
 
+    def __hash__(self):
+        """Return a hash of this business's ID, so that collections of them iterate in a reproducible order."""
+        return self.id
+
     def __str__(self):
         """Return string representation."""
         if not self.out_of_business:
@@ -323,14 +329,14 @@ class Business(object):
         if len(lot_scores) >= 3:
             # Pick from top three
             top_three_choices = heapq.nlargest(3, lot_scores, key=lot_scores.get)
-            if random.random() < 0.6:
+            if self.city.game.random.random() < 0.6:
                 choice = top_three_choices[0]
-            elif random.random() < 0.9:
+            elif self.city.game.random.random() < 0.9:
                 choice = top_three_choices[1]
             else:
                 choice = top_three_choices[2]
         elif lot_scores:
-            choice = max(lot_scores)
+            choice = max(lot_scores, key=lot_scores.get)
         else:
             raise Exception("A company attempted to secure an *occupied* lot in town but somehow could not.")
         return choice
@@ -365,14 +371,14 @@ class Business(object):
         if len(lot_scores) >= 3:
             # Pick from top three
             top_three_choices = heapq.nlargest(3, lot_scores, key=lot_scores.get)
-            if random.random() < 0.6:
+            if self.city.game.random.random() < 0.6:
                 choice = top_three_choices[0]
-            elif random.random() < 0.9:
+            elif self.city.game.random.random() < 0.9:
                 choice = top_three_choices[1]
             else:
                 choice = top_three_choices[2]
         elif lot_scores:
-            choice = max(lot_scores)
+            choice = max(lot_scores, key=lot_scores.get)
         else:
             raise Exception("A company attempted to secure a lot in town when in fact none are vacant.")
         return choice
@@ -483,6 +489,29 @@ class Business(object):
     def hire(self, occupation_of_need, shift, to_replace=None,
              fills_supplemental_job_vacancy=False, selected_candidate=None, hired_as_a_favor=False):
         """Hire the given selected candidate."""
+        # Decision makers' hiring biases get cached for the duration of the hiring chain that
+        # this hiring may set off (see _get_biases_of_decision_maker()), so only the outermost
+        # hiring of a chain opens and clears the cache
+        if self.city.hiring_biases_cache is not None:
+            self._hire(
+                occupation_of_need=occupation_of_need, shift=shift, to_replace=to_replace,
+                fills_supplemental_job_vacancy=fills_supplemental_job_vacancy,
+                selected_candidate=selected_candidate, hired_as_a_favor=hired_as_a_favor
+            )
+        else:
+            self.city.hiring_biases_cache = {}
+            try:
+                self._hire(
+                    occupation_of_need=occupation_of_need, shift=shift, to_replace=to_replace,
+                    fills_supplemental_job_vacancy=fills_supplemental_job_vacancy,
+                    selected_candidate=selected_candidate, hired_as_a_favor=hired_as_a_favor
+                )
+            finally:
+                self.city.hiring_biases_cache = None
+
+    def _hire(self, occupation_of_need, shift, to_replace,
+              fills_supplemental_job_vacancy, selected_candidate, hired_as_a_favor):
+        """Hire the given selected candidate, or else find one and hire them."""
         # If no candidate has yet been selected, scour the job market to find one
         if not selected_candidate:
             selected_candidate = self._find_candidate(occupation_of_need=occupation_of_need)
@@ -515,6 +544,7 @@ class Business(object):
         # person was just hired for, triggering endless recursion as the company tries to
         # fill this vacancy in a Sisyphean nightmare)
         selected_candidate.occupation = new_position
+        self.city.update_employment_status(selected_candidate)
         # If this is a law firm and the new hire is a lawyer, change the name
         # of this firm to include the new lawyer's name
         if self.__class__ == "LawFirm" and new_position == Lawyer:
@@ -539,20 +569,19 @@ class Business(object):
         if selected_candidate.city is not self.city:
             selected_candidate.move_into_the_city(hiring_that_instigated_move=hiring)
 
-    @staticmethod
-    def _select_candidate(candidate_scores):
+    def _select_candidate(self, candidate_scores):
         """Select a person to serve in a certain occupational capacity."""
         if len(candidate_scores) >= 3:
             # Pick from top three
             top_three_choices = heapq.nlargest(3, candidate_scores, key=candidate_scores.get)
-            if random.random() < 0.6:
+            if self.city.game.random.random() < 0.6:
                 chosen_candidate = top_three_choices[0]
-            elif random.random() < 0.9:
+            elif self.city.game.random.random() < 0.9:
                 chosen_candidate = top_three_choices[1]
             else:
                 chosen_candidate = top_three_choices[2]
         else:
-            chosen_candidate = max(candidate_scores)
+            chosen_candidate = max(candidate_scores, key=candidate_scores.get)
         return chosen_candidate
 
     def _find_candidate_from_outside_the_city(self, occupation_of_need):
@@ -563,58 +592,78 @@ class Business(object):
         return candidate
 
     def _rate_all_job_candidates(self, candidates):
-        """Rate all job candidates."""
+        """Rate all job candidates, given owner biases, in a single pass over the candidate pool."""
+        config = self.city.game.config
+        family_biases, social_biases, enemies = self._get_biases_of_decision_maker()
+        employees = self.employees
+        unemployment_occupation_level = config.unemployment_occupation_level
         scores = {}
-        for candidate in candidates:
-            scores[candidate] = self.rate_job_candidate(person=candidate)
+        for person in candidates:
+            score = 0.0
+            if person in employees:
+                score += config.preference_to_hire_from_within_company
+            score += family_biases.get(person, 0.0)
+            if not employees.isdisjoint(person.immediate_family):
+                score += config.preference_to_hire_immediate_family_of_an_employee
+            elif not employees.isdisjoint(person.extended_family):
+                score += config.preference_to_hire_extended_family_of_an_employee
+            score += social_biases.get(person, 0.0)
+            if person in enemies:
+                score += config.dispreference_to_hire_enemy
+            if person.occupation:
+                score *= person.occupation.level
+            else:
+                score *= unemployment_occupation_level
+            scores[person] = score
         return scores
 
     def rate_job_candidate(self, person):
         """Rate a job candidate, given an open position and owner biases."""
+        return self._rate_all_job_candidates(candidates=(person,))[person]
+
+    def _get_biases_of_decision_maker(self):
+        """Return the hiring biases of the person who makes hiring decisions for this company.
+
+        These are returned as a dictionary mapping family members to the preference to hire
+        them, a dictionary mapping friends and acquaintances to the preference to hire them,
+        and the set of the decision maker's enemies. Because the decision maker often rates
+        job candidates several times in a single hiring chain (and the mayor does so for every
+        public institution), these are cached on the city for the duration of a hiring chain
+        (see hire()) or a job search (see Person._get_scored_as_job_candidate_by_all_companies()),
+        neither of which changes anyone's family, friends, acquaintances, or enemies.
+        """
         config = self.city.game.config
         decision_maker = self.owner.person if self.owner else self.city.mayor
-        score = 0.0
-        if person in self.employees:
-            score += config.preference_to_hire_from_within_company
-        if person in decision_maker.immediate_family:
-            score += config.preference_to_hire_immediate_family
-        elif person in decision_maker.extended_family:
-            score += config.preference_to_hire_extended_family
-        if person.immediate_family & self.employees:
-            score += config.preference_to_hire_immediate_family_of_an_employee
-        elif person.extended_family & self.employees:
-            score += config.preference_to_hire_extended_family_of_an_employee
-        if person in decision_maker.friends:
-            score += config.preference_to_hire_friend
-        elif person in decision_maker.acquaintances:
-            score += config.preference_to_hire_acquaintance
-        if person in decision_maker.enemies:
-            score += config.dispreference_to_hire_enemy
-        if person.occupation:
-            score *= person.occupation.level
-        else:
-            score *= config.unemployment_occupation_level
-        return score
+        cache = self.city.hiring_biases_cache
+        if cache is not None and decision_maker in cache:
+            return cache[decision_maker]
+        family_biases = dict.fromkeys(decision_maker.extended_family, config.preference_to_hire_extended_family)
+        family_biases.update(
+            dict.fromkeys(decision_maker.immediate_family, config.preference_to_hire_immediate_family)
+        )
+        social_biases = dict.fromkeys(decision_maker.acquaintances, config.preference_to_hire_acquaintance)
+        social_biases.update(dict.fromkeys(decision_maker.friends, config.preference_to_hire_friend))
+        biases = (family_biases, social_biases, frozenset(decision_maker.enemies))
+        if cache is not None:
+            cache[decision_maker] = biases
+        return biases
 
     def _assemble_job_candidates(self, occupation_of_need):
         """Assemble a group of job candidates for an open position."""
         candidates = set()
-        # Consider people that already work in this city -- this will subsume
-        # reasoning over people that could be promoted from within this company
-        for company in self.city.companies:
-            for position in company.employees:
+        # Consider unemployed (mostly young) people and people that already work in this
+        # city at a lower job level -- the latter will subsume reasoning over people that
+        # could be promoted from within this company -- so long as they're among those
+        # who meet this year's preconditions for this occupation (see City.employable_job_candidates_for())
+        level_of_this_position = self.city.game.config.job_levels[occupation_of_need]
+        employable_people = self.city.employable_job_candidates_for(occupation_class=occupation_of_need)
+        for person in self.city.potential_job_candidates(job_level=level_of_this_position):
+            if person in employable_people:
                 person_is_qualified = self.check_if_person_is_qualified_for_the_position(
-                    candidate=position.person, occupation_of_need=occupation_of_need
+                    candidate=person, occupation_of_need=occupation_of_need
                 )
                 if person_is_qualified:
-                    candidates.add(position.person)
-        # Consider unemployed (mostly young) people if they are qualified
-        for person in self.city.unemployed:
-            person_is_qualified = self.check_if_person_is_qualified_for_the_position(
-                candidate=person, occupation_of_need=occupation_of_need
-            )
-            if person_is_qualified:
-                candidates.add(person)
+                    candidates.add(person)
         return candidates
 
     def check_if_person_is_qualified_for_the_position(self, candidate, occupation_of_need):
@@ -678,7 +727,7 @@ class ApartmentComplex(Business):
     def _init_apartment_units(self):
         """Instantiate objects for the individual units in this apartment complex."""
         config = self.city.game.config
-        n_units_to_build = random.randint(
+        n_units_to_build = self.city.game.random.randint(
             config.number_of_apartment_units_in_new_complex_min,
             config.number_of_apartment_units_in_new_complex_max
         )
@@ -1,26 +1,9 @@
-import random
 from business import *
 from residence import *
 from occupation import *
 import pyqtree
-from random import gauss,randrange
-from corpora import Names
 from config import Config
-import heapq
-
-
-class PriorityQueue:
-    def __init__(self):
-        self.elements = []
-    
-    def empty(self):
-        return len(self.elements) == 0
-    
-    def put(self, item, priority):
-        heapq.heappush(self.elements, (priority, item))
-    
-    def get(self):
-        return heapq.heappop(self.elements)[1]
+from array import array
 
 
 def clamp(val, minimum, maximum):
@@ -38,8 +21,36 @@ class City(object):
         self.residents = set()
         self.departed = set()  # People who left the city (i.e., left the simulation)
         self.deceased = set()  # People who died in in the city
+        # Unemployed (mostly young) people, excluding retirees and mothers with kids at home;
+        # kept up to date by update_employment_status()
+        self.unemployed = set()
+        # Employed people, bucketed by the job level of their current occupation; also kept
+        # up to date by update_employment_status()
+        self.employed_at_job_level = {}
+        # The people above (i.e., everyone who could be a job candidate) who meet the preconditions
+        # in config.employable_as_a for each occupation, structured as occupation class -> set of
+        # people; these preconditions depend on the year, so each occupation's set gets built the
+        # first time it's needed in a given year (see employable_job_candidates()), and then kept
+        # up to date by update_employment_status() until the year turns
+        self.employable_job_candidates = {}
+        self.year_of_employable_job_candidates = None
         self.companies = set()
         self.former_companies = set()
+        # Indexes over self.companies, kept up to date by add_company() and remove_company()
+        self.companies_of_type = {}  # Maps business type names (e.g., 'Bar') to sets of companies
+        self.companies_providing_service = {}  # Maps services (e.g., 'haircut') to sets of companies
+        # Cache of the business nearest to a lot for each service, structured as service -> lot -> business;
+        # entries for a service are invalidated whenever a business providing it opens or closes
+        self.nearest_business_providing_service_cache = {}
+        # The year and this city's businesses (other than public companies) split by whether their era has
+        # passed as of that year, which gets discarded whenever a business opens or closes (see
+        # Game._businesses_by_whether_their_era_has_passed())
+        self.businesses_by_whether_their_era_has_passed = None
+        self.nearest_business_cache_hits = 0
+        self.nearest_business_cache_misses = 0
+        # Cache of the hiring biases of people who make hiring decisions, which is a dictionary only while
+        # a hiring chain or a job search is underway, and None otherwise (see Business._get_biases_of_decision_maker())
+        self.hiring_biases_cache = None
         self.lots = set()
         self.tracts = set()
         self.dwelling_places = set()  # Both houses and apartment units (not complexes)
@@ -47,6 +58,11 @@ class City(object):
         self.parcels = set()
         self.blocks = set()
         self.generate_lots(game.config)
+        # Live sets of vacant lots, tracts, and homes, kept up to date by update_vacancy_of_lot()
+        # and update_vacancy_of_home() as buildings go up and come down and people move in and out
+        self.vacant_lots = set(self.lots)
+        self.vacant_tracts = set(self.tracts)
+        self.vacant_homes = set()
         for lot in self.lots | self.tracts:
             lot.set_neighboring_lots_for_citygen()
             lot.init_generate_address()
@@ -77,8 +93,17 @@ class City(object):
                     self.blocks.add(Block(number=current_block_number, street=street))
             # Sort one last time to facilitate easy navigation during gameplay
             street.blocks.sort(key=lambda block: block.number)
-        self.paths = {}
+        # Hop distances between all pairs of parcels, stored as a flat row-major matrix
+        # indexed by the per-city parcel indices in self.parcel_index (see generatePaths())
+        self.parcel_index = {}
+        self.paths = array('i')
         self.generatePaths()
+        # Likewise for lots, where the distance between two lots is that between their nearest
+        # parcels; this table is left empty if config.precompute_lot_distances is False
+        self.lot_index = {}
+        self.lot_distances = array('i')
+        if game.config.precompute_lot_distances:
+            self.generate_lot_distances()
         # Determine the lot central to the highest density of lots in the city and
         # make this lot downtown
         self.downtown = None
@@ -183,40 +208,125 @@ class City(object):
         return self.distance_between(lot,self.downtown)
 
     def generatePaths(self):
-        for start in self.parcels:
-            for goal in self.parcels:
-                if (start == goal):
-                     self.paths[(start,goal)] = 0
-                else :
-                    if ((start,goal) not in self.paths):
-                        came_from, cost_so_far = City.a_star_search(start,goal)
-                        current  = goal
-                        count = 0
-                        while (current != start):
-                            current = came_from[current]
-                            count += 1
-                        self.paths[(start,goal)] =count
-                        self.paths[(goal,start)] =count
-                        
+        """Compute the hop distance between every pair of parcels in the city.
+
+        The parcel graph is unweighted, so a single breadth-first search from each parcel
+        yields its distances to all others; these are written into a flat integer array, such
+        that the distance from parcel i to parcel j lives at self.paths[i*n_parcels+j] (with -1
+        marking a parcel that cannot be reached).
+        """
+        parcels = sorted(self.parcels, key=lambda p: p.id)
+        n_parcels = len(parcels)
+        self.parcel_index = {parcel: i for i, parcel in enumerate(parcels)}
+        neighbor_indices = [
+            [self.parcel_index[neighbor] for neighbor in parcel.neighbors] for parcel in parcels
+        ]
+        unreachable = -1
+        self.paths = array('i', [unreachable]) * (n_parcels * n_parcels)
+        for source in xrange(n_parcels):
+            row_offset = source * n_parcels
+            self.paths[row_offset+source] = 0
+            frontier = [source]
+            distance = 0
+            while frontier:
+                distance += 1
+                next_frontier = []
+                for current in frontier:
+                    for neighbor in neighbor_indices[current]:
+                        if self.paths[row_offset+neighbor] == unreachable:
+                            self.paths[row_offset+neighbor] = distance
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+
+    def generate_lot_distances(self):
+        """Compute the distance between every pair of lots in the city from the parcel distances.
+
+        As with self.paths, these are written into a flat integer array, such that the distance from
+        lot i to lot j lives at self.lot_distances[i*n_lots+j].
+        """
+        lots = sorted(self.lots | self.tracts, key=lambda l: l.id)
+        n_lots = len(lots)
+        n_parcels = len(self.parcel_index)
+        self.lot_index = {lot: i for i, lot in enumerate(lots)}
+        lot_parcel_indices = [[self.parcel_index[parcel] for parcel in lot.parcels] for lot in lots]
+        self.lot_distances = array('i', [-1]) * (n_lots * n_lots)
+        for i, parcel_indices in enumerate(lot_parcel_indices):
+            # Collapse the parcel distances from each of this lot's parcels into a single row
+            row = self.paths[parcel_indices[0]*n_parcels:(parcel_indices[0]+1)*n_parcels]
+            for parcel_index in parcel_indices[1:]:
+                other_row = self.paths[parcel_index*n_parcels:(parcel_index+1)*n_parcels]
+                row = array('i', [
+                    dist if other_dist < 0 or 0 <= dist <= other_dist else other_dist
+                    for dist, other_dist in zip(row, other_row)
+                ])
+            row_offset = i * n_lots
+            for j, other_parcel_indices in enumerate(lot_parcel_indices):
+                reachable = [row[k] for k in other_parcel_indices if row[k] >= 0]
+                if reachable:
+                    self.lot_distances[row_offset+j] = min(reachable)
+
     def distance_between(self, lot1, lot2):
+        """Return the number of parcel hops between the nearest parcels of two lots."""
+        if self.lot_distances:
+            dist = self.lot_distances[self.lot_index[lot1]*len(self.lot_index)+self.lot_index[lot2]]
+            return dist if dist >= 0 else float("inf")
+        n_parcels = len(self.parcel_index)
         min_dist = float("inf")
         for parcel in lot1.parcels:
+            row_offset = self.parcel_index[parcel] * n_parcels
             for other_parcel in lot2.parcels:
-                if self.paths[(parcel, other_parcel)] < min_dist:
-                    min_dist = self.paths[(parcel, other_parcel)]
+                dist = self.paths[row_offset+self.parcel_index[other_parcel]]
+                if 0 <= dist < min_dist:
+                    min_dist = dist
         return min_dist
 
+    def distances_between(self, lot, other_lots):
+        """Return a list of the distances between this lot and each of the other lots, in order.
+
+        This is equivalent to calling distance_between() for each of the other lots, but reads
+        a single row of the lot distance table, if it was precomputed.
+        """
+        if not self.lot_distances:
+            return [self.distance_between(lot, other_lot) for other_lot in other_lots]
+        lot_distances, lot_index = self.lot_distances, self.lot_index
+        row_offset = lot_index[lot] * len(lot_index)
+        distances = [lot_distances[row_offset+lot_index[other_lot]] for other_lot in other_lots]
+        return [dist if dist >= 0 else float("inf") for dist in distances]
+
     def nearest_business_of_type(self, lot, business_type):
-        """Return the Manhattan distance between this lot and the nearest company of the given type.
+        """Return the company of the given type that is nearest to this lot.
 
-        @param business_type: The Class representing the type of company in question.
+        @param business_type: A string of the Class name representing the type of company in question.
         """
-        businesses_of_this_type = self.businesses_of_type(business_type)
+        businesses_of_this_type = self.companies_of_type.get(business_type)
         if businesses_of_this_type:
             return min(businesses_of_this_type, key=lambda b: self.distance_between(lot, b.lot))
         else:
             return None
         
+    def nearest_business_providing_service(self, lot, service):
+        """Return the business providing the given service that is nearest to this lot.
+
+        Answers are cached until a business providing this service opens or closes.
+
+        @param service: A string representing the service in question, e.g., 'haircut'.
+        """
+        nearest_businesses_to_lots = self.nearest_business_providing_service_cache.setdefault(service, {})
+        try:
+            nearest_business = nearest_businesses_to_lots[lot]
+            self.nearest_business_cache_hits += 1
+        except KeyError:
+            self.nearest_business_cache_misses += 1
+            businesses_providing_this_service = self.companies_providing_service.get(service)
+            if businesses_providing_this_service:
+                nearest_business = min(
+                    businesses_providing_this_service, key=lambda b: self.distance_between(lot, b.lot)
+                )
+            else:
+                nearest_business = None
+            nearest_businesses_to_lots[lot] = nearest_business
+        return nearest_business
+
     def dist_to_nearest_business_of_type(self, lot, business_type, exclusion):
         """Return the Manhattan distance between this lot and the nearest company of the given type.
 
@@ -276,11 +386,11 @@ class City(object):
         size = config.quadtree_size
         lociLocations = []
         for ii in range(loci):
-            lociLocations.append([gauss(size/2.0,size/6.0), gauss(size/2.0,size/6.0)])
+            lociLocations.append([self.game.random.gauss(size/2.0,size/6.0), self.game.random.gauss(size/2.0,size/6.0)])
         tree = pyqtree.Index(bbox=[0,0,size,size])
         for ii in range(samples):
-            center = lociLocations[randrange(len(lociLocations))]
-            point = [clamp(gauss(center[0],size/6.0),0,size-1),clamp(gauss(center[1],size/6.0),0,size-1)]
+            center = lociLocations[self.game.random.randrange(len(lociLocations))]
+            point = [clamp(self.game.random.gauss(center[0],size/6.0),0,size-1),clamp(self.game.random.gauss(center[1],size/6.0),0,size-1)]
             point.append(point[0]+1)
             point.append(point[1]+1)
             tree.insert(point,point)
@@ -402,13 +512,13 @@ class City(object):
             for ii in range(0,size_of_parcel+1):
                 
                 insertOnce(Parcels,(ew,ns+ii,'NS'),Parcel( nsStreets[(ew,ns)], (ii+ns)*100,(ew,ns+ii)))
-                insertOnce(Numberings,(ew,ns+ii,'E'),Parcel.determine_house_numbering( (ii+ns)*100,'E', config))
+                insertOnce(Numberings,(ew,ns+ii,'E'),Parcel.determine_house_numbering( (ii+ns)*100,'E', config, self.game.random))
                 insertOnce(Parcels,(ew+ii,ns,'EW'),Parcel( ewStreets[(ew,ns)], (ii+ew)*100,(ew+ii,ns)))
-                insertOnce(Numberings,(ew+ii,ns,'N'),Parcel.determine_house_numbering( (ii+ew)*100,'N', config))
+                insertOnce(Numberings,(ew+ii,ns,'N'),Parcel.determine_house_numbering( (ii+ew)*100,'N', config, self.game.random))
                 insertOnce(Parcels,(ew+size_of_parcel,ns+ii,'NS'),Parcel( nsStreets[(ew+size_of_parcel,ns)], (ii+ns)*100,(ew+size_of_parcel,ns+ii)))
-                insertOnce(Numberings,(ew+size_of_parcel,ns+ii,'W'),Parcel.determine_house_numbering( (ii+ns)*100,'W', config))
+                insertOnce(Numberings,(ew+size_of_parcel,ns+ii,'W'),Parcel.determine_house_numbering( (ii+ns)*100,'W', config, self.game.random))
                 insertOnce(Parcels,(ew+ii,ns+size_of_parcel,'EW'),Parcel( ewStreets[(ew,ns+size_of_parcel)], (ii+ew)*100,(ew+ii,ns+size_of_parcel)))
-                insertOnce(Numberings,(ew+ii,ns+size_of_parcel,'S'),Parcel.determine_house_numbering( (ii+ew)*100,'S', config))
+                insertOnce(Numberings,(ew+ii,ns+size_of_parcel,'S'),Parcel.determine_house_numbering( (ii+ew)*100,'S', config, self.game.random))
                 if (tract != None):
                     tract.add_parcel(Parcels[(ew,ns+ii,'NS')],Numberings[(ew,ns+ii,'E')][n_buildings_per_parcel],'E',0)
                     tract.add_parcel( Parcels[(ew+ii,ns,'EW')],Numberings[(ew+ii,ns,'N')][n_buildings_per_parcel] ,'N',0)
@@ -509,40 +619,133 @@ class City(object):
         houses = {d for d in self.dwelling_places if d.__class__ is House}
         return houses | self.companies
 
-    @property
-    def vacant_lots(self):
-        """Return all vacant lots in the city."""
-        vacant_lots = [lot for lot in self.lots if not lot.building]
-        return vacant_lots
+    def update_vacancy_of_lot(self, lot):
+        """Add this lot (or tract) to, or remove it from, the city's vacant lots (or tracts)."""
+        vacant_lots_or_tracts = self.vacant_tracts if lot.tract else self.vacant_lots
+        if lot.building:
+            vacant_lots_or_tracts.discard(lot)
+        else:
+            vacant_lots_or_tracts.add(lot)
 
-    @property
-    def vacant_tracts(self):
-        """Return all vacant tracts in the city."""
-        vacant_tracts = [tract for tract in self.tracts if not tract.building]
-        return vacant_tracts
+    def update_vacancy_of_home(self, home):
+        """Add this dwelling place to, or remove it from, the city's vacant homes."""
+        if home.residents or home not in self.dwelling_places:
+            self.vacant_homes.discard(home)
+        else:
+            self.vacant_homes.add(home)
 
-    @property
-    def vacant_homes(self):
-        """Return all vacant homes in the city."""
-        vacant_homes = [home for home in self.dwelling_places if not home.residents]
-        return vacant_homes
+    def update_employment_status(self, *people):
+        """Update the city's unemployed people, and its employed people by job level, for each of these people.
+
+        Since mothers with kids at home don't count as unemployed, this should be called for
+        a person's parents too whenever that person moves, dies, or departs.
+        """
+        for person in people:
+            if person in self.residents and self._counts_as_unemployed(person):
+                self.unemployed.add(person)
+            else:
+                self.unemployed.discard(person)
+            for employed_people in self.employed_at_job_level.itervalues():
+                employed_people.discard(person)
+            if person.occupation:
+                self.employed_at_job_level.setdefault(person.occupation.level, set()).add(person)
+            if self.year_of_employable_job_candidates == self.game.year:
+                could_be_a_job_candidate = person in self.unemployed or person.occupation
+                for occupation_class, employable_people in self.employable_job_candidates.iteritems():
+                    if could_be_a_job_candidate and self.game.config.employable_as_a[occupation_class](applicant=person):
+                        employable_people.add(person)
+                    else:
+                        employable_people.discard(person)
+
+    @staticmethod
+    def _counts_as_unemployed(person):
+        """Return whether a resident counts as unemployed (retirees and mothers with kids at home don't)."""
+        # TODO NOT ALL WOMEN WILL WANT TO STAY HOME WITH KIDS
+        return (
+            not person.occupation and not person.retired and person.ready_to_work and
+            not (person.female and person.kids_at_home)
+        )
+
+    def potential_job_candidates(self, job_level):
+        """Return the people who could conceivably be hired to a position of the given job level.
+
+        Someone already working a job of that level or higher never qualifies for such
+        a position (see Business.check_if_person_is_qualified_for_the_position()), so this
+        only includes unemployed people and people working lower-level jobs.
+        """
+        potential_job_candidates = set(self.unemployed)
+        for level, employed_people in self.employed_at_job_level.iteritems():
+            if level < job_level:
+                potential_job_candidates |= employed_people
+        return potential_job_candidates
+
+    def employable_job_candidates_for(self, occupation_class):
+        """Return the potential job candidates who meet the preconditions in config.employable_as_a for an occupation this year.
+
+        Job-candidate assembly only runs the full qualification check (see
+        Business.check_if_person_is_qualified_for_the_position()) on these people.
+        """
+        if self.year_of_employable_job_candidates != self.game.year:
+            self.employable_job_candidates = {}
+            self.year_of_employable_job_candidates = self.game.year
+        if occupation_class not in self.employable_job_candidates:
+            employable = self.game.config.employable_as_a[occupation_class]
+            self.employable_job_candidates[occupation_class] = {
+                person for person in self.potential_job_candidates(job_level=float('inf'))
+                if employable(applicant=person)
+            }
+        return self.employable_job_candidates[occupation_class]
+
+    def check_employment_consistency(self):
+        """Assert that the city's unemployed and employed people match those found by surveying the city.
+
+        This gets called every timestep when config.check_employment_consistency is True, which
+        is useful for debugging.
+        """
+        unemployed_people = {resident for resident in self.residents if self._counts_as_unemployed(resident)}
+        assert self.unemployed == unemployed_people, (
+            "The unemployed people in {} are out of sync with its residents".format(self.name)
+        )
+        employed_at_job_level = {}
+        for company in self.companies:
+            for employee in company.employees:
+                if employee.person.occupation is employee:
+                    employed_at_job_level.setdefault(employee.level, set()).add(employee.person)
+        for level in set(self.employed_at_job_level) | set(employed_at_job_level):
+            assert self.employed_at_job_level.get(level, set()) == employed_at_job_level.get(level, set()), (
+                "The employed people in {} are out of sync with its companies".format(self.name)
+            )
+        if self.year_of_employable_job_candidates == self.game.year:
+            potential_job_candidates = self.potential_job_candidates(job_level=float('inf'))
+            for occupation_class, employable_people in self.employable_job_candidates.iteritems():
+                employable = self.game.config.employable_as_a[occupation_class]
+                assert employable_people == {p for p in potential_job_candidates if employable(applicant=p)}, (
+                    "The job candidates employable as {} in {} are out of sync with its people".format(
+                        occupation_class.__name__, self.name
+                    )
+                )
+
+    def check_vacancy_consistency(self):
+        """Assert that the city's vacant lots, tracts, and homes match those found by surveying the city.
+
+        This gets called every timestep when config.check_vacancy_consistency is True, which
+        is useful for debugging.
+        """
+        assert self.vacant_lots == {lot for lot in self.lots if not lot.building}, (
+            "The vacant lots in {} are out of sync with its lots".format(self.name)
+        )
+        assert self.vacant_tracts == {tract for tract in self.tracts if not tract.building}, (
+            "The vacant tracts in {} are out of sync with its tracts".format(self.name)
+        )
+        assert self.vacant_homes == {home for home in self.dwelling_places if not home.residents}, (
+            "The vacant homes in {} are out of sync with its dwelling places".format(self.name)
+        )
 
     @property
     def all_time_residents(self):
         """Return everyone who has at one time lived in the city."""
         return self.residents | self.deceased | self.departed
 
-    @property
-    def unemployed(self):
-        """Return unemployed (mostly young) people, excluding retirees."""
-        unemployed_people = set()
-        for resident in self.residents:
-            if not resident.occupation and not resident.retired:
-                # TODO NOT ALL WOMEN WILL WANT TO STAY HOME WITH KIDS
-                if resident.ready_to_work and not (resident.female and resident.kids_at_home):
-                    unemployed_people.add(resident)
-        return unemployed_people
-
     def workers_of_trade(self, occupation):
         """Return all population in the city who practice to given occupation.
 
@@ -555,52 +758,42 @@ class City(object):
 
         @param business_type: A string of the Class name representing the type of business in question.
         """
-        businesses_of_this_type = [
-            company for company in self.companies if company.__class__.__name__ == business_type
-        ]
-        return businesses_of_this_type
+        return list(self.companies_of_type.get(business_type, ()))
 
-    @staticmethod
-    def heuristic(a, b):
-        (x1, y1) = a.coords
-        (x2, y2) = b.coords
-        return abs(x1 - x2) + abs(y1 - y2)
+    def businesses_providing_service(self, service):
+        """Return all businesses in this city that provide the given service.
 
-    @staticmethod
-    def a_star_search(start, goal):
-        frontier = PriorityQueue()
-        frontier.put(start, 0)
-        came_from = {}
-        cost_so_far = {}
-        came_from[start] = None
-        cost_so_far[start] = 0
-        
-        while not frontier.empty():
-            current = frontier.get()
-            
-            if current == goal:
-                break
-            
-            for next in current.neighbors:
-                new_cost = cost_so_far[current] + 1
-                if next not in cost_so_far or new_cost < cost_so_far[next]:
-                    cost_so_far[next] = new_cost
-                    priority = new_cost + City.heuristic(goal, next)
-                    frontier.put(next, priority)
-                    came_from[next] = current
-        
-        return came_from, cost_so_far
+        @param service: A string representing the service in question, e.g., 'haircut'.
+        """
+        return list(self.companies_providing_service.get(service, ()))
+
+    def add_company(self, company):
+        """Add a newly established company to this city and its indexes."""
+        self.companies.add(company)
+        self.companies_of_type.setdefault(company.__class__.__name__, set()).add(company)
+        for service in company.services:
+            self.companies_providing_service.setdefault(service, set()).add(company)
+            self.nearest_business_providing_service_cache.pop(service, None)
+        self.businesses_by_whether_their_era_has_passed = None
+
+    def remove_company(self, company):
+        """Remove a company that has gone out of business from this city and its indexes."""
+        self.companies.remove(company)
+        self.companies_of_type[company.__class__.__name__].remove(company)
+        for service in company.services:
+            self.companies_providing_service[service].remove(company)
+            self.nearest_business_providing_service_cache.pop(service, None)
+        self.former_companies.add(company)
+        self.businesses_by_whether_their_era_has_passed = None
 
 
 class Street(object):
     """A street in a city."""
 
-    counter = 0
-
     def __init__(self, city, number, direction, starting_parcel, ending_parcel):
         """Initialize a Street object."""
-        self.id = Street.counter
-        Street.counter += 1
+        self.id = city.game.current_street_id
+        city.game.current_street_id += 1
         self.city = city
         self.number = number
         self.direction = direction  # Direction relative to the center of the city
@@ -616,28 +809,39 @@ class Street(object):
             1: '1st', 2: '2nd', 3: '3rd', 4: '4th', 5: '5th',
             6: '6th', 7: '7th', 8: '8th', 9: '9th'
         }
+        if number not in number_to_ordinal:
+            # Larger cities (config.quadtree_size > 16) have more than nine streets running each way
+            if 10 <= number % 100 <= 20:
+                suffix = 'th'
+            else:
+                suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
+            number_to_ordinal[number] = '{}{}'.format(number, suffix)
         if direction == 'E' or direction == 'W':
             street_type = 'Street'
-            if random.random() < config.chance_street_gets_numbered_name:
+            if self.city.game.random.random() < config.chance_street_gets_numbered_name:
                 name = number_to_ordinal[number]
             else:
-                if random.random() < 0.5:
-                    name = Names.any_surname()
+                if self.city.game.random.random() < 0.5:
+                    name = self.city.game.names.any_surname()
                 else:
-                    name = Names.a_place_name()
+                    name = self.city.game.names.a_place_name()
         else:
             street_type = 'Avenue'
-            if random.random() < config.chance_avenue_gets_numbered_name:
+            if self.city.game.random.random() < config.chance_avenue_gets_numbered_name:
                 name = number_to_ordinal[number]
             else:
-                if random.random() < 0.5:
-                    name = Names.any_surname()
+                if self.city.game.random.random() < 0.5:
+                    name = self.city.game.names.any_surname()
                 else:
-                    name = Names.a_place_name()
+                    name = self.city.game.names.a_place_name()
         # name = "{0} {1} {2}".format(name, street_type, direction)
         name = "{0} {1}".format(name, street_type)
         return name
 
+    def __hash__(self):
+        """Return a hash of this street's ID, so that collections of them iterate in a reproducible order."""
+        return self.id
+
     def __str__(self):
         """Return string representation."""
         return self.name
@@ -646,20 +850,22 @@ class Street(object):
 class Parcel(object):
     """A collection of between zero and four contiguous lots in a city."""
 
-    counter = 0
-
     def __init__(self, street, number, coords):
         """Initialize a Parcel object."""
-        self.id = Parcel.counter
-        Parcel.counter += 1
+        self.id = street.city.game.current_parcel_id
+        street.city.game.current_parcel_id += 1
         self.street = street
         self.number = number
         self.lots = []
         self.neighbors = []
         self.coords = coords
 
+    def __hash__(self):
+        """Return a hash of this parcel's ID, so that collections of them iterate in a reproducible order."""
+        return self.id
+
     @staticmethod
-    def determine_house_numbering(block_number, side_of_street, config):
+    def determine_house_numbering(block_number, side_of_street, config, rng):
         """Devise an appropriate house numbering scheme given the number of buildings on the block."""
         n_buildings = config.n_buildings_per_parcel+1
         house_numbers = []
@@ -667,7 +873,7 @@ class Parcel(object):
         even_or_odd = 0 if side_of_street == "E" or side_of_street == "N" else 1
         for i in xrange(n_buildings):
             base_house_number = (i * house_number_increment) - 1
-            house_number = base_house_number + int(random.random() * house_number_increment)
+            house_number = base_house_number + int(rng.random() * house_number_increment)
             if house_number % 2 == (1-even_or_odd):
                 house_number += 1
             if house_number < 1+even_or_odd:
@@ -687,12 +893,18 @@ class Block(object):
 
     def __init__(self, number, street):
         """Initialize a block object."""
+        self.id = street.city.game.current_block_id
+        street.city.game.current_block_id += 1
         self.number = number
         self.street = street
         self.street.blocks.append(self)
         self.lots = []
         self.type = 'block'
 
+    def __hash__(self):
+        """Return a hash of this block's ID, so that collections of them iterate in a reproducible order."""
+        return self.id
+
     def __str__(self):
         """Return string representation."""
         return "{} block of {}".format(self.number, str(self.street))
@@ -706,12 +918,10 @@ class Block(object):
 class Lot(object):
     """A lot on a city block (and multiple parcels) in a city, upon which buildings and houses get erected."""
 
-    counter = 0
-
     def __init__(self, city):
         """Initialize a Lot object."""
-        self.id = Lot.counter
-        Lot.counter += 1
+        self.id = city.game.current_lot_id
+        city.game.current_lot_id += 1
         self.lot = True if self.__class__ is Lot else False
         self.tract = True if self.__class__ is Tract else False
         self.city = city
@@ -731,6 +941,10 @@ class Lot(object):
         self.index_of_street_address_will_be_on = None
         self.former_buildings = []
 
+    def __hash__(self):
+        """Return a hash of this lot's ID, so that collections of them iterate in a reproducible order."""
+        return self.id
+
     def __str__(self):
         """Return string representation."""
         if self.__class__ is Lot:
@@ -774,7 +988,7 @@ class Lot(object):
 
     def init_generate_address(self):
         """Generate an address, given the lot building is on."""
-        self.index_of_street_address_will_be_on = random.randint(0, len(self.streets)-1)
+        self.index_of_street_address_will_be_on = self.city.game.random.randint(0, len(self.streets)-1)
         house_number = self.house_numbers[self.index_of_street_address_will_be_on]
         self.house_number = int(house_number)
         street = self.streets[self.index_of_street_address_will_be_on]
@@ -2,6 +2,7 @@ from occupation import *
 from event import *
 from business import *
 from conversation import *
+import cPickle
 import math
 
 
@@ -16,6 +17,30 @@ class Config(object):
                 #################
         self.chance_of_a_coal_mine_at_time_of_town_founding = 0.2
         self.chance_of_a_quarry_at_time_of_town_founding = 0.15
+        # Whether the names, knowledge, routine, and dialogue subsystems should each
+        # draw from their own random stream (derived from the game's seed) rather than sharing the
+        # game's main one; this keeps a change to one subsystem from perturbing the others' draws
+        self.separate_random_streams_per_subsystem = False
+        # Whether to count the calls to, time spent in, and objects created by each phase of the
+        # simulation (and a few hot leaf calls) with the game's profiler (see profiler.py); this
+        # may also be toggled at runtime with game.profiler.enable() and game.profiler.disable()
+        self.profile_simulation = False
+        # Dates (as (year, month, day) tuples) during world generation on which to save a snapshot of
+        # the game (see snapshot.py), from which gameplay can later be resumed with snapshot.load_snapshot()
+        # and Game.simulate_until_gameplay_begins(); the string 'hi-fi' stands for the start of the
+        # hi-fi simulation (just after knowledge implantation)
+        self.dates_to_snapshot_world = ()
+        self.snapshot_path_template = 'talktown_seed{seed}_{date}.snapshot'
+        # Whether to archive everyone's knowledge (see archive.py) upon saving a snapshot, which makes
+        # snapshots much smaller and faster to save and load; mental models are then rehydrated lazily,
+        # as gameplay touches them, both in the snapshotted game and in any game resumed from it
+        self.archive_knowledge_in_snapshots = False
+        # Which pieces of evidence the game's evidence log (see evidence.EvidenceLog) retains: 'all' of
+        # them, only those still 'referenced' by people's belief facets, or the 'recent' ones, namely
+        # the last evidence_log_capacity pieces of evidence; evidence that the log does not retain
+        # lives on for as long as belief facets reference it, so this only caps the log's own growth
+        self.evidence_retention = 'all'
+        self.evidence_log_capacity = 100000
         # When to stop
         self.date_gameplay_begins = (1979, 8, 19)
         self.date_worldgen_begins = (1839, 8, 19)  # Date world gen begins
@@ -26,6 +51,9 @@ class Config(object):
         self.quadtree_samples = 32
         self.quadtree_size = 16
         self.quadtree_multiplier = 2
+        # Whether to precompute a lot-to-lot distance table (which takes memory quadratic in the
+        # number of lots) rather than deriving each lot distance from the parcel distances
+        self.precompute_lot_distances = True
         self.n_buildings_per_parcel = 2
         self.largest_possible_house_number = 799
         self.smallest_possible_house_number = 100
@@ -45,8 +73,19 @@ class Config(object):
                 ############
 
         self.chance_of_a_timestep_being_simulated = 0.005  # 3.6 timesteps a year on average
+        # Whether the lo-fi simulation jumps from one thing happening (a simulated timestep, a business
+        # opening or closing, a birth) to the next, rather than stepping through every timestep and rolling
+        # for each of them; this produces statistically equivalent towns, but not the same town for a given
+        # seed, and it saves little time, since the simulated timesteps dominate the lo-fi simulation either
+        # way (see Game._enact_lo_fi_simulation_jumping_ahead() and benchmark.compare_lo_fi_schedulers())
+        self.jump_ahead_during_lo_fi_simulation = False
+        # Whether to verify, every timestep, that the city's vacant lots, tracts, and homes are
+        # consistent with a full survey of the city (slow; for debugging and testing only)
+        self.check_vacancy_consistency = False
+        # Likewise for the city's unemployed people and its employed people by job level
+        self.check_employment_consistency = False
         # Daily routines
-        self.chance_someone_locks_their_door = lambda neuroticism: neuroticism  # If random.random() > neuro: True
+        self.chance_someone_locks_their_door = lambda neuroticism: neuroticism  # If game.random.random() > neuro: True
         self.chance_someone_calls_in_sick_to_work = 0.03
         self.chance_someone_doesnt_have_to_work_some_day = 0.00  # Can be used as proxy in lieu of weekends
         self.chance_someone_leaves_home_multiplier_due_to_kids = 0.3  # i.e., 30% as likely to leave if kids
@@ -1158,7 +1197,7 @@ class Config(object):
 
         # People ex nihilo
         self.function_to_determine_person_ex_nihilo_age_given_job_level = (
-            lambda job_level: 18 + random.randint(2*job_level, 7*job_level)
+            lambda job_level, rng: 18 + rng.randint(2*job_level, 7*job_level)
         )
         # self.function_to_determine_chance_person_ex_nihilo_starts_with_family = (
         #     lambda age: (age / 100.0) * 1.4
@@ -1714,6 +1753,18 @@ class Config(object):
             'job title', 'status', 'approximate age', 'suffix', 'marital status', 'business name'
         }
         self.decay_rate_of_belief_strength_per_day = 0.95  # Lose 5% of strength every day
+        # If not None, superseded belief facets (i.e., challengers) whose strength has decayed below this
+        # are pruned during the hi-fi simulation; e.g., 0.01 prunes an observation-backed challenger after
+        # about five months and a challenger backed by a single declaration after about two. Evidence that
+        # only pruned facets referenced is let go as well, but only if the evidence log doesn't retain it:
+        # with the default evidence_retention of 'all', the log keeps every piece of evidence regardless,
+        # and so only the facets themselves are freed
+        self.strength_below_which_superseded_belief_facets_get_pruned = None
+        # Rather than every resident's mental models being gone over for pruning every day, each
+        # resident's are gone over once every this many days, so that a day's pruning only touches
+        # (and brings the lazily decayed strengths up to date for) this fraction of all facets; a
+        # facet thus gets pruned within this many days of decaying below the threshold above
+        self.days_over_which_pruning_of_superseded_belief_facets_is_spread = 30
         three_fourths_strength_of_firsthand_observation = (
             self.base_strength_of_evidence_types['observation'] /
             self.base_strength_of_evidence_types["statement"] *
@@ -2595,6 +2646,26 @@ class Config(object):
             ],
         }
 
+    def __getstate__(self):
+        """Return the state of this object for pickling (as when a game is snapshotted).
+
+        Parameters that are (or contain) functions cannot be pickled, so these are left out
+        and restored from their defaults when the object is unpickled.
+        """
+        state = {}
+        for parameter, value in self.__dict__.iteritems():
+            try:
+                cPickle.dumps(value, cPickle.HIGHEST_PROTOCOL)
+            except (cPickle.PicklingError, TypeError):
+                continue
+            state[parameter] = value
+        return state
+
+    def __setstate__(self, state):
+        """Restore this object from its pickled state."""
+        self.__init__()
+        self.__dict__.update(state)
+
     @staticmethod
     def fit_probability_distribution(relative_frequencies_dictionary):
         """Return a probability distribution fitted to the given relative-frequencies dictionary."""
@@ -1,4 +1,3 @@
-import random
 from event import Event
 from evidence import Statement, Declaration, Lie, Eavesdropping
 from belief import PersonMentalModel, DwellingPlaceModel, BusinessMentalModel
@@ -161,9 +160,9 @@ class Conversation(Event):
 
         This method is for an evaluation experiment conducted for an DiGRA-FDG 2016 paper submission.
         """
-        number_of_turns = random.randrange(5, 16)
+        number_of_turns = self.productionist.random.randrange(5, 16)
         for _ in xrange(number_of_turns):
-            next_speaker = random.choice(self.participants)
+            next_speaker = self.productionist.random.choice(self.participants)
             Turn(
                 conversation=self, speaker=next_speaker,
                 targeted_obligation=None,
@@ -189,7 +188,7 @@ class Conversation(Event):
         targeted_goal = None
         # If both conversational parties have obligations, randomly allocate the turn
         if self.obligations[self.initiator] and self.obligations[self.recipient]:
-            next_speaker = random.choice(self.participants)
+            next_speaker = self.productionist.random.choice(self.participants)
             targeted_obligation = list(self.obligations[next_speaker])[0]
             if self.debug:
                 print (
@@ -211,7 +210,7 @@ class Conversation(Event):
                 print '[Allocating turn according to {}]'.format(targeted_obligation)
         # If both conversational parties have goals whose plans are not on hold, allocate randomly
         elif self.goals_not_on_hold[self.initiator] and self.goals_not_on_hold[self.recipient]:
-            next_speaker = random.choice(self.participants)
+            next_speaker = self.productionist.random.choice(self.participants)
             targeted_goal = list(self.goals_not_on_hold[next_speaker])[0]
         # If the initiator has a goal whose plan is not on hold, allocate to them
         elif self.goals_not_on_hold[self.initiator]:
@@ -229,7 +228,7 @@ class Conversation(Event):
         # turn with consideration given to the parties' relative extroversion values
         # TODO IMPROVE THE REASONING ABOUT ALLOCATION HERE
         else:
-            if random.random() < 0.75:
+            if self.productionist.random.random() < 0.75:
                 next_speaker = max(self.participants, key=lambda p: p.personality.extroversion)
             else:
                 next_speaker = min(self.participants, key=lambda p: p.personality.extroversion)
@@ -408,7 +407,7 @@ class Turn(object):
         This method is for an evaluation experiment conducted for an DiGRA-FDG 2016 paper submission.
         """
         all_possible_dialogue_moves = self.conversation.productionist.move_satisficers.keys()
-        random.shuffle(all_possible_dialogue_moves)
+        self.conversation.productionist.random.shuffle(all_possible_dialogue_moves)
         for move_name in all_possible_dialogue_moves:
             selected_line = self.conversation.target_move(move_name=move_name)
             if selected_line:
@@ -484,7 +483,7 @@ class Turn(object):
             selected_line = self.conversation.target_topic()
         else:
             # Either engage in small talk or adopt a goal to end the conversation
-            if random.random() < max(self.speaker.personality.extroversion, 0.05):
+            if self.conversation.productionist.random.random() < max(self.speaker.personality.extroversion, 0.05):
                 selected_line = self.conversation.target_move(move_name='make small talk')
             else:
                 new_goal_to_end_conversation = Goal(
@@ -512,9 +511,10 @@ class Turn(object):
     def _potentially_be_eavesdropped(self):
         """Potentially have the line of dialogue asserting this proposition be eavesdropped by a nearby character."""
         # TODO maybe affect this by how salient subject is to eavesdropper
-        people_in_earshot = self.conversation.speaker.location.people_here_now - {self.speaker, self.interlocutor}
-        eavesdropper = None if not people_in_earshot else random.choice(list(people_in_earshot))
-        if eavesdropper and random.random() < self.speaker.game.config.chance_someone_eavesdrops_statement_or_lie:
+        people_here, _ = self.speaker.game.occupants(location=self.conversation.speaker.location)
+        people_in_earshot = [p for p in people_here if p is not self.speaker and p is not self.interlocutor]
+        eavesdropper = None if not people_in_earshot else self.conversation.productionist.random.choice(people_in_earshot)
+        if eavesdropper and self.conversation.productionist.random.random() < self.speaker.game.config.chance_someone_eavesdrops_statement_or_lie:
             if self.conversation.debug:
                 print '-- Eavesdropped by {}'.format(eavesdropper.name)
             return eavesdropper
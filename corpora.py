@@ -1,6 +1,5 @@
 import os
 import pickle
-import random
 import math
 
 
@@ -56,19 +55,25 @@ class Names(object):
         open(os.getcwd()+'/corpora/bar_names.txt', 'r')
     )
 
-    @classmethod
-    def a_masculine_name(cls, year):
+    def __init__(self, rng):
+        """Initialize a Names object.
+
+        @param rng: The random number generator (i.e., a random.Random) to draw names with.
+        """
+        self.random = rng
+
+    def a_masculine_name(self, year):
         """Return a random masculine first name befitting the in-game year."""
         if year < 1880:
             year = 1880
         decade = int(math.floor(year/10)*10)  # Determine the current decade
-        x = random.random()
+        x = self.random.random()
         if x > 0.99:
             # Choose any masculine name (allows rare ones to be used occasionally)
-            name = random.choice(cls.miscellaneous_masculine_forenames)
+            name = self.random.choice(self.miscellaneous_masculine_forenames)
         else:
             # Choose using the actual distribution of American names this decade
-            probability_distribution_for_this_decade = cls.names_by_decade[decade]['M']
+            probability_distribution_for_this_decade = self.names_by_decade[decade]['M']
             name = next(
                 name for name in probability_distribution_for_this_decade if
                 probability_distribution_for_this_decade[name][0] <= x <=
@@ -76,19 +81,18 @@ class Names(object):
             )
         return name
 
-    @classmethod
-    def a_feminine_name(cls, year):
+    def a_feminine_name(self, year):
         """Return a random feminine first name befitting the in-game year."""
         if year < 1880:
             year = 1880
         decade = int(math.floor(year/10)*10)  # Determine the current decade
-        x = random.random()
+        x = self.random.random()
         if x > 0.99:
             # Choose any masculine name (allows rare ones to be used occasionally)
-            name = random.choice(cls.miscellaneous_masculine_forenames)
+            name = self.random.choice(self.miscellaneous_masculine_forenames)
         else:
             # Choose using the actual distribution of American names this decade
-            probability_distribution_for_this_decade = cls.names_by_decade[decade]['F']
+            probability_distribution_for_this_decade = self.names_by_decade[decade]['F']
             name = next(
                 name for name in probability_distribution_for_this_decade if
                 probability_distribution_for_this_decade[name][0] <= x <=
@@ -96,45 +100,38 @@ class Names(object):
             )
         return name
 
-    @classmethod
-    def an_english_surname(cls):
+    def an_english_surname(self):
         """Return a random English surname."""
-        return random.choice(cls.english_surnames)
+        return self.random.choice(self.english_surnames)
 
-    @classmethod
-    def a_french_surname(cls):
+    def a_french_surname(self):
         """Return a random French surname."""
-        return random.choice(cls.french_surnames)
+        return self.random.choice(self.french_surnames)
 
-    @classmethod
-    def a_german_surname(cls):
+    def a_german_surname(self):
         """Return a random German surname."""
-        return random.choice(cls.german_surnames)
+        return self.random.choice(self.german_surnames)
 
-    @classmethod
-    def an_irish_surname(cls):
+    def an_irish_surname(self):
         """Return a random Irish surname."""
-        return random.choice(cls.irish_surnames)
+        return self.random.choice(self.irish_surnames)
 
-    @classmethod
-    def a_scandinavian_surname(cls):
+    def a_scandinavian_surname(self):
         """Return a random Scandinavian surname."""
-        return random.choice(cls.scandinavian_surnames)
+        return self.random.choice(self.scandinavian_surnames)
 
-    @classmethod
-    def any_surname(cls):
+    def any_surname(self):
         """Return a random surname of any ethnicity."""
-        return random.choice(cls.all_surnames)
+        return self.random.choice(self.all_surnames)
 
-    @classmethod
-    def a_masculine_name_starting_with(cls, letter, year):
+    def a_masculine_name_starting_with(self, letter, year):
         """Return a random masculine name starting with the given letter and befitting the given year."""
         if year < 1880:
             year = 1880
         decade = int(math.floor(year/10)*10)  # Determine the current decade
-        x = random.random()
+        x = self.random.random()
         # Choose using the actual distribution of American names this decade
-        probability_distribution_for_this_decade = cls.names_by_decade[decade]['M']
+        probability_distribution_for_this_decade = self.names_by_decade[decade]['M']
         try:
             name = next(
                 name for name in probability_distribution_for_this_decade if
@@ -143,16 +140,16 @@ class Names(object):
                 name[0].lower() == letter[0]
             )
         except StopIteration:
-            if random.random() < 0.5:
+            if self.random.random() < 0.5:
                 # Choose any miscellaneous name starting with the same letter
                 names_that_start_with_that_letter = [
-                    name for name in cls.miscellaneous_masculine_forenames if
+                    name for name in self.miscellaneous_masculine_forenames if
                     name[0].lower() == letter.lower()
                 ]
-                name = random.choice(names_that_start_with_that_letter)
+                name = self.random.choice(names_that_start_with_that_letter)
             else:
                 # Choose any name befitting the era of the person's birth
-                x = random.random()
+                x = self.random.random()
                 name = next(
                     name for name in probability_distribution_for_this_decade if
                     probability_distribution_for_this_decade[name][0] <= x <=
@@ -160,15 +157,14 @@ class Names(object):
                 )
         return name
 
-    @classmethod
-    def a_feminine_name_starting_with(cls, letter, year):
+    def a_feminine_name_starting_with(self, letter, year):
         """Return a random feminine name starting with the given letter and befitting the given year."""
         if year < 1880:
             year = 1880
         decade = int(math.floor(year/10)*10)  # Determine the current decade
-        x = random.random()
+        x = self.random.random()
         # Choose using the actual distribution of American names this decade
-        probability_distribution_for_this_decade = cls.names_by_decade[decade]['F']
+        probability_distribution_for_this_decade = self.names_by_decade[decade]['F']
         try:
             name = next(
                 name for name in probability_distribution_for_this_decade if
@@ -177,16 +173,16 @@ class Names(object):
                 name[0].lower() == letter[0]
             )
         except StopIteration:
-            if random.random() < 0.5:
+            if self.random.random() < 0.5:
                 # Choose any miscellaneous name starting with the same letter
                 names_that_start_with_that_letter = [
-                    name for name in cls.miscellaneous_feminine_forenames if
+                    name for name in self.miscellaneous_feminine_forenames if
                     name[0].lower() == letter.lower()
                 ]
-                name = random.choice(names_that_start_with_that_letter)
+                name = self.random.choice(names_that_start_with_that_letter)
             else:
                 # Choose any name befitting the era of the person's birth
-                x = random.random()
+                x = self.random.random()
                 name = next(
                     name for name in probability_distribution_for_this_decade if
                     probability_distribution_for_this_decade[name][0] <= x <=
@@ -194,26 +190,25 @@ class Names(object):
                 )
         return name
 
-    @classmethod
-    def a_surname_sounding_like(cls, source_name):
+    def a_surname_sounding_like(self, source_name):
         """Return a random surname that sounds like the source name."""
         ethnicities = (
-            cls.english_surnames, cls.french_surnames, cls.german_surnames,
-            cls.irish_surnames, cls.scandinavian_surnames
+            self.english_surnames, self.french_surnames, self.german_surnames,
+            self.irish_surnames, self.scandinavian_surnames
         )
         if '-' in source_name:
             # ButcherShop one component of the hyphenated name
             names_derived_from = source_name.split('-')
-            component_to_butcher = random.choice(names_derived_from)
+            component_to_butcher = self.random.choice(names_derived_from)
             if component_to_butcher == names_derived_from[0]:
                 return '{}-{}'.format(
-                    cls.a_surname_sounding_like(source_name=component_to_butcher),
+                    self.a_surname_sounding_like(source_name=component_to_butcher),
                     names_derived_from[1]
                 )
             else:
                 return '{}-{}'.format(
                     names_derived_from[0],
-                    cls.a_surname_sounding_like(source_name=component_to_butcher)
+                    self.a_surname_sounding_like(source_name=component_to_butcher)
                 )
         names_of_the_same_ethnicity = next(
             ethnicity for ethnicity in ethnicities if str(source_name) in ethnicity
@@ -225,28 +220,25 @@ class Names(object):
             )
         except StopIteration:
             try:
-                name = random.choice(names_of_the_same_ethnicity)
+                name = self.random.choice(names_of_the_same_ethnicity)
             except StopIteration:
                 all_surnames_that_start_with_that_letter = [
-                    name for name in cls.all_surnames if name[0].lower() == source_name[0].lower()
+                    name for name in self.all_surnames if name[0].lower() == source_name[0].lower()
                 ]
-                name = random.choice(all_surnames_that_start_with_that_letter)
+                name = self.random.choice(all_surnames_that_start_with_that_letter)
         return name
 
-    @classmethod
-    def a_place_name(cls):
+    def a_place_name(self):
         """Return a random place name."""
-        return random.choice(cls.place_names)
+        return self.random.choice(self.place_names)
 
-    @classmethod
-    def a_restaurant_name(cls):
+    def a_restaurant_name(self):
         """Return a random restaurant name."""
-        return random.choice(cls.restaurant_names)
+        return self.random.choice(self.restaurant_names)
 
-    @classmethod
-    def a_bar_name(cls):
+    def a_bar_name(self):
         """Return a random bar name."""
-        return random.choice(cls.bar_names)
+        return self.random.choice(self.bar_names)
 
 
 class GravestoneDetails(object):
@@ -260,12 +252,17 @@ class GravestoneDetails(object):
         open(os.getcwd()+'/corpora/gravestone_epitaphs.txt', 'r').read().split('\n\n')
     )
 
-    @classmethod
-    def a_header(cls):
+    def __init__(self, rng):
+        """Initialize a GravestoneDetails object.
+
+        @param rng: The random number generator (i.e., a random.Random) to draw details with.
+        """
+        self.random = rng
+
+    def a_header(self):
         """Return a random gravestone header."""
-        return random.choice(cls.headers)
+        return self.random.choice(self.headers)
 
-    @classmethod
-    def an_epitaph(cls):
+    def an_epitaph(self):
         """Return a random gravestone epitaph."""
-        return random.choice(cls.epitaphs)
\ No newline at end of file
+        return self.random.choice(self.epitaphs)
\ No newline at end of file
@@ -1,7 +1,5 @@
-import random
 from name import Name
 from person import Person
-from corpora import Names
 from residence import House
 from artifact import WeddingRing
 
@@ -27,7 +25,8 @@ class Event(object):
             self.date = game.date
         # Also request and attribute an event number, so that we can later
         # determine the precise ordering of events that happen on the same timestep
-        self.event_number = game.assign_event_number(new_event=self)
+        self.event_number = game.assign_event_number()
+        game.events.append(self)
 
 
 class Adoption(Event):
@@ -117,7 +116,7 @@ class Birth(Event):
         config = self.subject.game.config
         baby = self.subject
         if (
-            random.random() < config.chance_son_inherits_fathers_exact_name and
+            self.subject.game.random.random() < config.chance_son_inherits_fathers_exact_name and
             baby.male and
             not(any(bro for bro in baby.brothers if bro.first_name == self.father.first_name))
         ):
@@ -190,15 +189,15 @@ class Birth(Event):
     def _decide_first_name(self, potential_namegivers):
         """Return what will be the baby's first name."""
         config = self.subject.game.config
-        if potential_namegivers and random.random() < config.chance_child_inherits_first_name:
-            first_name_namegiver = random.choice(potential_namegivers)
+        if potential_namegivers and self.subject.game.random.random() < config.chance_child_inherits_first_name:
+            first_name_namegiver = self.subject.game.random.choice(potential_namegivers)
             first_name = first_name_namegiver.first_name
         else:
             first_name_namegiver = None
             if self.subject.male:
-                first_name_rep = Names.a_masculine_name(year=self.year)
+                first_name_rep = self.subject.game.names.a_masculine_name(year=self.year)
             else:
-                first_name_rep = Names.a_feminine_name(year=self.year)
+                first_name_rep = self.subject.game.names.a_feminine_name(year=self.year)
             first_name = Name(
                 value=first_name_rep, progenitor=self.subject, conceived_by=self.subject.parents, derived_from=()
             )
@@ -207,15 +206,15 @@ class Birth(Event):
     def _decide_middle_name(self, potential_namegivers):
         """Return what will be the baby's first name."""
         config = self.subject.game.config
-        if potential_namegivers and random.random() < config.chance_child_inherits_middle_name:
-            middle_name_namegiver = random.choice(potential_namegivers)
+        if potential_namegivers and self.subject.game.random.random() < config.chance_child_inherits_middle_name:
+            middle_name_namegiver = self.subject.game.random.choice(potential_namegivers)
             middle_name = middle_name_namegiver.first_name
         else:
             middle_name_namegiver = None
             if self.subject.male:
-                middle_name_rep = Names.a_masculine_name(year=self.year)
+                middle_name_rep = self.subject.game.names.a_masculine_name(year=self.year)
             else:
-                middle_name_rep = Names.a_feminine_name(year=self.year)
+                middle_name_rep = self.subject.game.names.a_feminine_name(year=self.year)
             middle_name = Name(
                 value=middle_name_rep, progenitor=self.subject, conceived_by=self.subject.parents, derived_from=()
             )
@@ -224,6 +223,7 @@ class Birth(Event):
     def _get_potential_male_namegivers(self):
         """Return a set of men on the father's side of the family whom the child may be named for."""
         config = self.subject.game.config
+        rng = self.subject.game.random
         namegivers = []
         for parent in self.subject.parents:
             # Add the child's legal father
@@ -237,13 +237,14 @@ class Birth(Event):
                 if parent.mother.father:
                     namegivers += [parent.mother.father] * config.frequency_of_naming_after_greatgrandfather
             # Add a random sampling child's uncles and great uncles
-            namegivers += random.sample(parent.brothers, random.randint(0, len(parent.brothers)))
-            namegivers += random.sample(parent.uncles, random.randint(0, len(parent.uncles)))
+            namegivers += rng.sample(parent.brothers, rng.randint(0, len(parent.brothers)))
+            namegivers += rng.sample(parent.uncles, rng.randint(0, len(parent.uncles)))
         return namegivers
 
     def _get_potential_female_namegivers(self):
         """Return a set of women on the father's side of the family whom the child may be named for."""
         config = self.subject.game.config
+        rng = self.subject.game.random
         namegivers = []
         for parent in self.subject.parents:
             # Add the child's mother
@@ -257,8 +258,8 @@ class Birth(Event):
                 if parent.mother.mother:
                     namegivers += [parent.mother.mother] * config.frequency_of_naming_after_greatgrandmother
             # Add a random sampling child's aunts and great aunts
-            namegivers += random.sample(parent.sisters, random.randint(0, len(parent.sisters)))
-            namegivers += random.sample(parent.aunts, random.randint(0, len(parent.aunts)))
+            namegivers += rng.sample(parent.sisters, rng.randint(0, len(parent.sisters)))
+            namegivers += rng.sample(parent.aunts, rng.randint(0, len(parent.aunts)))
         return namegivers
 
     def _get_suffix(self):
@@ -280,7 +281,7 @@ class Birth(Event):
         if not self.city.businesses_of_type('DayCare'):
             self.mother.occupation.terminate(reason=self)
         else:
-            if random.random() < self.mother.game.config.chance_new_mother_quits_job_even_if_day_care_in_town:
+            if self.mother.game.random.random() < self.mother.game.config.chance_new_mother_quits_job_even_if_day_care_in_town:
                 self.mother.occupation.terminate(reason=self)
 
     def _remunerate(self):
@@ -375,11 +376,10 @@ class BusinessClosure(Event):
         business.closed = self.year
         for employee in list(business.employees):
             LayOff(subject=employee.person, company=business, occupation=employee)
-        self.city.companies.remove(business)
-        self.city.former_companies.add(business)
+        self.city.remove_company(business)
         # Demolish the building -- TODO reify buildings separately from companies
         if self.city.businesses_of_type('ConstructionFirm'):
-            demolition_company = random.choice(self.city.businesses_of_type('ConstructionFirm'))
+            demolition_company = self.city.game.random.choice(self.city.businesses_of_type('ConstructionFirm'))
         else:
             demolition_company = None
         Demolition(building=business, demolition_company=demolition_company, reason=self)
@@ -430,6 +430,8 @@ class Death(Event):
         # Update attributes of this person's home
         subject.home.residents.remove(subject)
         subject.home.former_residents.add(subject)
+        self.city.update_vacancy_of_home(subject.home)
+        self.city.update_employment_status(subject, *subject.parents)
         if subject in subject.home.owners:
             subject.home.owners.remove(subject)
             if subject.home.residents and not subject.home.owners:
@@ -507,14 +509,17 @@ class Demolition(Event):
         building.demolition = self
         building.lot.building = None
         building.lot.former_buildings.append(building)
+        self.city.update_vacancy_of_lot(building.lot)
         # If this is a dwelling place, have its now-displaced residents find new housing
         if building.__class__.__name__ is 'House':
             self.city.dwelling_places.remove(building)
+            self.city.update_vacancy_of_home(building)
             if building.residents:
                 self._have_the_now_displaced_residents_move(house_or_apartment_unit=building)
         if building.__class__.__name__ is 'ApartmentComplex':
             for unit in building.units:
                 self.city.dwelling_places.remove(unit)
+                self.city.update_vacancy_of_home(unit)
                 if unit.residents:
                     self._have_the_now_displaced_residents_move(house_or_apartment_unit=unit)
 
@@ -556,6 +561,8 @@ class Departure(Event):
         self.subject.go_to(destination=None)
         self.subject.home.residents.remove(self.subject)
         self.subject.home.former_residents.add(self.subject)
+        subject.city.update_vacancy_of_home(self.subject.home)
+        subject.city.update_employment_status(subject, *subject.parents)
         # Update .neighbor attributes for subject and for their now former neighbors
         self._update_neighbor_attributes()
 
@@ -675,11 +682,11 @@ class Divorce(Event):
     def _have_divorcees_fall_out_of_love(divorcees, config):
         """Make the divorcees (probably) lose each other as their strongest love interests."""
         spouse1, spouse2 = divorcees
-        if random.random() < config.chance_a_divorcee_falls_out_of_love:
+        if spouse1.game.random.random() < config.chance_a_divorcee_falls_out_of_love:
             spouse1.relationships[spouse2].spark = (
                 config.new_spark_value_for_divorcee_who_has_fallen_out_of_love
             )
-        if random.random() < config.chance_a_divorcee_falls_out_of_love:
+        if spouse1.game.random.random() < config.chance_a_divorcee_falls_out_of_love:
             spouse2.relationships[spouse1].spark = (
                 config.new_spark_value_for_divorcee_who_has_fallen_out_of_love
             )
@@ -697,7 +704,7 @@ class Divorce(Event):
         chance_of_a_name_reversion = config.function_to_derive_chance_spouse_changes_name_back(
             years_married=self.marriage.duration
         )
-        if random.random() < chance_of_a_name_reversion:
+        if self.subjects[0].game.random.random() < chance_of_a_name_reversion:
             for name_change in self.marriage.name_changes:
                 name_change.subject.change_name(
                     new_last_name=name_change.old_last_name, reason=self
@@ -722,12 +729,12 @@ class Divorce(Event):
         spouse1, spouse2 = self.subjects
         config = spouse1.game.config
         if spouse1.male:
-            if random.random() < config.chance_a_male_divorcee_is_one_who_moves_out:
+            if self.subjects[0].game.random.random() < config.chance_a_male_divorcee_is_one_who_moves_out:
                 spouse_who_will_move_out = spouse1
             else:
                 spouse_who_will_move_out = spouse2
         elif spouse2.male:
-            if random.random() < config.chance_a_male_divorcee_is_one_who_moves_out:
+            if self.subjects[0].game.random.random() < config.chance_a_male_divorcee_is_one_who_moves_out:
                 spouse_who_will_move_out = spouse2
             else:
                 spouse_who_will_move_out = spouse2
@@ -1039,9 +1046,9 @@ class Marriage(Event):
             spouse_who_may_take_name = self.subjects[0]
         other_spouse = next(newlywed for newlywed in self.subjects if newlywed is not spouse_who_may_take_name)
         if spouse_who_may_take_name.last_name is not other_spouse.last_name:
-            if random.random() < config.chance_one_newlywed_takes_others_name:
+            if self.subjects[0].game.random.random() < config.chance_one_newlywed_takes_others_name:
                 spouse_who_may_take_name.change_name(new_last_name=other_spouse.last_name, reason=self)
-        if random.random() < config.chance_stepchildren_take_stepparent_name:
+        if self.subjects[0].game.random.random() < config.chance_stepchildren_take_stepparent_name:
             for stepchild in spouse_who_may_take_name.kids:
                 if stepchild.age <= config.age_after_which_stepchildren_will_not_take_stepparent_name:
                     stepchild.change_name(new_last_name=other_spouse.last_name, reason=self)
@@ -1055,7 +1062,7 @@ class Marriage(Event):
             config = self.subjects[0].game.config
             if any(s for s in self.subjects if s.last_name.hyphenated):
                 choice = False
-            elif random.random() < config.chance_newlyweds_decide_children_will_get_hyphenated_surname:
+            elif self.subjects[0].game.random.random() < config.chance_newlyweds_decide_children_will_get_hyphenated_surname:
                 choice = True
             else:
                 choice = False
@@ -1137,13 +1144,17 @@ class Move(Event):
             if person.home:
                 person.home.residents.remove(person)
                 person.home.former_residents.add(person)
+                person.home.city.update_vacancy_of_home(person.home)
             # Move into new home
             person.home = new_home
             new_home.residents.add(person)
+            new_home.city.update_vacancy_of_home(new_home)
             person.moves.append(self)
             # Add yourself to city residents, if you moved from outside the city
             person.city = person.game.city
             person.game.city.residents.add(person)
+            # Moving may change whether this person, or their mother, counts as unemployed
+            person.game.city.update_employment_status(person, *person.parents)
             # Go to your new home
             person.go_to(destination=new_home, occasion='home')
         # Update .neighbor attributes for subjects, as well as their new and now former neighbors
@@ -1269,6 +1280,7 @@ class Retirement(Event):
         self.subject = subject
         self.subject.retired = True
         self.subject.retirement = self
+        self.subject.city.update_employment_status(self.subject)
         self.occupation = self.subject.occupation
         self.company = self.subject.occupation.company
         self.occupation.terminus = self
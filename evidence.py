@@ -1,18 +1,30 @@
-import random
+import collections
+import weakref
 
 
 class PieceOfEvidence(object):
-    """A superclass that all evidence subclasses inherit from."""
+    """A superclass that all evidence subclasses inherit from.
+
+    Evidence is the most numerous kind of object in a simulation (every observation, statement,
+    and so forth is one), so its classes declare fixed slots rather than giving each instance a
+    dictionary of attributes; each subclass names its type as a class attribute, likewise.
+    """
+    __slots__ = (
+        'location', 'date', 'ordinal_date', 'event_number', 'subject', 'source', 'recipient',
+        'eavesdropper', 'artifact', 'attribute_transferred', 'beliefs_evidenced', 'base_strength',
+        '__weakref__'  # Allows an evidence log to hold evidence without keeping it alive
+    )
+    type = None  # Gets overridden by each subclass
 
     def __init__(self, subject, source):
         """Initialize a PieceOfEvidence object."""
-        self.type = self.__class__.__name__.lower()
         self.location = source.location
         self.date = source.game.date
         self.ordinal_date = source.game.ordinal_date
         # Also request and attribute an event number, so that we can later
         # determine the precise ordering of events that happen on the same timestep
-        self.event_number = source.game.assign_event_number(new_event=self)
+        self.event_number = source.game.assign_event_number()
+        source.game.evidence_log.record(self)
         self.subject = subject
         self.source = source
         self.recipient = None  # Will get overwritten in case of Lie, Statement, Declaration, Eavesdropping
@@ -106,7 +118,7 @@ class PieceOfEvidence(object):
         # the strength of the source's belief at the time of telling
         if this_is_propagation:
             if self.type == 'lie':
-                teller_belief_strength = random.randint(1, 300)  # TODO maybe model lying ability here?
+                teller_belief_strength = source.game.knowledge_random.randint(1, 300)  # TODO maybe model lying ability here?
             else:
                 teller_belief_facet = source.mind.mental_models[subject].get_facet_to_this_belief_of_type(
                     feature_type=feature_type
@@ -149,6 +161,8 @@ class Implant(PieceOfEvidence):
     actually be considered realistic, since it simulates other people in owner's
     life who *did* know subject telling owner about them.
     """
+    __slots__ = ('total_interactions', 'salience_of_subject')
+    type = "implant"
 
     def __init__(self, subject, source, total_interactions, salience_of_subject):
         """Initialize a Reflection object."""
@@ -195,6 +209,8 @@ class Implant(PieceOfEvidence):
 
 class Reflection(PieceOfEvidence):
     """A reflection by which one person perceives something about themself."""
+    __slots__ = ()
+    type = "reflection"
 
     def __init__(self, subject, source):
         """Initialize a Reflection object."""
@@ -206,6 +222,8 @@ class Reflection(PieceOfEvidence):
 
 class Observation(PieceOfEvidence):
     """An observation by which one person perceives something about another person."""
+    __slots__ = ()
+    type = "observation"
 
     def __init__(self, subject, source):
         """Initialize an Observation object."""
@@ -226,6 +244,8 @@ class Observation(PieceOfEvidence):
 
 class Examination(PieceOfEvidence):
     """An examination of an artifact that transmits knowledge about some entity."""
+    __slots__ = ()
+    type = "examination"
 
     def __init__(self, subject, source, artifact):
         """Initialize an Observation object."""
@@ -242,6 +262,8 @@ class Confabulation(PieceOfEvidence):
     but then concoct other things about this person that no one told them), or when they confabulate
     a new value for an attribute whose true value they had forgotten.
     """
+    __slots__ = ()
+    type = "confabulation"
 
     def __init__(self, subject, source):
         """Initialize a Confabulation object."""
@@ -250,6 +272,8 @@ class Confabulation(PieceOfEvidence):
 
 class Lie(PieceOfEvidence):
     """A lie by which one person invents and conveys knowledge about someone that they know is false."""
+    __slots__ = ()
+    type = "lie"
 
     def __init__(self, subject, source, recipient):
         """Initialize a Lie object."""
@@ -259,6 +283,8 @@ class Lie(PieceOfEvidence):
 
 class Statement(PieceOfEvidence):
     """A statement by which one person conveys knowledge about someone that they believe is true."""
+    __slots__ = ()
+    type = "statement"
 
     def __init__(self, subject, source, recipient):
         """Initialize a Statement object."""
@@ -271,6 +297,8 @@ class Declaration(PieceOfEvidence):
 
     See source [6] for evidence that this is realistic.
     """
+    __slots__ = ()
+    type = "declaration"
 
     def __init__(self, subject, source, recipient):
         """Initialize a Declaration object."""
@@ -280,6 +308,8 @@ class Declaration(PieceOfEvidence):
 
 class Eavesdropping(PieceOfEvidence):
     """An eavesdropping by which one person overhears the information being conveyed by a statement or lie."""
+    __slots__ = ()
+    type = "eavesdropping"
 
     def __init__(self, subject, source, recipient, eavesdropper):
         """Initialize an Eavesdropping object."""
@@ -290,6 +320,8 @@ class Eavesdropping(PieceOfEvidence):
 
 class Mutation(PieceOfEvidence):
     """A mutation by which a person misremembers knowledge from time passing (i.e., changes an attribute's value)."""
+    __slots__ = ('mutated_belief_str',)
+    type = "mutation"
 
     def __init__(self, subject, source, mutated_belief_str):
         """Initialize a Mutation object."""
@@ -300,6 +332,8 @@ class Mutation(PieceOfEvidence):
 class Transference(PieceOfEvidence):
     """A transference by which a person unintentionally transposes another person's attribute onto their model
     of someone else."""
+    __slots__ = ()
+    type = "transference"
 
     def __init__(self, subject, source, belief_facet_transferred_from):
         """Initialize a Transference object.
@@ -320,6 +354,8 @@ class Forgetting(PieceOfEvidence):
     should only be attributed as evidence to Belief.Facets that are represented as an empty
     string.
     """
+    __slots__ = ()
+    type = "forgetting"
 
     def __init__(self, subject, source):
         """Initialize a Forgetting object.
@@ -327,4 +363,76 @@ class Forgetting(PieceOfEvidence):
         @param subject: The person to whom this knowledge pertains.
         @param source: The person doing the forgetting.
         """
-        super(Forgetting, self).__init__(subject=subject, source=source)
\ No newline at end of file
+        super(Forgetting, self).__init__(subject=subject, source=source)
+
+
+class EvidenceLog(object):
+    """A log of the pieces of evidence that have been created in a game, in the order of their event numbers.
+
+    Evidence is created far more often than real life events (every observation, statement,
+    deterioration, and so forth is a piece of evidence), so it is logged here rather than in
+    Game.events, and the log may retain only some of it (see config.evidence_retention); evidence
+    that the log lets go of lives on for as long as belief facets reference it, and its event
+    number still orders it among the evidence for those facets (as in Facet.why()).
+    """
+
+    def __init__(self, retention='all', capacity=None):
+        """Initialize an EvidenceLog object.
+
+        @param retention: Which evidence to retain: 'all' of it, only the evidence that is still
+                          'referenced' by something else (namely, by belief facets), or the
+                          most 'recent' evidence.
+        @param capacity: With 'recent' retention, how many of the most recent pieces of evidence to retain.
+        """
+        if retention not in ('all', 'referenced', 'recent'):
+            raise Exception("Unknown evidence retention policy: {}".format(retention))
+        if retention == 'recent' and not capacity:
+            raise Exception("An evidence log with 'recent' retention requires a capacity.")
+        self.retention = retention
+        self.capacity = capacity if retention == 'recent' else None
+        # With 'referenced' retention, this holds weak references, which get pruned as their evidence dies
+        self._log = collections.deque(maxlen=self.capacity)
+        self._records_since_pruning = 0
+
+    def __getstate__(self):
+        """Return the state of this object for pickling (as when a game is snapshotted)."""
+        return {'retention': self.retention, 'capacity': self.capacity, 'evidence': list(self)}
+
+    def __setstate__(self, state):
+        """Restore this object from its pickled state."""
+        self.__init__(retention=state['retention'], capacity=state['capacity'])
+        for piece_of_evidence in state['evidence']:
+            self.record(piece_of_evidence)
+
+    def __iter__(self):
+        """Iterate over the retained evidence, in order of event number."""
+        if self.retention == 'referenced':
+            return (piece_of_evidence for piece_of_evidence in (ref() for ref in self._log) if piece_of_evidence)
+        return iter(self._log)
+
+    def __len__(self):
+        """Return the number of pieces of evidence retained (with 'referenced' retention, an upper bound)."""
+        return len(self._log)
+
+    def record(self, piece_of_evidence):
+        """Record a new piece of evidence."""
+        if self.retention == 'referenced':
+            self._log.append(weakref.ref(piece_of_evidence))
+            # Prune the references to dead evidence once as many new references have been
+            # recorded as were live at the last pruning, which keeps this amortized O(1)
+            self._records_since_pruning += 1
+            if self._records_since_pruning > len(self._log) / 2:
+                self.prune()
+        else:
+            self._log.append(piece_of_evidence)
+
+    def prune(self):
+        """Drop the references to evidence that no longer exists (only applies to 'referenced' retention)."""
+        if self.retention == 'referenced':
+            self._log = collections.deque(ref for ref in self._log if ref() is not None)
+            self._records_since_pruning = 0
+
+    def clear(self):
+        """Let go of all the logged evidence."""
+        self._log.clear()
+        self._records_since_pruning = 0
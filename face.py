@@ -1,6 +1,3 @@
-import random
-
-
 class Face(object):
     """A person's face."""
 
@@ -33,7 +30,7 @@ class Face(object):
         config = self.person.game.config
         feature_will_get_inherited = (
             self.person.biological_mother and
-            random.random() < config.facial_feature_type_heritability[feature_type]
+            self.person.game.random.random() < config.facial_feature_type_heritability[feature_type]
         )
         if feature_will_get_inherited:
             takes_after = self._determine_whom_feature_gets_inherited_from(feature_type=feature_type)
@@ -75,18 +72,18 @@ class Face(object):
             distribution = config.facial_feature_distributions_male[feature_type]
         else:
             distribution = config.facial_feature_distributions_female[feature_type]
-        x = random.random()
+        x = self.person.game.random.random()
         type_str = next(  # See config.py to understand what this is doing
             feature_type[1] for feature_type in distribution if feature_type[0][0] < x < feature_type[0][1]
         )
-        variant_id = int(random.random() * 1000)
+        variant_id = int(self.person.game.random.random() * 1000)
         return type_str, variant_id
 
     def _determine_whom_feature_gets_inherited_from(self, feature_type):
         """Determine whom this person will inherit this facial feature from."""
         config = self.person.game.config
         # Some features are more likely to be inherited from a parent/grandparent of the same sex
-        if random.random() < config.facial_feature_chance_inheritance_according_to_sex[feature_type]:
+        if self.person.game.random.random() < config.facial_feature_chance_inheritance_according_to_sex[feature_type]:
             if self.person.male:
                 possible_sources = (  # Two chances to inherit from father, one from maternal grandfather
                     self.person.biological_father, self.person.biological_father,
@@ -100,19 +97,19 @@ class Face(object):
         else:
             possible_sources = (self.person.biological_father, self.person.biological_mother)
         possible_sources = [source for source in possible_sources if source]  # Remove non-existent grandparents
-        takes_after = random.choice(possible_sources)
+        takes_after = self.person.game.random.choice(possible_sources)
         return takes_after
 
     def _determine_graphical_variant_of_this_feature(self, takes_after, feature_type):
         config = self.person.game.config
-        if random.random() < config.facial_feature_variant_heritability[feature_type]:
+        if self.person.game.random.random() < config.facial_feature_variant_heritability[feature_type]:
             # Inherit the exact graphical variant that that parent/grandparent has
             variant_id = self._get_persons_feature_variant_of_type(
                 person=takes_after, feature_type=feature_type
             )
             exact_variant_inherited = True
         else:
-            variant_id = int(random.random() * 1000)  # Generate a seed for which variant gets selected
+            variant_id = int(self.person.game.random.random() * 1000)  # Generate a seed for which variant gets selected
             exact_variant_inherited = False
         return variant_id, exact_variant_inherited
 
@@ -197,7 +194,7 @@ class Skin(object):
                     self.face.person.game.config.child_skin_color_given_parents[parent_skin_color_tuple]
                 )
             self.color = Feature(
-                value=skin_color, variant_id=int(random.random() * 1000),
+                value=skin_color, variant_id=int(self.face.person.game.random.random() * 1000),
                 inherited_from=None, exact_variant_inherited=False
             )
         else:  # Generate from population distribution
@@ -231,7 +228,7 @@ class Eyebrows(object):
         """Initialize a Eyebrows object."""
         self.face = face
         self.size = self.face.determine_facial_feature(feature_type="eyebrow size")
-        if random.random() < self.face.person.game.config.chance_eyebrows_are_same_color_as_hair:
+        if self.face.person.game.random.random() < self.face.person.game.config.chance_eyebrows_are_same_color_as_hair:
             self.color = self.face.hair.color
         else:
             self.color = self.face.determine_facial_feature(feature_type="eyebrow color")
@@ -330,6 +327,6 @@ class Feature(str):
         self.inherited_from = inherited_from
         self.exact_variant_inherited = exact_variant_inherited
 
-    def __new__(cls, value, variant_id, inherited_from, exact_variant_inherited):
-        """Do str stuff."""
+    def __new__(cls, value, variant_id=None, inherited_from=None, exact_variant_inherited=None):
+        """Do str stuff (the other arguments may be omitted, as when unpickling)."""
         return str.__new__(cls, value)
\ No newline at end of file
@@ -3,21 +3,57 @@ from productionist import Productionist
 from person import *
 from business import *
 from city import *
+from corpora import Names, GravestoneDetails
+from profiler import Profiler
+from vocabulary import Vocabulary
+from evidence import EvidenceLog
+import snapshot
+import archive
 import datetime
+import hashlib
+import heapq
+import math
+import random
 
 
 class Game(object):
     """A gameplay instance."""
 
-    def __init__(self):
-        """Initialize a Game object."""
-        # Load the NLG module for this game instance
+    def __init__(self, seed=None):
+        """Initialize a Game object.
+
+        @param seed: A seed for this game's random number generator; the same seed will
+                     produce the same town (leave as None to seed from system entropy).
+        """
         self.config = Config()
+        # Prepare this game's own random number generator, which every subsystem draws
+        # from (rather than the global one), so that a seeded game is reproducible
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.random_streams = {}
+        # These subsystems may instead draw from streams of their own (see
+        # config.separate_random_streams_per_subsystem); the dialogue stream
+        # is held by the Productionist object below
+        self.names = Names(rng=self.random_stream('names'))
+        self.gravestone_details = GravestoneDetails(rng=self.random_stream('names'))
+        self.knowledge_random = self.random_stream('knowledge')
+        self.routine_random = self.random_stream('routine')
+        # Prepare a profiler that can count calls to each phase of the simulation (see config.profile_simulation)
+        self.profiler = Profiler(game=self)
+        if self.config.profile_simulation:
+            self.profiler.enable()
+        # Load the NLG module for this game instance
         self.productionist = Productionist(game=self)
         # This gets incremented each time a new person is born/generated,
         # which affords a persistent ID for each person
         self.current_person_id = 0
         self.current_place_id = 0
+        # Likewise for the streets, parcels, blocks, and lots of this game's city, whose IDs determine how
+        # collections of them iterate, and so must not depend on what else has run in this process
+        self.current_street_id = 0
+        self.current_parcel_id = 0
+        self.current_block_id = 0
+        self.current_lot_id = 0
         self.year = self.config.date_worldgen_begins[0]
         self.true_year = self.config.date_worldgen_begins[0]  # True year never gets changed during retconning
         self.ordinal_date = datetime.date(*self.config.date_worldgen_begins).toordinal()  # Days since 01-01-0001
@@ -29,9 +65,39 @@ class Game(object):
         self.time_of_day = "day"
         self.date = self.get_date()
         self.city = None
-        # Prepare a listing of all in-game events, which will facilitate debugging later
+        # A heap of (due date, mother ID, mother) entries, one for each pregnancy, that lets births be
+        # found without surveying every resident (see schedule_birth() and simulate_births()); entries
+        # for mothers who have since given birth, died, or departed get discarded as they're come upon
+        self.pregnancies = []
+        # The types of business that are era-appropriate in each year, which get tabulated the first
+        # time a business might open in that year (see _business_types_of_this_era())
+        self.business_types_by_year = {}
+        # A counter of the timesteps on which people have socialized, which relationships stamp
+        # themselves with upon each interaction (see Relationship.interacted_this_timestep)
+        self.interaction_timestep = 0
+        # An index of who is where on the current timestep, mapping occupied locations to a tuple of the
+        # people there and a tuple of those of them who are old enough to be socialized with, which
+        # observation and socializing read rather than copying people_here_now sets over and over (see
+        # occupants()); entries get built as needed (and for every occupied location by index_who_is_where(),
+        # once routines have been enacted on a hi-fi timestep), and get dropped whenever someone comes or
+        # goes (see Person.go_to()) and, since birthdays change who is old enough, whenever time advances
+        self.occupancy_index = {}
+        self.last_lo_fi_simulated_day = None  # Gets set by enact_lo_fi_simulation()
+        self.knowledge_implanted = False  # Gets set by simulate_until_gameplay_begins()
+        self.knowledge_archive = None  # Gets set by archive_knowledge()
+        # Prepare an interning table for the strings that knowledge is made of (feature types and
+        # feature values), which lets many belief facets share them and lets them be encoded as codes
+        self.vocabulary = Vocabulary(strings=sorted(self.config.chance_of_memory_deterioration_on_a_given_timestep))
+        # The feature type of beliefs about someone's whereabouts on the current timestep, along with the
+        # (ordinal date, time of day) it was formatted for (see whereabouts_feature_type())
+        self.whereabouts_feature_type_of_timestep = (None, None)
+        # Prepare a listing of all in-game events, which will facilitate debugging later, and a
+        # separate log of the pieces of evidence behind people's knowledge (see config.evidence_retention)
         self.events = []
-        # A game's event number allows the precise ordering of events that
+        self.evidence_log = EvidenceLog(
+            retention=self.config.evidence_retention, capacity=self.config.evidence_log_capacity
+        )
+        # A game's event number allows the precise ordering of events (and pieces of evidence) that
         # happened on the same timestep -- every time an event happens, it requests an
         # event number from Game.assign_event_number(), which also increments the running counter
         self.event_number = -1
@@ -43,32 +109,142 @@ class Game(object):
         # Prepare a number that will hold a single random number that is generated daily -- this
         # facilitates certain things that should be determined randomly but remain constant across
         # a timestep, e.g., whether a person locked their door before leaving home
-        self.random_number_this_timestep = random.random()
+        self.random_number_this_timestep = self.random.random()
         # self.establish_setting()
         # self._sim_and_save_a_week_of_timesteps()
         self.weather = None
 
+    def random_stream(self, subsystem):
+        """Return the random number generator that the given subsystem should draw from.
+
+        Unless the config asks for separate streams per subsystem, this is just the game's
+        main generator; otherwise, it is a generator seeded deterministically from the game's
+        seed and the subsystem's name, so that changes to how much randomness one subsystem
+        consumes will not perturb the others.
+
+        @param subsystem: A string naming the subsystem, e.g., 'names' or 'knowledge'.
+        """
+        if not self.config.separate_random_streams_per_subsystem:
+            return self.random
+        if subsystem not in self.random_streams:
+            if self.seed is None:
+                subsystem_seed = self.random.getrandbits(64)
+            else:
+                subsystem_seed = int(hashlib.md5('{}:{}'.format(self.seed, subsystem)).hexdigest(), 16)
+            self.random_streams[subsystem] = random.Random(subsystem_seed)
+        return self.random_streams[subsystem]
+
     @property
     def random_person(self):
         """Return a random person living in the city of this gameplay instance."""
-        return random.choice(list(self.city.residents))
+        return self.random.choice(list(self.city.residents))
 
     @property
     def random_company(self):
         """Return a random company in the city of this gameplay instance."""
-        return random.choice(list(self.city.companies))
+        return self.random.choice(list(self.city.companies))
 
     def recent_events(self):
-        """Pretty-print the last five in-game events (for debugging purposes)."""
+        """Pretty-print the last five in-game life events (for debugging purposes)."""
         for recent_event in self.events[-5:]:
             print recent_event
 
+    def __getstate__(self):
+        """Return the state of this object for pickling (as when it is snapshotted), which leaves out its profiler."""
+        state = dict(self.__dict__)
+        del state['profiler']
+        for method_name in Profiler.phases:
+            # Leave out any phase methods that the profiler has wrapped on this instance
+            state.pop(method_name, None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore this object from its pickled state, with a fresh profiler."""
+        self.__dict__.update(state)
+        self.profiler = Profiler(game=self)
+        if self.config.profile_simulation:
+            self.profiler.enable()
+
     def establish_setting(self):
         """Establish the city in which this gameplay instance will take place."""
-        # Generate a city plan with at least two tracts
+        self.found_city()
+        self.simulate_until_gameplay_begins()
+
+    def simulate_until_gameplay_begins(self):
+        """Simulate from the current date up to the night in question, on which gameplay begins.
+
+        This picks up from wherever the simulation is currently, and so it may also be used to
+        resume world generation from a snapshot (see config.dates_to_snapshot_world).
+        """
+        config = self.config
+        # Simulate to a week before gameplay, stopping along the way to snapshot the world as requested
+        ordinal_date_that_hi_fi_sim_begins = self.ordinal_date_that_gameplay_begins - 7
+        dates_to_snapshot_world = [date for date in config.dates_to_snapshot_world if date != 'hi-fi']
+        for date in sorted(dates_to_snapshot_world):
+            ordinal_date_to_snapshot_world = datetime.date(*date).toordinal()
+            if self.ordinal_date < ordinal_date_to_snapshot_world <= ordinal_date_that_hi_fi_sim_begins:
+                n_days_until_snapshot = ordinal_date_to_snapshot_world - self.ordinal_date
+                self.enact_lo_fi_simulation(n_timesteps=n_days_until_snapshot*2)
+                self.save_snapshot()
+        if self.ordinal_date < ordinal_date_that_hi_fi_sim_begins:
+            n_days_until_hi_fi_sim_begins = ordinal_date_that_hi_fi_sim_begins - self.ordinal_date
+            self.enact_lo_fi_simulation(n_timesteps=n_days_until_hi_fi_sim_begins*2)
+        # Implant knowledge into everyone who is living to simulate knowledge
+        # phenomena that would have occurred during the lo-fi simulation but
+        # wasn't enacted due to reasons of computing efficiency
+        if not self.knowledge_implanted:
+            print "Implanting knowledge..."
+            for p in self.city.residents:
+                if p.age > 3:
+                    p.implant_knowledge()
+            self.knowledge_implanted = True
+            if 'hi-fi' in config.dates_to_snapshot_world:
+                self.save_snapshot()
+        # Now simulate at full fidelity for the remaining week
+        while self.ordinal_date < self.ordinal_date_that_gameplay_begins:
+            self.enact_hi_fi_simulation()
+            print "{} days remain until gameplay begins".format(
+                self.ordinal_date_that_gameplay_begins-self.ordinal_date
+            )
+        # Simulate the night in question, on which the founder dies
+        self.enact_hi_fi_simulation()
+
+    def save_snapshot(self, path=None):
+        """Save a snapshot of this game, from which it can later be resumed (see snapshot.py), and return its path.
+
+        @param path: Where to save the snapshot; if None, a path is formed from config.snapshot_path_template.
+        """
+        if path is None:
+            path = self.config.snapshot_path_template.format(
+                seed=self.seed, date=datetime.date.fromordinal(self.ordinal_date).isoformat()
+            )
+        snapshot.save_snapshot(
+            game=self, path=path, archive_knowledge=self.config.archive_knowledge_in_snapshots
+        )
+        return path
+
+    def archive_knowledge(self):
+        """Archive everyone's knowledge into a compact columnar encoding that is rehydrated lazily (see archive.py)."""
+        self.knowledge_archive = archive.archive_knowledge(game=self)
+        return self.knowledge_archive
+
+    def export_knowledge(self, path):
+        """Export everyone's knowledge, in a columnar encoding, to the given path for analysis (see archive.py)."""
+        archive.export_knowledge(game=self, path=path)
+
+    def found_city(self):
+        """Generate the city plan and have its first farms, businesses, and settlers established."""
+        self.generate_city_plan()
+        self.settle_city()
+
+    def generate_city_plan(self):
+        """Generate a city plan with at least two tracts."""
         self.city = City(self)
         while len(self.city.tracts) < 2:
             self.city = City(self)
+
+    def settle_city(self):
+        """Have the first farms, businesses, and settlers of the city get established."""
         # Have families establish farms on all of the city tracts except one,
         # which will be a cemetery
         for i in xrange(len(self.city.tracts)-2):
@@ -76,11 +252,11 @@ class Game(object):
             Farm(owner=farmer)
             # farmer.move_into_the_city(hiring_that_instigated_move=farmer.occupation)  # SHOULD BE ABLE TO DELETE THIS
         # For the last tract, potentially have a quarry or coal mine instead of a farm
-        if random.random() < self.config.chance_of_a_coal_mine_at_time_of_town_founding:
+        if self.random.random() < self.config.chance_of_a_coal_mine_at_time_of_town_founding:
             owner = PersonExNihilo(game=self, job_opportunity_impetus=Owner, spouse_already_generated=None)
             CoalMine(owner=owner)
             self.city.mayor = owner  # TODO actual mayor stuff
-        elif random.random() < self.config.chance_of_a_quarry_at_time_of_town_founding:
+        elif self.random.random() < self.config.chance_of_a_quarry_at_time_of_town_founding:
             owner = PersonExNihilo(game=self, job_opportunity_impetus=Owner, spouse_already_generated=None)
             Quarry(owner=owner)
             self.city.mayor = owner  # TODO actual mayor stuff
@@ -97,50 +273,29 @@ class Game(object):
         Cemetery(owner=self.random_person)
         # Set the city's 'settlers' attribute
         self.city.settlers = set(self.city.residents)
-        # Now simulate to a week before gameplay
-        n_days_until_gameplay_begins = self.ordinal_date_that_gameplay_begins-self.ordinal_date
-        n_days_until_hi_fi_sim_begins = n_days_until_gameplay_begins - 7
-        n_timesteps_until_hi_fi_sim_begins = n_days_until_hi_fi_sim_begins * 2
-        self.enact_lo_fi_simulation(n_timesteps=n_timesteps_until_hi_fi_sim_begins)
-        # Implant knowledge into everyone who is living to simulate knowledge
-        # phenomena that would have occurred during the lo-fi simulation but
-        # wasn't enacted due to reasons of computing efficiency
-        print "Implanting knowledge..."
-        for p in self.city.residents:
-            if p.age > 3:
-                p.implant_knowledge()
-        # Now simulate at full fidelity for the remaining week
-        while self.ordinal_date < self.ordinal_date_that_gameplay_begins:
-            self.enact_hi_fi_simulation()
-            print "{} days remain until gameplay begins".format(
-                self.ordinal_date_that_gameplay_begins-self.ordinal_date
-            )
-        # Simulate the night in question, on which the founder dies
-        self.enact_hi_fi_simulation()
 
     def _generate_name_for_city(self):
         """Generate a name for the city."""
-        if random.random() < self.config.chance_city_gets_named_for_founder:
+        if self.random.random() < self.config.chance_city_gets_named_for_founder:
             name = self.city.mayor.last_name
         else:
-            name = Names.a_place_name()
+            name = self.names.a_place_name()
         return name
 
-    def assign_event_number(self, new_event):
+    def assign_event_number(self):
         """Assign an event number to some event, to allow for precise ordering of events that happened same timestep.
 
-        Also add the event to a listing of all in-game events; this facilitates debugging.
+        Events and pieces of evidence both draw from this one running count, but they are stored
+        separately, in Game.events and Game.evidence_log, respectively.
         """
-        self.events.append(new_event)
         self.event_number += 1
         return self.event_number
 
-    @staticmethod
-    def get_random_day_of_year(year):
+    def get_random_day_of_year(self, year):
         """Return a randomly chosen day in the given year."""
         ordinal_date_on_jan_1_of_this_year = datetime.date(year, 1, 1).toordinal()
         ordinal_date = (
-            ordinal_date_on_jan_1_of_this_year + random.randint(0, 365)
+            ordinal_date_on_jan_1_of_this_year + self.random.randint(0, 365)
         )
         datetime_object = datetime.date.fromordinal(ordinal_date)
         month, day = datetime_object.month, datetime_object.day
@@ -164,6 +319,20 @@ class Game(object):
         )
         return date
 
+    def whereabouts_feature_type(self):
+        """Return the feature type of beliefs about someone's whereabouts on this timestep, e.g., 'whereabouts 723099-1'.
+
+        Every whereabouts belief facet formed on a timestep shares the one string that this returns.
+        These strings aren't interned in the game's vocabulary, since there is a new one every
+        timestep, and so each is let go once the facets holding it are.
+        """
+        timestep, feature_type = self.whereabouts_feature_type_of_timestep
+        if timestep != (self.ordinal_date, self.time_of_day):
+            day_or_night_id = 0 if self.time_of_day == "day" else 1
+            feature_type = "whereabouts {}-{}".format(self.ordinal_date, day_or_night_id)
+            self.whereabouts_feature_type_of_timestep = ((self.ordinal_date, self.time_of_day), feature_type)
+        return feature_type
+
     def get_knowledge(self, owner_id, subject_id):
         """Return this person's knowledge about another person's feature of the given type.
 
@@ -198,120 +367,330 @@ class Game(object):
         return ids_of_these_people
 
     def enact_lo_fi_simulation(self, n_timesteps=1):
-        """Simulate the passing of a chunk of time at a lower fidelity than the simulation during gameplay."""
-        last_simulated_day = self.ordinal_date
+        """Simulate the passing of a chunk of time at a lower fidelity than the simulation during gameplay.
+
+        If config.jump_ahead_during_lo_fi_simulation is set, this jumps from one thing happening to
+        the next rather than stepping through every timestep (see _enact_lo_fi_simulation_jumping_ahead()).
+        """
+        if self.config.jump_ahead_during_lo_fi_simulation:
+            self._enact_lo_fi_simulation_jumping_ahead(n_timesteps=n_timesteps)
+            return
+        # Pick up from the last day simulated by any earlier call, so that simulating in
+        # several chunks is equivalent to simulating all at once
+        last_simulated_day = self.last_lo_fi_simulated_day or self.ordinal_date
         chance_of_a_timestep_being_simulated = self.config.chance_of_a_timestep_being_simulated
-        chance_an_unemployed_person_departs_on_a_simulated_timestep = (
-            self.config.chance_an_unemployed_person_departs_on_a_simulated_timestep
-        )
         for i in xrange(n_timesteps):
             self.advance_time()
             # Potentially have a new business open or an existing business close
             self.potentially_establish_a_new_business()
             self.potentially_shut_down_businesses()
             # Simulate births, even if this day will not actually be simulated
-            for person in list(self.city.residents):
-                if person.pregnant:
-                    if self.ordinal_date >= person.due_date:
-                        if self.time_of_day == 'day':
-                            if random.random() < 0.5:
-                                person.give_birth()
-                        else:
-                            person.give_birth()
+            self.simulate_births()
             # Potentially simulate the timestep
-            if random.random() < chance_of_a_timestep_being_simulated:
-                # Potentially build new businesses
-                for person in list(self.city.residents):
-                    if person.present:
-                        # Need to check this because an earlier iteration may have caused this
-                        # person to live the city (e.g., if their parent died)
-                        if person.marriage:
-                            chance_they_are_trying_to_conceive_this_year = (
-                                self.config.function_to_determine_chance_married_couple_are_trying_to_conceive(
-                                    n_kids=len(person.marriage.children_produced)
-                                )
-                            )
-                            chance_they_are_trying_to_conceive_this_year /= chance_of_a_timestep_being_simulated*365
-                            if random.random() < chance_they_are_trying_to_conceive_this_year:
-                                person.have_sex(partner=person.spouse, protection=False)
-                            elif random.random() < self.config.chance_a_divorce_happens_some_timestep:
-                                lawyer = person.contract_person_of_certain_occupation(occupation_in_question=Lawyer)
-                                lawyer = None if not lawyer else lawyer.occupation
-                                Divorce(subjects=(person, person.spouse), lawyer=lawyer)
-                        if person.age > 68 and random.random() > self.config.chance_someone_dies_some_timestep:
-                            # TODO make this era-accurate (i.e., different death rates in 1910 than in 1970)
-                            person.die(cause_of_death="Natural causes")
-                        elif person.occupation and person.age > max(65, random.random() * 100):
-                            person.retire()
-                        # Simulate unemployed people searching for work (and potentially getting a college education)
-                        elif (person.ready_to_work and not person.occupation and not person.retired and
-                                not (person.female and person.kids_at_home)):
-                            person.look_for_work()
-                            if not person.occupation:  # Means look_for_work() didn't succeed
-                                if (not person.college_graduate and person.age > 22 and
-                                        person.male if self.year > 1920 else True):
-                                    person.college_graduate = True
-                                elif random.random() < chance_an_unemployed_person_departs_on_a_simulated_timestep:
-                                    person.depart_city()
-                        elif (person.male and person.occupation and person not in person.home.owners and
-                              random.random() > 0.005):
-                            person.move_out_of_parents()
-                days_since_last_simulated_day = self.ordinal_date-last_simulated_day
-                # Reset all Relationship interacted_this_timestep attributes
-                for person in list(self.city.residents):
-                    for other_person in person.relationships:
-                        person.relationships[other_person].interacted_this_timestep = False
-                # Have people go to the location they will be at this timestep
-                for person in list(self.city.residents):
-                    person.routine.enact()
-                # Have people initiate social interactions with one another
-                for person in list(self.city.residents):
-                    # Person may have married (during an earlier iteration of this loop) and
-                    # then immediately departed because the new couple could not find home,
-                    # so we still have to make sure they actually live in the city currently before
-                    # having them socialize
-                    if person in self.city.residents:
-                        if person.age > 3:  # Must be at least four years old to socialize
-                            person.socialize(missing_timesteps_to_account_for=days_since_last_simulated_day*2)
+            if self.random.random() < chance_of_a_timestep_being_simulated:
+                self._simulate_lo_fi_timestep(last_simulated_day=last_simulated_day)
+                last_simulated_day = self.ordinal_date
+            self.profiler.finish_timestep()
+        self.last_lo_fi_simulated_day = last_simulated_day
+
+    def _enact_lo_fi_simulation_jumping_ahead(self, n_timesteps):
+        """Simulate the passing of a chunk of time at low fidelity by jumping from one thing happening to the next.
+
+        Stepping through every timestep means rolling, on each one, for whether it will be
+        simulated and whether a business will open or close, and checking whether anyone is due
+        to give birth, though on most timesteps nothing at all happens. Since the chance of each
+        of these things happening is the same on every timestep until something changes, the number
+        of timesteps until it next happens is geometrically distributed, and so this instead samples
+        how long it will be until each next happens, and advances the calendar straight to the first
+        of them; because the geometric distribution is memoryless, what didn't happen gets resampled
+        after every jump, and chances that depend on the year get resampled at the start of every
+        year. Births happen on their due dates, as before. This produces towns that are statistically
+        equivalent to those produced by stepping through every timestep, though not identical to them
+        given the same seed (see benchmark.compare_lo_fi_schedulers()).
+        """
+        config = self.config
+        last_simulated_day = self.last_lo_fi_simulated_day or self.ordinal_date
+        timesteps_remaining = n_timesteps
+        while timesteps_remaining:
+            timesteps_until_simulated_timestep = self._sample_timesteps_until(
+                chance_per_timestep=config.chance_of_a_timestep_being_simulated
+            )
+            timesteps_until_business_opens = self._sample_timesteps_until(
+                chance_per_timestep=config.chance_a_business_opens_some_timestep
+            )
+            timesteps_until_business_closes, business_that_will_close = self._sample_next_business_closure()
+            # An apartment complex opens on the very next timestep once one is needed (see
+            # potentially_establish_a_new_business()), which stepping through every timestep
+            # would get to right away, and so that timestep can't be jumped over
+            timesteps_until_apartment_complex_opens = 1 if self._an_apartment_complex_is_needed() else float('inf')
+            timesteps_until_birth = self._timesteps_until_next_birth_is_due()
+            timesteps_until_new_year = self._timesteps_until_day(
+                ordinal_date=datetime.date(self.year+1, 1, 1).toordinal()
+            )
+            jump = min(
+                timesteps_remaining, timesteps_until_simulated_timestep, timesteps_until_business_opens,
+                timesteps_until_business_closes, timesteps_until_apartment_complex_opens, timesteps_until_birth,
+                timesteps_until_new_year
+            )
+            self.advance_time(n_timesteps=jump)
+            timesteps_remaining -= jump
+            # Handle whatever happens on the timestep jumped to, in the same order as when stepping
+            # through every timestep (if an apartment complex is needed, this always establishes one)
+            self.potentially_establish_a_new_business(
+                a_business_is_due_to_open=timesteps_until_business_opens == jump
+            )
+            if timesteps_until_business_closes == jump and business_that_will_close in self.city.companies:
+                self.potentially_shut_down_businesses(business_due_to_shut_down=business_that_will_close)
+            if timesteps_until_birth == jump:
+                self.simulate_births()
+            if timesteps_until_simulated_timestep == jump:
+                self._simulate_lo_fi_timestep(last_simulated_day=last_simulated_day)
                 last_simulated_day = self.ordinal_date
+            self.profiler.finish_timestep()
+        self.last_lo_fi_simulated_day = last_simulated_day
+
+    def _simulate_lo_fi_timestep(self, last_simulated_day):
+        """Simulate a timestep of the lo-fi simulation.
+
+        @param last_simulated_day: The ordinal date of the last timestep that was simulated.
+        """
+        self.simulate_life_events()
+        days_since_last_simulated_day = self.ordinal_date-last_simulated_day
+        # Start a new interaction timestep, which makes every Relationship's interacted_this_timestep False
+        self.interaction_timestep += 1
+        # Have people go to the location they will be at this timestep
+        self.enact_routines()
+        # Have people initiate social interactions with one another
+        self.have_people_socialize(missing_timesteps_to_account_for=days_since_last_simulated_day*2)
+
+    def _sample_timesteps_until(self, chance_per_timestep):
+        """Return how many timesteps from now something with the given chance of happening on each timestep will next happen.
 
-    def potentially_establish_a_new_business(self):
-        """Potentially have a new business get constructed in town."""
+        This samples a geometric distribution (by inverting its CDF); something that cannot
+        happen will happen in an infinite number of timesteps.
+        """
+        if chance_per_timestep <= 0:
+            return float('inf')
+        if chance_per_timestep >= 1:
+            return 1
+        return 1 + int(math.log(1.0 - self.random.random()) / math.log(1.0 - chance_per_timestep))
+
+    def _sample_next_business_closure(self):
+        """Return how many timesteps from now some business will next roll to close, and which business that will be.
+
+        Businesses whose era has passed are likelier to close than others, and only businesses that
+        would be allowed to close roll to (see potentially_shut_down_businesses()).
+        """
+        config = self.config
+        chance_a_business_closes = config.chance_a_business_closes_some_timestep
+        chance_an_anachronistic_business_closes = config.chance_a_business_shuts_down_on_timestep_after_its_demise
+        businesses, businesses_not_allowed_to, anachronistic_businesses = self._businesses_that_may_shut_down()
+        n_businesses = len(businesses) - len(businesses_not_allowed_to)
+        chance_no_business_closes = (
+            (1 - chance_a_business_closes) ** n_businesses *
+            (1 - chance_an_anachronistic_business_closes) ** len(anachronistic_businesses)
+        )
+        timesteps_until_closure = self._sample_timesteps_until(chance_per_timestep=1 - chance_no_business_closes)
+        if timesteps_until_closure == float('inf'):
+            return timesteps_until_closure, None
+        # Select which business it will be, in proportion to each one's chance of closing
+        combined_chance_an_anachronistic_business_closes = (
+            chance_an_anachronistic_business_closes * len(anachronistic_businesses)
+        )
+        combined_chance = combined_chance_an_anachronistic_business_closes + chance_a_business_closes * n_businesses
+        if self.random.random() * combined_chance < combined_chance_an_anachronistic_business_closes:
+            return timesteps_until_closure, self.random.choice(anachronistic_businesses)
+        return timesteps_until_closure, self._sample_excluding(
+            population=businesses, k=1, excluded=businesses_not_allowed_to
+        )[0]
+
+    def _timesteps_until_next_birth_is_due(self):
+        """Return how many timesteps from now someone will next be due to give birth."""
+        self._discard_pregnancies_that_have_ended()
+        if not self.pregnancies:
+            return float('inf')
+        next_due_date = self.pregnancies[0][0]
+        # Someone who was due but didn't give birth during the day will give birth at night
+        # (and someone who is overdue will roll again on the next day)
+        if next_due_date <= self.ordinal_date:
+            return 1
+        return self._timesteps_until_day(ordinal_date=next_due_date)
+
+    def _timesteps_until_day(self, ordinal_date):
+        """Return how many timesteps from now the day timestep of the given (future) date is."""
+        return 2 * (ordinal_date - self.ordinal_date) - (1 if self.time_of_day == "night" else 0)
+
+    def schedule_birth(self, mother):
+        """Queue up a birth for a person who has just become pregnant."""
+        heapq.heappush(self.pregnancies, (mother.due_date, mother.id, mother))
+
+    def simulate_births(self):
+        """Have any pregnant person who is due give birth, potentially."""
+        due_mothers = []
+        while self.pregnancies and self.pregnancies[0][0] <= self.ordinal_date:
+            if self._discard_pregnancies_that_have_ended():
+                continue
+            due_mothers.append(heapq.heappop(self.pregnancies)[2])
+        if not due_mothers:
+            return
+        # Consider due mothers in the order that the city's residents iterate in, as they used to be
+        # (when every resident was surveyed), since the order in which they roll matters to what happens
+        if len(due_mothers) > 1:
+            due_mothers = set(due_mothers)
+            due_mothers = [person for person in self.city.residents if person in due_mothers]
+        for person in due_mothers:
+            if person.pregnant:
+                if self.time_of_day == 'day':
+                    if self.random.random() < 0.5:
+                        person.give_birth()
+                else:
+                    person.give_birth()
+            # Someone who is still pregnant (or who didn't give birth during the day) remains due
+            if person.pregnant and person.present:
+                self.schedule_birth(mother=person)
+
+    def _discard_pregnancies_that_have_ended(self):
+        """Discard entries atop the heap of pregnancies for mothers who are no longer pregnant or present, and return how many."""
+        n_discarded = 0
+        while self.pregnancies:
+            due_date, _, mother = self.pregnancies[0]
+            if mother.pregnant and mother.due_date == due_date and mother in self.city.residents:
+                break
+            heapq.heappop(self.pregnancies)
+            n_discarded += 1
+        return n_discarded
+
+    def simulate_life_events(self):
+        """Potentially have each resident conceive, divorce, die, retire, look for work, or move out."""
+        chance_of_a_timestep_being_simulated = self.config.chance_of_a_timestep_being_simulated
+        chance_an_unemployed_person_departs_on_a_simulated_timestep = (
+            self.config.chance_an_unemployed_person_departs_on_a_simulated_timestep
+        )
+        for person in list(self.city.residents):
+            if person.present:
+                # Need to check this because an earlier iteration may have caused this
+                # person to live the city (e.g., if their parent died)
+                if person.marriage:
+                    chance_they_are_trying_to_conceive_this_year = (
+                        self.config.function_to_determine_chance_married_couple_are_trying_to_conceive(
+                            n_kids=len(person.marriage.children_produced)
+                        )
+                    )
+                    chance_they_are_trying_to_conceive_this_year /= chance_of_a_timestep_being_simulated*365
+                    if self.random.random() < chance_they_are_trying_to_conceive_this_year:
+                        person.have_sex(partner=person.spouse, protection=False)
+                    elif self.random.random() < self.config.chance_a_divorce_happens_some_timestep:
+                        lawyer = person.contract_person_of_certain_occupation(occupation_in_question=Lawyer)
+                        lawyer = None if not lawyer else lawyer.occupation
+                        Divorce(subjects=(person, person.spouse), lawyer=lawyer)
+                if person.age > 68 and self.random.random() > self.config.chance_someone_dies_some_timestep:
+                    # TODO make this era-accurate (i.e., different death rates in 1910 than in 1970)
+                    person.die(cause_of_death="Natural causes")
+                elif person.occupation and person.age > max(65, self.random.random() * 100):
+                    person.retire()
+                # Simulate unemployed people searching for work (and potentially getting a college education)
+                elif person in self.city.unemployed:
+                    person.look_for_work()
+                    if not person.occupation:  # Means look_for_work() didn't succeed
+                        if (not person.college_graduate and person.age > 22 and
+                                person.male if self.year > 1920 else True):
+                            person.college_graduate = True
+                        elif self.random.random() < chance_an_unemployed_person_departs_on_a_simulated_timestep:
+                            person.depart_city()
+                elif (person.male and person.occupation and person not in person.home.owners and
+                      self.random.random() > 0.005):
+                    person.move_out_of_parents()
+
+    def enact_routines(self, timestep_during_gameplay=False):
+        """Have people go to the location they will be at this timestep."""
+        for person in list(self.city.residents):
+            if not (timestep_during_gameplay and person is self.pc):  # Don't sim where the PC is
+                person.routine.enact()
+
+    def have_people_socialize(self, missing_timesteps_to_account_for):
+        """Have people initiate social interactions with one another during lo-fi simulation."""
+        for person in list(self.city.residents):
+            # Person may have married (during an earlier iteration of this loop) and
+            # then immediately departed because the new couple could not find home,
+            # so we still have to make sure they actually live in the city currently before
+            # having them socialize
+            if person in self.city.residents:
+                if person.age > 3:  # Must be at least four years old to socialize
+                    person.socialize(missing_timesteps_to_account_for=missing_timesteps_to_account_for)
+
+    def potentially_establish_a_new_business(self, a_business_is_due_to_open=None):
+        """Potentially have a new business get constructed in town.
+
+        @param a_business_is_due_to_open: Whether a business is due to open, as determined by the
+                                          jump-ahead lo-fi simulation; if None, this gets rolled for.
+        """
         config = self.config
         # If there's less than 30 vacant homes in this city and no apartment complex
         # yet, have one open up
-        if len(self.city.vacant_lots) < 30 and not self.city.businesses_of_type('ApartmentComplex'):
+        if self._an_apartment_complex_is_needed():
             owner = self._determine_who_will_establish_new_business(business_type=ApartmentComplex)
             ApartmentComplex(owner=owner)
-        elif random.random() < config.chance_a_business_opens_some_timestep:
-            all_business_types = Business.__subclasses__()
-            type_of_business_that_will_open = None
-            tries = 0
-            while not type_of_business_that_will_open:
-                tries += 1
-                randomly_selected_type = random.choice(all_business_types)
-                advent, demise, min_pop = config.business_types_advent_demise_and_minimum_population[
-                    randomly_selected_type
-                ]
-                # Check if the business type is era-appropriate
-                if advent < self.year < demise and self.city.population > min_pop:
-                    # Check if there aren't already too many businesses of this type in town
-                    max_number_for_this_type = config.max_number_of_business_types_at_one_time[randomly_selected_type]
-                    if (len(self.city.businesses_of_type(randomly_selected_type.__name__)) <
-                            max_number_for_this_type):
-                        # Lastly, if this is a business that only forms on a tract, make sure
-                        # there is a vacant tract for it to be established upon
-                        need_tract = randomly_selected_type in config.companies_that_get_established_on_tracts
-                        if (need_tract and self.city.vacant_tracts) or not need_tract:
-                            type_of_business_that_will_open = randomly_selected_type
-                if self.city.population < 50 or tries > 10:  # Just not ready for more businesses yet -- grow naturally
-                    break
+        elif (a_business_is_due_to_open if a_business_is_due_to_open is not None else
+              self.random.random() < config.chance_a_business_opens_some_timestep):
+            type_of_business_that_will_open = self._select_type_of_business_to_open()
             if type_of_business_that_will_open in config.public_company_types:
                 type_of_business_that_will_open(owner=self.city.mayor)
             elif type_of_business_that_will_open:
                 owner = self._determine_who_will_establish_new_business(business_type=type_of_business_that_will_open)
                 type_of_business_that_will_open(owner=owner)
 
+    def _an_apartment_complex_is_needed(self):
+        """Return whether the town is running out of vacant lots and has no apartment complex yet."""
+        return len(self.city.vacant_lots) < 30 and not self.city.companies_of_type.get('ApartmentComplex')
+
+    def _select_type_of_business_to_open(self):
+        """Select the type of a business that will open, or return None if none will after all.
+
+        A type of business that is era-appropriate, that the town is big enough for, that the town
+        doesn't already have the maximum number of, and that has a vacant tract if it needs one is
+        eligible to open. Types used to be tried at random until an eligible one came up, giving up
+        after eleven tries (or after one, in a town of under fifty people); this selects among the
+        eligible types directly, but gives up with the same probability that those tries would have.
+        """
+        n_business_types, business_types_of_this_era = self._business_types_of_this_era()
+        eligible_business_types = [
+            business_type for business_type, min_population, max_number, needs_tract in business_types_of_this_era if
+            self.city.population > min_population and
+            len(self.city.companies_of_type.get(business_type.__name__, ())) < max_number and
+            (self.city.vacant_tracts or not needs_tract)
+        ]
+        if not eligible_business_types:
+            return None
+        n_tries = 1 if self.city.population < 50 else 11
+        chance_a_try_fails = 1 - len(eligible_business_types) / float(n_business_types)
+        if self.random.random() < chance_a_try_fails ** n_tries:
+            return None
+        return self.random.choice(eligible_business_types)
+
+    def _business_types_of_this_era(self):
+        """Return the number of types of business and a tuple of those that are era-appropriate this year.
+
+        Each era-appropriate type is given as a (type, minimum population, maximum number at one time,
+        whether it needs a tract) tuple.
+        """
+        try:
+            return self.business_types_by_year[self.year]
+        except KeyError:
+            config = self.config
+            all_business_types = Business.__subclasses__()
+            business_types_of_this_era = []
+            for business_type in all_business_types:
+                advent, demise, min_population = config.business_types_advent_demise_and_minimum_population[
+                    business_type
+                ]
+                if advent < self.year < demise:
+                    business_types_of_this_era.append((
+                        business_type, min_population, config.max_number_of_business_types_at_one_time[business_type],
+                        business_type in config.companies_that_get_established_on_tracts
+                    ))
+            self.business_types_by_year[self.year] = len(all_business_types), tuple(business_types_of_this_era)
+            return self.business_types_by_year[self.year]
+
     def _determine_who_will_establish_new_business(self, business_type):
         """Select a person who will establish a new business of the given type."""
         config = self.config
@@ -360,28 +739,133 @@ class Game(object):
                 )
         return owner
 
-    def potentially_shut_down_businesses(self):
-        """Potentially have a new business get constructed in town."""
+    def potentially_shut_down_businesses(self, business_due_to_shut_down=None):
+        """Potentially have businesses in town shut down.
+
+        Rather than rolling for each business, this samples how many businesses will roll to close
+        on this timestep (separately for those whose era has passed, which are likelier to close),
+        and then selects which ones at random. Only the businesses that would be allowed to close
+        are sampled from (see _businesses_that_may_shut_down()), since one that rolled to close
+        but wasn't allowed to would just stay open; because every business that is allowed to close
+        still has the same chance of doing so, this closes businesses at the same rate as rolling
+        for each one would.
+
+        @param business_due_to_shut_down: A business that is due to shut down, as determined by the
+                                          jump-ahead lo-fi simulation, in which case no other business
+                                          is considered and nothing gets rolled for (though the business
+                                          still won't shut down if it's not allowed to).
+        """
         config = self.config
         chance_a_business_shuts_down_this_timestep = config.chance_a_business_closes_some_timestep
         chance_a_business_shuts_down_on_timestep_after_its_demise = (
             # Once its anachronistic, like a Dairy in 1960
             config.chance_a_business_shuts_down_on_timestep_after_its_demise
         )
-        for business in list(self.city.companies):
-            if business.demise <= self.year:
-                if random.random() < chance_a_business_shuts_down_on_timestep_after_its_demise:
-                    if business.__class__ not in config.public_company_types:
-                        business.go_out_of_business(reason=None)
-            elif random.random() < chance_a_business_shuts_down_this_timestep:
-                if business.__class__ not in config.public_company_types:
-                    if not (
-                        # Don't shut down an apartment complex with people living in it,
-                        # or an apartment complex that's the only one in town
-                        business.__class__ is ApartmentComplex and business.residents or
-                        len(self.city.businesses_of_type('ApartmentComplex')) == 1
-                    ):
-                        business.go_out_of_business(reason=None)
+        if business_due_to_shut_down:
+            self._shut_down_business_if_allowed(business=business_due_to_shut_down)
+            return
+        businesses, businesses_not_allowed_to, anachronistic_businesses = self._businesses_that_may_shut_down()
+        for candidates, excluded, chance_of_shutting_down in (
+            (anachronistic_businesses, (), chance_a_business_shuts_down_on_timestep_after_its_demise),
+            (businesses, businesses_not_allowed_to, chance_a_business_shuts_down_this_timestep),
+        ):
+            n_businesses_shutting_down = self._sample_binomial(
+                n_trials=len(candidates) - len(excluded), chance=chance_of_shutting_down
+            )
+            if n_businesses_shutting_down:
+                for business in self._sample_excluding(
+                        population=candidates, k=n_businesses_shutting_down, excluded=excluded
+                ):
+                    # A business may no longer be allowed to close once others have (e.g., once an apartment
+                    # complex has become the only one in town), so this still gets checked
+                    if business in self.city.companies:
+                        self._shut_down_business_if_allowed(business=business)
+
+    def _businesses_that_may_shut_down(self):
+        """Return the businesses in town that would be allowed to shut down (see _shut_down_business_if_allowed()).
+
+        These are returned as a list of businesses whose era has not passed, a list of the few among
+        those that are nonetheless not allowed to shut down (apartment complexes with people living
+        in them), and a list of businesses whose era has passed. Public companies are never allowed
+        to shut down, and so they are left out of these altogether.
+        """
+        businesses, anachronistic_businesses = self._businesses_by_whether_their_era_has_passed()
+        apartment_complexes = self.city.companies_of_type.get('ApartmentComplex', ())
+        if len(apartment_complexes) == 1:
+            # While there's only one apartment complex in town, no business whose era has not passed may shut down
+            return [], [], anachronistic_businesses
+        businesses_not_allowed_to = [
+            apartment_complex for apartment_complex in apartment_complexes if
+            apartment_complex.demise > self.year and apartment_complex.residents
+        ]
+        return businesses, businesses_not_allowed_to, anachronistic_businesses
+
+    def _businesses_by_whether_their_era_has_passed(self):
+        """Return a list of the businesses in town (other than public companies) whose era has not passed and a list
+        of those whose era has.
+
+        These only change when a business opens or closes or a new year begins, and so they are
+        kept on the city until then (City.add_company() and City.remove_company() discard them).
+        """
+        city = self.city
+        if (city.businesses_by_whether_their_era_has_passed is None or
+                city.businesses_by_whether_their_era_has_passed[0] != self.year):
+            public_company_types = self.config.public_company_types
+            businesses, anachronistic_businesses = [], []
+            for business in city.companies:
+                if business.__class__ in public_company_types:
+                    continue
+                if business.demise <= self.year:
+                    anachronistic_businesses.append(business)
+                else:
+                    businesses.append(business)
+            city.businesses_by_whether_their_era_has_passed = (self.year, businesses, anachronistic_businesses)
+        return city.businesses_by_whether_their_era_has_passed[1:]
+
+    def _sample_excluding(self, population, k, excluded):
+        """Return k elements selected at random from a population, leaving out the given few elements of it.
+
+        Rather than building a list of the population without the excluded elements, this samples
+        enough extra elements that at least k of them are not excluded, and keeps the first k of
+        those, which are just as likely to be any k of the elements that aren't excluded.
+        """
+        if not excluded:
+            return self.random.sample(population, k)
+        sample = self.random.sample(population, min(len(population), k + len(excluded)))
+        return [element for element in sample if element not in excluded][:k]
+
+    def _sample_binomial(self, n_trials, chance):
+        """Return how many of a number of trials, each with the given chance of success, succeed.
+
+        This inverts the binomial CDF with a single random draw, which is quick when successes
+        are as rare as, e.g., businesses shutting down on a given timestep.
+        """
+        if not n_trials or chance <= 0:
+            return 0
+        if chance >= 1:
+            return n_trials
+        target = self.random.random()
+        probability_of_this_many = (1 - chance) ** n_trials
+        cumulative_probability = probability_of_this_many
+        n_successes = 0
+        while target >= cumulative_probability and n_successes < n_trials:
+            probability_of_this_many *= (chance / (1 - chance)) * (n_trials - n_successes) / (n_successes + 1.0)
+            n_successes += 1
+            cumulative_probability += probability_of_this_many
+        return n_successes
+
+    def _shut_down_business_if_allowed(self, business):
+        """Shut down a business that has rolled to close, unless it is public or a needed apartment complex."""
+        if business.__class__ in self.config.public_company_types:
+            return
+        if business.demise > self.year and (
+            # Don't shut down an apartment complex with people living in it,
+            # or an apartment complex that's the only one in town (unless it's anachronistic)
+            business.__class__ is ApartmentComplex and business.residents or
+            len(self.city.businesses_of_type('ApartmentComplex')) == 1
+        ):
+            return
+        business.go_out_of_business(reason=None)
 
     def enact_hi_fi_simulation(self, timestep_during_gameplay=False):
         """Advance to the next day/night cycle."""
@@ -391,28 +875,92 @@ class Game(object):
         # )
         # Decay all beliefs from the time passing since yesterday
         if self.time_of_day == "day":
-            # NOTE: COULD PROBABLY SPEED UP THINGS IN POLISHED GAME BY
-            # PUTTING CODE FOR THIS ROUTINE DIRECTLY HERE
-            for person in self.city.residents:
-                for belief in person.all_belief_facets:
-                    belief.decay_strength()
-        # Reset all Relationship interacted_this_timestep attributes
-        for person in self.city.residents:
-            for other_person in person.relationships:
-                person.relationships[other_person].interacted_this_timestep = False
+            self.decay_beliefs()
+            if self.config.strength_below_which_superseded_belief_facets_get_pruned is not None:
+                self.prune_superseded_belief_facets()
+        # Start a new interaction timestep, which makes every Relationship's interacted_this_timestep False
+        self.interaction_timestep += 1
         # Have people go to the location they will be at this timestep
-        for person in self.city.residents:
-            if not (timestep_during_gameplay and person is self.pc):  # Don't sim where the PC is
-                person.routine.enact()
+        self.enact_routines(timestep_during_gameplay=timestep_during_gameplay)
+        # Index who is where, now that everyone has gone where they'll be
+        self.index_who_is_where()
         # Have people observe their surroundings, which will cause knowledge to
         # build up, and have them socialize with other people also at that location --
         # this will cause relationships to form/progress and knowledge to propagate
+        self.have_people_observe_and_socialize(timestep_during_gameplay=timestep_during_gameplay)
+        # Deteriorate people's mental models from time passing
+        self.deteriorate_mental_models(timestep_during_gameplay=timestep_during_gameplay)
+        self.profiler.finish_timestep()
+
+    def decay_beliefs(self):
+        """Decay all beliefs from the time passing since yesterday.
+
+        Belief facets decay lazily, upon their strengths being read (see Facet.strength), and
+        so this only advances each resident's count of days of belief decay.
+        """
+        for person in self.city.residents:
+            person.days_of_belief_decay += 1
+
+    def prune_superseded_belief_facets(self):
+        """Prune the superseded belief facets whose strength has decayed away (see config), and return how many.
+
+        Each day, only the residents whose IDs match the ordinal date modulo
+        config.days_over_which_pruning_of_superseded_belief_facets_is_spread have their
+        mental models gone over, so that every resident's get gone over once in that many days.
+        """
+        threshold = self.config.strength_below_which_superseded_belief_facets_get_pruned
+        n_days = self.config.days_over_which_pruning_of_superseded_belief_facets_is_spread
+        todays_share = self.ordinal_date % n_days
+        n_pruned_facets = 0
+        for person in self.city.residents:
+            if person.id % n_days == todays_share:
+                n_pruned_facets += person.prune_superseded_belief_facets(threshold=threshold)
+        return n_pruned_facets
+
+    def have_people_observe_and_socialize(self, timestep_during_gameplay=False):
+        """Have people observe their surroundings and socialize with others at their location."""
+        # These happen in a single loop, rather than all observation and then all socializing,
+        # because that order matters to what people know when they socialize; the profiler's
+        # timers on Person.observe() and Person.socialize() tell the two apart. People are taken
+        # location by location, so that everyone at a place reads the same entry of the occupancy
+        # index; anyone who goes somewhere else partway through (e.g., upon getting married)
+        # observes and socializes wherever they've gone
+        residents_at_location = {}
         for person in self.city.residents:
             if not (timestep_during_gameplay and person is self.pc):
                 if person.age > 3:
-                    person.observe()
-                    person.socialize()
-        # Deteriorate people's mental models from time passing
+                    if person.location not in residents_at_location:
+                        residents_at_location[person.location] = []
+                    residents_at_location[person.location].append(person)
+        for location in residents_at_location:
+            for person in residents_at_location[location]:
+                person.observe()
+                person.socialize()
+
+    def index_who_is_where(self):
+        """Index the people at every occupied location, once routines have been enacted (see occupants())."""
+        self.occupancy_index = {}
+        for person in self.city.residents:
+            if person.location and person.location not in self.occupancy_index:
+                self.occupants(location=person.location)
+
+    def occupants(self, location):
+        """Return a tuple of the people at a location and a tuple of those of them old enough to be socialized with.
+
+        @param location: The business or dwelling place in question.
+        """
+        try:
+            return self.occupancy_index[location]
+        except KeyError:
+            people_here = tuple(location.people_here_now)
+            # People younger than five are never instigated social interactions with (see
+            # Person._decide_to_instigate_social_interaction())
+            people_here_who_may_be_socialized_with = tuple(p for p in people_here if p.age >= 5)
+            self.occupancy_index[location] = people_here, people_here_who_may_be_socialized_with
+            return self.occupancy_index[location]
+
+    def deteriorate_mental_models(self, timestep_during_gameplay=False):
+        """Deteriorate people's mental models from time passing."""
         for person in self.city.residents:
             if not (timestep_during_gameplay and person is self.pc):
                 for thing in list(person.mind.mental_models):
@@ -433,37 +981,50 @@ class Game(object):
         for person in list(self.city.residents):
             person.routine.enact()
 
-    def advance_time(self):
-        """Advance time of day and date, if it's a new day."""
-        self.time_of_day = "night" if self.time_of_day == "day" else "day"
-        self.weather = random.choice(['good', 'bad'])
-        if self.time_of_day == "day":
-            self.ordinal_date += 1
-            new_date_tuple = datetime.date.fromordinal(self.ordinal_date)
-            if new_date_tuple.year != self.year:
-                # Happy New Year
-                self.true_year = new_date_tuple.year
-                self.year = new_date_tuple.year
-                print self.year, len(self.city.vacant_lots), len(self.city.vacant_homes), self.city.pop
-            self.month = new_date_tuple.month
-            self.day = new_date_tuple.day
-            self.date = self.get_date()
-            # Age any present (not dead, not departed) character whose birthday is today
-            if (self.month, self.day) not in self.birthdays:
-                self.birthdays[(self.month, self.day)] = set()
-            else:
-                for person in self.birthdays[(self.month, self.day)]:
-                    if person.present:
-                        person.grow_older()
-                # Don't forget leap-year babies
-                if (self.month, self.day) == (3, 1):
-                    for person in self.birthdays[(2, 29)]:
+    def advance_time(self, n_timesteps=1):
+        """Advance time of day and date, if it's a new day.
+
+        @param n_timesteps: The number of timesteps to advance; when the jump-ahead lo-fi simulation
+                            skips over timesteps on which nothing happens, the birthdays on the days
+                            skipped over are still observed, but the weather and the random number
+                            for the timestep only get set for the last one (which is all that's needed,
+                            since the last one is the only one that anything happens on).
+        """
+        self.weather = self.random.choice(['good', 'bad'])
+        self.occupancy_index = {}
+        for _ in xrange(n_timesteps):
+            self.time_of_day = "night" if self.time_of_day == "day" else "day"
+            if self.time_of_day == "day":
+                self.ordinal_date += 1
+                new_date_tuple = datetime.date.fromordinal(self.ordinal_date)
+                if new_date_tuple.year != self.year:
+                    # Happy New Year
+                    self.true_year = new_date_tuple.year
+                    self.year = new_date_tuple.year
+                    print self.year, len(self.city.vacant_lots), len(self.city.vacant_homes), self.city.pop
+                self.month = new_date_tuple.month
+                self.day = new_date_tuple.day
+                self.date = self.get_date()
+                # Age any present (not dead, not departed) character whose birthday is today
+                if (self.month, self.day) not in self.birthdays:
+                    self.birthdays[(self.month, self.day)] = set()
+                else:
+                    for person in self.birthdays[(self.month, self.day)]:
                         if person.present:
                             person.grow_older()
-        else:
-            self.date = self.get_date()
+                    # Don't forget leap-year babies
+                    if (self.month, self.day) == (3, 1):
+                        for person in self.birthdays[(2, 29)]:
+                            if person.present:
+                                person.grow_older()
+            else:
+                self.date = self.get_date()
+        if self.config.check_vacancy_consistency:
+            self.city.check_vacancy_consistency()
+        if self.config.check_employment_consistency:
+            self.city.check_employment_consistency()
         # Lastly, set a new random number for this timestep
-        self.random_number_this_timestep = random.random()
+        self.random_number_this_timestep = self.random.random()
 
     def find(self, name):
         """Return person living in this city with that name."""
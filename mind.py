@@ -1,4 +1,4 @@
-import random
+import collections
 
 
 class Mind(object):
@@ -11,17 +11,20 @@ class Mind(object):
             self.memory = self._init_memory()
         else:  # PersonExNihilo object
             self.memory = self._init_ex_nihilo_memory()
-        self.mental_models = {}
+        # People and places hash by IDs that they share with one another, so a dictionary of them would
+        # iterate in an order that rebuilding it (as when archived knowledge is rehydrated) doesn't reproduce;
+        # mental models are kept in insertion order instead, so that they always iterate the same way
+        self.mental_models = collections.OrderedDict()
 
     def _init_memory(self):
         """Determine a person's base memory capability, given their parents'."""
         config = self.person.game.config
-        if random.random() < config.memory_heritability:
-            takes_after = random.choice([self.person.mother, self.person.father])
-            memory = random.normalvariate(takes_after.mind.memory, config.memory_heritability_sd)
+        if self.person.game.random.random() < config.memory_heritability:
+            takes_after = self.person.game.random.choice([self.person.mother, self.person.father])
+            memory = self.person.game.random.normalvariate(takes_after.mind.memory, config.memory_heritability_sd)
         else:
             takes_after = None
-            memory = random.normalvariate(config.memory_mean, config.memory_sd)
+            memory = self.person.game.random.normalvariate(config.memory_mean, config.memory_sd)
         if self.person.male:  # Men have slightly worse memory (studies show)
             memory -= config.memory_sex_diff
         if memory > config.memory_cap:
@@ -34,7 +37,7 @@ class Mind(object):
     def _init_ex_nihilo_memory(self):
         """Determine this person's base memory capability."""
         config = self.person.game.config
-        memory = random.normalvariate(config.memory_mean, config.memory_sd)
+        memory = self.person.game.random.normalvariate(config.memory_mean, config.memory_sd)
         if self.person.male:  # Men have slightly worse memory (studies show)
             memory -= config.memory_sex_diff
         if memory > config.memory_cap:
@@ -63,6 +66,6 @@ class Feature(float):
         super(Feature, self).__init__()
         self.inherited_from = inherited_from
 
-    def __new__(cls, value, inherited_from):
-        """Do float stuff."""
+    def __new__(cls, value, inherited_from=None):
+        """Do float stuff (the other argument may be omitted, as when unpickling)."""
         return float.__new__(cls, value)
\ No newline at end of file
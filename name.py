@@ -26,8 +26,8 @@ class Name(str):
         self.hyphenated = True if derived_from else False
         self.ethnicity = self._get_ethnicity_of_this_name()
 
-    def __new__(cls, value, progenitor, conceived_by, derived_from):
-        """Do str stuff."""
+    def __new__(cls, value, progenitor=None, conceived_by=None, derived_from=None):
+        """Do str stuff (the other arguments may be omitted, as when unpickling)."""
         return str.__new__(cls, value)
 
     def _get_ethnicity_of_this_name(self):
@@ -28,6 +28,10 @@ class Occupation(object):
         # Note: self.person.occupation gets set by Business.hire(), because there's
         # a really tricky pipeline that has to be maintained
         person.occupations.append(self)
+        # Some occupations are only open to people who have held certain others (or no others), so
+        # update which occupations this person is employable as now, in case a hiring chain sets off
+        # before Business.hire() sets their occupation (see City.employable_job_candidates_for())
+        company.city.update_employment_status(person)
         self.level = person.game.config.job_levels[self.__class__]
         # Update the .coworkers attribute of this person and their new coworkers
         person.coworkers = set()  # Wash out their former coworkers, if any
@@ -53,6 +57,12 @@ class Occupation(object):
         for other_person in self.person.relationships:
             self.person.relationships[other_person].update_spark_and_charge_increments_for_job_level_difference()
 
+    def __hash__(self):
+        """Return a hash of this employee's person ID, so that collections of occupations iterate
+        in a reproducible order (a person rarely holds more than one, so collisions are few).
+        """
+        return self.person.id
+
     def __str__(self):
         """Return string representation."""
         if not self.terminus:
@@ -142,6 +152,7 @@ class Occupation(object):
         # attribute to None
         if self.person.occupation is self:
             self.person.occupation = None
+        self.company.city.update_employment_status(self.person)
         # If this person is retiring, set their .coworkers to the empty set
         if reason.__class__.__name__ == "Retirement":
             self.person.coworkers = set()
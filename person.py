@@ -1,7 +1,6 @@
-import random
 import heapq
+import collections
 import datetime
-from corpora import Names
 import event
 from name import Name
 from personality import Personality
@@ -60,7 +59,7 @@ class Person(object):
                 True if self.age >= self.game.config.age_people_start_working(year=self.game.year) else False
             )
         # Set sex
-        self.male, self.female = (True, False) if random.random() < 0.5 else (False, True)
+        self.male, self.female = (True, False) if self.game.random.random() < 0.5 else (False, True)
         self.tag = ''  # Allows players to tag characters with arbitrary strings
         # Set misc attributes
         self.alive = True
@@ -200,13 +199,21 @@ class Person(object):
         # will always be modified by self.go_to()
         self.location = None
         # Prepare attributes pertaining to this person's knowledge
-        self.all_belief_facets = set()  # Used to make batch calls to Facet.decay_strength()
+        self.all_belief_facets = set()  # See Facet.decays
+        # The number of days on which this person's beliefs have decayed, i.e., days of the hi-fi
+        # simulation during which they lived in the city; belief facets decay lazily against this
+        # count (see Facet.strength)
+        self.days_of_belief_decay = 0
         # Miscellaneous attributes pertaining to artifacts this person is wearing
         self.wedding_ring_on_finger = None
         # Currently, whether a character is the player is only considered by Conversation
         # objects (when deciding whether to elicit a dialogue move from the player)
         self.player = False
 
+    def __hash__(self):
+        """Return a hash of this person's ID, so that collections of them iterate in a reproducible order."""
+        return self.id
+
     def __str__(self):
         """Return string representation."""
         if self.present:
@@ -216,10 +223,9 @@ class Person(object):
         else:
             return "{}, {}-{}".format(self.name, self.birth_year, self.death_year)
 
-    @staticmethod
-    def _init_fertility(male, config):
+    def _init_fertility(self, male, config):
         """Determine whether this person will be able to reproduce."""
-        x = random.random()
+        x = self.game.random.random()
         if male and x < config.male_infertility_rate:
             infertile = True
         elif not male and x < config.female_infertility_rate:
@@ -231,7 +237,7 @@ class Person(object):
     def _init_sexuality(self):
         """Determine this person's sexuality."""
         config = self.game.config
-        x = random.random()
+        x = self.game.random.random()
         if x < config.homosexuality_incidence:
             # Homosexual
             if self.male:
@@ -548,7 +554,7 @@ class Person(object):
         elif any(f for f in self.friends if f.adult and f.present):
             next_of_kin = next(f for f in self.friends if f.adult and f.present)
         else:
-            next_of_kin = random.choice(
+            next_of_kin = self.game.random.choice(
                 [r for r in self.city.residents if r.adult and r.present]
             )
         return next_of_kin
@@ -906,6 +912,23 @@ class Person(object):
         elif feature_type == "home address":
             return self.mind.mental_models[place].address
 
+    def prune_superseded_belief_facets(self, threshold):
+        """Prune this person's superseded belief facets whose strength has decayed below the given threshold.
+
+        See MentalModel.prune_superseded_belief_facets(); this returns the number of facets pruned.
+        """
+        pruned_facets = []
+        for mental_model in self.mind.mental_models.itervalues():
+            pruned_facets += mental_model.prune_superseded_belief_facets(threshold=threshold)
+        if pruned_facets:
+            # Because facets are strings, the set of all belief facets holds at most one facet of a
+            # given value, which may not be the one being pruned, so membership is checked by identity
+            ids_of_all_belief_facets = {id(facet) for facet in self.all_belief_facets}
+            for facet in pruned_facets:
+                if id(facet) in ids_of_all_belief_facets:
+                    self.all_belief_facets.remove(facet)
+        return len(pruned_facets)
+
     def belief(self, entity, feature_type):
         """Return this person's currently held belief facet about entity's feature_type.
 
@@ -1482,7 +1505,7 @@ class Person(object):
         partner.sexual_partners.add(self)
         # TODO modify spark between these people
         if self.male != partner.male and not self.pregnant and not partner.pregnant:
-            if (not protection) or random.random() < config.chance_protection_does_not_work:
+            if (not protection) or self.game.random.random() < config.chance_protection_does_not_work:
                 self._determine_whether_pregnant(partner=partner)
 
     def _determine_whether_pregnant(self, partner):
@@ -1493,11 +1516,12 @@ class Person(object):
         chance_of_conception = config.function_to_determine_chance_of_conception(
             female_age=female_partner.age
         )
-        if random.random() < chance_of_conception:
+        if self.game.random.random() < chance_of_conception:
             female_partner.impregnated_by = self if female_partner is partner else partner
             female_partner.conception_year = self.game.year
             female_partner.due_date = self.game.ordinal_date + 270
             female_partner.pregnant = True
+            self.game.schedule_birth(mother=female_partner)
 
     def marry(self, partner):
         """Marry partner."""
@@ -1628,7 +1652,15 @@ class Person(object):
 
     def _get_scored_as_job_candidate_by_all_companies(self):
         """Get scored as a job candidate by all companies in town for all their supplemental positions."""
-        scores = {}
+        # Because positions are classes, which hash by memory address, the scores are kept in
+        # insertion order so that ties get broken the same way in every run
+        scores = collections.OrderedDict()
+        # Have the companies' decision makers' hiring biases get cached while they score this
+        # person (see Business._get_biases_of_decision_maker()), unless they already are
+        city = self.city
+        caching_hiring_biases = city.hiring_biases_cache is None
+        if caching_hiring_biases:
+            city.hiring_biases_cache = {}
         # Assemble scores of this person as a job candidate from all companies
         # in town for all of their open positions, day- or night-shift
         for company in self.city.companies:
@@ -1646,6 +1678,8 @@ class Person(object):
                         priority = company.supplemental_vacancies[shift].index(position)
                         score /= priority+1
                         scores[(company, position, shift)] = score
+        if caching_hiring_biases:
+            city.hiring_biases_cache = None
         return scores
 
     def move_out_of_parents(self):
@@ -1662,11 +1696,14 @@ class Person(object):
 
     def go_to(self, destination, occasion=None):
         """Go to destination and spend this timestep there."""
+        occupancy_index = self.game.occupancy_index
         if self.location:  # People just being instantiated won't have a location yet
             self.location.people_here_now.remove(self)
+            occupancy_index.pop(self.location, None)
         self.location = destination
         if destination and self.alive:  # 'destination' will be None for Departures, and dead people go_to cemetery
             destination.people_here_now.add(self)
+            occupancy_index.pop(destination, None)
             # Update this person's whereabouts
             self.whereabouts.record(occasion=occasion)
 
@@ -1722,14 +1759,14 @@ class Person(object):
                 if len(potential_hire_scores) >= 3:
                     # Pick from top three
                     top_three_choices = heapq.nlargest(3, potential_hire_scores, key=potential_hire_scores.get)
-                    if random.random() < 0.6:
+                    if self.game.random.random() < 0.6:
                         choice = top_three_choices[0]
-                    elif random.random() < 0.9:
+                    elif self.game.random.random() < 0.9:
                         choice = top_three_choices[1]
                     else:
                         choice = top_three_choices[2]
                 else:
-                    choice = max(potential_hire_scores)
+                    choice = max(potential_hire_scores, key=potential_hire_scores.get)
         else:
             # This should only ever happen at the very beginning of a city's history where all
             # business types haven't been built in town yet
@@ -1832,9 +1869,9 @@ class Person(object):
         if len(home_and_lot_scores) >= 3:
             # Pick from top three
             top_three_choices = heapq.nlargest(3, home_and_lot_scores, key=home_and_lot_scores.get)
-            if random.random() < 0.6:
+            if self.game.random.random() < 0.6:
                 choice = top_three_choices[0]
-            elif random.random() < 0.9:
+            elif self.game.random.random() < 0.9:
                 choice = top_three_choices[1]
             else:
                 choice = top_three_choices[2]
@@ -1846,22 +1883,20 @@ class Person(object):
 
     def _rate_all_vacant_homes_and_vacant_lots(self):
         """Rate all vacant homes and vacant lots."""
+        vacant_homes = list(self.city.vacant_homes)
+        vacant_lots = list(self.city.vacant_lots)
+        lots_to_rate = [home.lot for home in vacant_homes] + vacant_lots
+        my_scores = self.rate_potential_lots(lots=lots_to_rate)
+        if self.spouse:
+            spouse_scores = self.spouse.rate_potential_lots(lots=lots_to_rate)
+        else:
+            spouse_scores = [0] * len(lots_to_rate)
         scores = {}
-        for home in self.city.vacant_homes:
-            my_score = self.rate_potential_lot(lot=home.lot)
-            if self.spouse:
-                spouse_score = self.spouse.rate_potential_lot(lot=home.lot)
-            else:
-                spouse_score = 0
-            scores[home] = my_score + spouse_score
-        for lot in self.city.vacant_lots:
-            my_score = self.rate_potential_lot(lot=lot)
-            if self.spouse:
-                spouse_score = self.spouse.rate_potential_lot(lot=lot)
-            else:
-                spouse_score = 0
+        for i, home in enumerate(vacant_homes):
+            scores[home] = my_scores[i] + spouse_scores[i]
+        for i, lot in enumerate(vacant_lots, start=len(vacant_homes)):
             scores[lot] = (
-                (my_score + spouse_score) * self.game.config.penalty_for_having_to_build_a_home_vs_buying_one
+                (my_scores[i] + spouse_scores[i]) * self.game.config.penalty_for_having_to_build_a_home_vs_buying_one
             )
         return scores
 
@@ -1874,29 +1909,43 @@ class Person(object):
         a penalty that makes people less willing to build a home on a vacant lot than to move
         into a vacant home.
         """
+        return self.rate_potential_lots(lots=(lot,))[0]
+
+    def rate_potential_lots(self, lots):
+        """Rate the desirability of living at the location of each of the given lots, returning a list of scores.
+
+        The score of a lot is a weighted sum over the homes of this person's relatives and friends
+        and their workplace, where each weight is divided by the distance between that place and the
+        lot. Rather than rating each lot separately, this computes a desirability field over all the
+        lots at once: the weight of each such place is determined a single time, and its
+        contribution to every lot is then added from one row of the city's lot distances.
+        """
         config = self.game.config
         pull_to_live_near_that_relation = config.pull_to_live_near_family
         pull_to_live_near_a_friend = config.pull_to_live_near_a_friend
         desire_to_live_near_family = self._determine_desire_to_move_near_family()
-        # Score home for its proximity to family (either positively or negatively, depending); only
+        # Collect the places that pull this person toward them, along with the strength of that pull
+        pulls = []
+        # Score for proximity to family (either positively or negatively, depending); only
         # consider family members that are alive, in town, and not living with you already (i.e., kids)
         relatives_in_town = {f for f in self.extended_family if f.present and f.home is not self.home}
-        score = 0
         for relative in relatives_in_town:
             relation_to_me = self._common_familial_relation_to_me(person=relative)
             pull_toward_someone_of_that_relation = pull_to_live_near_that_relation.get(relation_to_me, 0.0)
-            dist = self.city.distance_between(relative.home.lot, lot) + 1.0  # To avoid ZeroDivisionError
-            score += (desire_to_live_near_family * pull_toward_someone_of_that_relation) / dist
+            pulls.append((relative.home.lot, desire_to_live_near_family * pull_toward_someone_of_that_relation))
         # Score for proximity to friends (only positively)
         for friend in self.friends:
-            dist = self.city.distance_between(friend.home.lot, lot) + 1.0
-            score += pull_to_live_near_a_friend / dist
+            pulls.append((friend.home.lot, pull_to_live_near_a_friend))
         # Score for proximity to workplace (only positively) -- will be only criterion for person
         # who is new to the city (and thus accurate_belief no one there yet)
         if self.occupation:
-            dist = self.city.distance_between(self.occupation.company.lot, lot) + 1.0
-            score += config.pull_to_live_near_workplace / dist
-        return score
+            pulls.append((self.occupation.company.lot, config.pull_to_live_near_workplace))
+        scores = [0] * len(lots)
+        for place, pull in pulls:
+            distances = self.city.distances_between(place, lots)
+            for i, dist in enumerate(distances):
+                scores[i] += pull / (dist + 1.0)  # Adding 1.0 avoids ZeroDivisionError
+        return scores
 
     def _determine_desire_to_move_near_family(self):
         """Decide how badly you want to move near/away from family.
@@ -1946,7 +1995,7 @@ class Person(object):
                 if person.death_year and person.death_year < self.birth_year and person not in self.immediate_family:
                     interest_in_history_multiplier = 1.0 + self.personality.interest_in_history
                     chance_implant_even_happens *= interest_in_history_multiplier
-                if random.random() < chance_implant_even_happens:
+                if self.game.random.random() < chance_implant_even_happens:
                     implant_will_happen = True
             if self.age < 4:
                 implant_will_happen = False
@@ -1969,9 +2018,11 @@ class Person(object):
 
     def observe(self):
         """Observe the place one is at and the people there."""
-        for thing in {self.location} | self.location.people_here_now - {self}:
-            if random.random() < self.game.config.chance_someone_observes_nearby_entity:
-                self._form_or_build_up_mental_model(subject=thing)
+        people_here, _ = self.game.occupants(location=self.location)
+        for thing in (self.location,) + people_here:
+            if thing is not self:
+                if self.game.random.random() < self.game.config.chance_someone_observes_nearby_entity:
+                    self._form_or_build_up_mental_model(subject=thing)
 
     def _form_or_build_up_mental_model(self, subject):
         """Instantiate (or further fill in) a mental model of a person or place."""
@@ -1990,8 +2041,10 @@ class Person(object):
         """Socialize with nearby people."""
         if not self.location:
             raise Exception("{} tried to socialize, but they have no location currently.".format(self.name))
-        for person in list(self.location.people_here_now):
-            if self._decide_to_instigate_social_interaction(other_person=person):
+        # Only those here who are old enough to be socialized with need be considered (see Game.occupants())
+        _, people_here_who_may_be_socialized_with = self.game.occupants(location=self.location)
+        for person in people_here_who_may_be_socialized_with:
+            if person is not self and self._decide_to_instigate_social_interaction(other_person=person):
                 if person not in self.relationships:
                     Acquaintance(owner=self, subject=person, preceded_by=None)
                 if not self.relationships[person].interacted_this_timestep:
@@ -2068,9 +2121,8 @@ class Person(object):
             statement = Statement(subject=person_in_question, source=talker, recipient=listener)
             declaration = Declaration(subject=person_in_question, source=talker, recipient=listener)
             # Potentially have someone eavesdrop -- TODO maybe affect this by whether eavesdropper accurate_belief subject
-            people_in_earshot = self.location.people_here_now - {talker, listener}
-            eavesdropper = None if not people_in_earshot else random.choice(list(people_in_earshot))
-            if eavesdropper and random.random() < config.chance_someone_eavesdrops_statement_or_lie:
+            eavesdropper = self._choose_eavesdropper(talker=talker, listener=listener)
+            if eavesdropper and self.game.random.random() < config.chance_someone_eavesdrops_statement_or_lie:
                 eavesdropping = Eavesdropping(
                     subject=person_in_question, source=talker, recipient=listener, eavesdropper=eavesdropper
                 )
@@ -2079,7 +2131,7 @@ class Person(object):
             else:
                 eavesdropping = None
             for feature_type, prob in config.chance_someones_feature_comes_up_in_conversation_about_them:
-                if random.random() < prob:
+                if self.game.random.random() < prob:
                     # Have talker convey information about feature_type of person_in_question
                     if talker.get_knowledge_about_person(other_person=person_in_question, feature_type=feature_type):
                         talker_belief_facet = (
@@ -2104,6 +2156,21 @@ class Person(object):
                                 feature_object_itself=talker_belief_facet.object_itself, new_evidence=eavesdropping
                             )
 
+    def _choose_eavesdropper(self, talker, listener):
+        """Return someone at this person's location (other than the talker and listener) to potentially eavesdrop, if anyone."""
+        people_here, _ = self.game.occupants(location=self.location)
+        # Either the talker or the listener is this person; the other may or may not be here
+        n_people_in_earshot = len(people_here) - (2 if talker.location is listener.location else 1)
+        if not n_people_in_earshot:
+            return None
+        # Pick the n-th person here who is neither talker nor listener, rather than building a list of them
+        n = self.game.random.randrange(n_people_in_earshot)
+        for person in people_here:
+            if person is not talker and person is not listener:
+                if not n:
+                    return person
+                n -= 1
+
     def _decide_to_instigate_social_interaction(self, other_person):
         """Decide whether to instigate a social interaction with another person."""
         config = self.game.config
@@ -2125,7 +2192,7 @@ class Person(object):
                 chance = config.chance_someone_instigates_interaction_with_other_person_floor
             elif chance > config.chance_someone_instigates_interaction_with_other_person_cap:
                 chance = config.chance_someone_instigates_interaction_with_other_person_cap
-        if random.random() < chance:
+        if self.game.random.random() < chance:
             return True
         else:
             return False
@@ -2167,6 +2234,7 @@ class Person(object):
         self.age = age = self.game.true_year - self.birth_year
         if age == config.age_people_start_working(year=self.game.year):
             self.ready_to_work = True
+            self.city.update_employment_status(self)
             consider_leaving_town = True
         if age == 18:
             self.adult = True
@@ -2182,7 +2250,7 @@ class Person(object):
                 self.relationships[other_person].update_spark_and_charge_increments_for_new_age_difference()
         # Potentially have your hair turn gray (or white, if it's already gray) -- TODO MAKE THIS HERITABLE
         if age > config.age_when_people_start_graying:
-            if random.random() < config.chance_someones_hair_goes_gray_or_white:
+            if self.game.random.random() < config.chance_someones_hair_goes_gray_or_white:
                 new_color_str = 'gray' if self.face.hair.color != 'gray' else 'white'
                 # Maintain the same face.Feature attributes as the original Feature had, but
                 # create a new Feature object with the updated string -- TODO is this still inheritance?
@@ -2195,7 +2263,7 @@ class Person(object):
                 )
         # Potentially go bald, if male -- TODO MAKE THIS HERITABLE
         if self.male and age > config.age_when_men_start_balding:
-            if random.random() < config.chance_someones_loses_their_hair_some_year:
+            if self.game.random.random() < config.chance_someones_loses_their_hair_some_year:
                 # Maintain the same face.Feature attributes as the original Feature had, but
                 # create a new Feature object with the updated string -- TODO is this still inheritance?
                 variant_id = self.face.hair.length.variant_id
@@ -2205,7 +2273,7 @@ class Person(object):
                     value='bald', variant_id=variant_id, inherited_from=inherited_from,
                     exact_variant_inherited=exact_variant_inherited
                 )
-        if consider_leaving_town and random.random() < config.chance_a_new_adult_decides_to_leave_town:
+        if consider_leaving_town and self.game.random.random() < config.chance_a_new_adult_decides_to_leave_town:
             self.depart_city()
 
     def update_salience_of(self, entity, change):
@@ -2349,14 +2417,14 @@ class PersonExNihilo(Person):
     def _init_name(self):
         """Generate a name for a primordial person who has no parents."""
         if self.male:
-            first_name_rep = Names.a_masculine_name(year=self.birth_year)
-            middle_name_rep = Names.a_masculine_name(year=self.birth_year)
+            first_name_rep = self.game.names.a_masculine_name(year=self.birth_year)
+            middle_name_rep = self.game.names.a_masculine_name(year=self.birth_year)
         else:
-            first_name_rep = Names.a_feminine_name(year=self.birth_year)
-            middle_name_rep = Names.a_feminine_name(year=self.birth_year)
+            first_name_rep = self.game.names.a_feminine_name(year=self.birth_year)
+            middle_name_rep = self.game.names.a_feminine_name(year=self.birth_year)
         first_name = Name(value=first_name_rep, progenitor=self, conceived_by=(), derived_from=())
         middle_name = Name(value=middle_name_rep, progenitor=self, conceived_by=(), derived_from=())
-        last_name = Name(value=Names.any_surname(), progenitor=self, conceived_by=(), derived_from=())
+        last_name = Name(value=self.game.names.any_surname(), progenitor=self, conceived_by=(), derived_from=())
         suffix = ''
         return first_name, middle_name, last_name, suffix
 
@@ -2371,7 +2439,7 @@ class PersonExNihilo(Person):
         """Generate a birth year for this person that is consistent with the job level they/spouse will get."""
         config = self.game.config
         age_at_current_year_of_sim = config.function_to_determine_person_ex_nihilo_age_given_job_level(
-            job_level=job_level
+            job_level=job_level, rng=self.game.random
         )
         birth_year = self.game.true_year - age_at_current_year_of_sim
         return birth_year
@@ -2398,7 +2466,7 @@ class PersonExNihilo(Person):
                     city_pop=self.game.city.population
                 )
             )
-            if random.random() < chance_of_having_family or job_opportunity_impetus.__name__ == 'Farmer':
+            if self.game.random.random() < chance_of_having_family or job_opportunity_impetus.__name__ == 'Farmer':
                 self._init_generate_family(job_opportunity_impetus=job_opportunity_impetus)
 
     def _init_generate_family(self, job_opportunity_impetus):
@@ -2415,7 +2483,7 @@ class PersonExNihilo(Person):
         config = self.game.config
         # Change actual game year to marriage year, instantiate a Marriage object
         marriage_date = self.birth_year + (
-            random.normalvariate(
+            self.game.random.normalvariate(
                 config.person_ex_nihilo_age_at_marriage_mean, config.person_ex_nihilo_age_at_marriage_sd
             )
         )
@@ -2447,7 +2515,7 @@ class PersonExNihilo(Person):
                     n_kids=len(self.marriage.children_produced)
                 )
             )
-            if random.random() < chance_they_are_trying_to_conceive_this_year:
+            if self.game.random.random() < chance_they_are_trying_to_conceive_this_year:
                 self.have_sex(partner=self.spouse, protection=False)
             else:
                 self.have_sex(partner=self.spouse, protection=True)
@@ -2456,9 +2524,10 @@ class PersonExNihilo(Person):
         """Move into the city in which gameplay takes place."""
         self.city = self.game.city
         self.city.residents.add(self)
+        self.city.update_employment_status(self)
         new_home = self.secure_home()
         if not new_home:
-            someone_elses_home = random.choice(list(self.city.dwelling_places))
+            someone_elses_home = self.game.random.choice(list(self.city.dwelling_places))
             self.move(new_home=someone_elses_home, reason=hiring_that_instigated_move)
         if new_home:
             self.move(new_home=new_home, reason=hiring_that_instigated_move)
@@ -2477,7 +2546,7 @@ class PersonExNihilo(Person):
                     3, apartment_complexes_in_town,
                     key=lambda ac: self.city.distance_between(ac.lot, self.city.downtown)
                 )
-                complex_that_will_expand = random.choice(complexes_closest_to_downtown)
+                complex_that_will_expand = self.game.random.choice(complexes_closest_to_downtown)
             else:
                 complex_that_will_expand = min(
                     apartment_complexes_in_town,
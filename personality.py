@@ -1,6 +1,3 @@
-import random
-
-
 class Personality(object):
     """A person's personality."""
 
@@ -90,19 +87,19 @@ class Personality(object):
         config = self.person.game.config
         feature_will_get_inherited = (
             self.person.biological_mother and
-            random.random() < config.big_five_heritability_chance[feature_type]
+            self.person.game.random.random() < config.big_five_heritability_chance[feature_type]
         )
         if feature_will_get_inherited:
             # Inherit this trait (with slight variance)
-            takes_after = random.choice([self.person.biological_father, self.person.biological_mother])
-            feature_value = random.normalvariate(
+            takes_after = self.person.game.random.choice([self.person.biological_father, self.person.biological_mother])
+            feature_value = self.person.game.random.normalvariate(
                 self._get_a_persons_feature_of_type(person=takes_after, feature_type=feature_type),
                 config.big_five_inheritance_sd[feature_type]
             )
         else:
             takes_after = None
             # Generate from the population mean
-            feature_value = random.normalvariate(
+            feature_value = self.person.game.random.normalvariate(
                 config.big_five_mean[feature_type], config.big_five_sd[feature_type]
             )
         if feature_value < config.big_five_floor:
@@ -119,7 +116,7 @@ class Personality(object):
         based on my intuitions.
         """
         personality_component = (float(self.o)*2 + float(self.c)*0.5 + float(self.a))
-        chance_component = random.random() * (1.0 if random.random() < 0.5 else -1.0)
+        chance_component = self.person.game.random.random() * (1.0 if self.person.game.random.random() < 0.5 else -1.0)
         # Now divide by 4.5 to get this on the -1 to 1 scale (since -4.5 is the lowest
         # possible sum of personality_component+chance_component and 4.5 is the highest)
         interest_in_history = (personality_component + chance_component) / 4.5
@@ -170,6 +167,6 @@ class Feature(float):
         super(Feature, self).__init__()
         self.inherited_from = inherited_from
 
-    def __new__(cls, value, inherited_from):
-        """Do float stuff."""
+    def __new__(cls, value, inherited_from=None):
+        """Do float stuff (the other argument may be omitted, as when unpickling)."""
         return float.__new__(cls, value)
\ No newline at end of file
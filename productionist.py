@@ -1,7 +1,6 @@
 import sys
 import json
 import itertools
-import random
 
 
 class Productionist(object):
@@ -16,6 +15,7 @@ class Productionist(object):
         """Initialize a Productionist object."""
         self.game = game
         self.debug = debug
+        self.random = game.random_stream('dialogue')
         self.nonterminal_symbols = self._init_parse_json_grammar_specification(
             path_to_json_grammar_specification=game.config.path_to_json_grammar_specification
         )
@@ -134,7 +134,7 @@ class Productionist(object):
         # Collect all symbols that satisfice this move (see above or ctrl+f for more explanation)
         satisficing_symbols = list(self.move_satisficers[move_name])
         # Randomly shuffle this list (to promote conversational variability)
-        random.shuffle(satisficing_symbols)
+        self.random.shuffle(satisficing_symbols)
         # Iteratively attempt to successfully build a line of dialogue by backward-chaining
         # and forward-chaining from this symbol
         for symbol in satisficing_symbols:
@@ -174,7 +174,7 @@ class Productionist(object):
             satisficing_symbols |= self.topic_satisficers[topic_name]
         satisficing_symbols = list(satisficing_symbols)
         # Randomly shuffle this list (to promote conversational variability)
-        random.shuffle(satisficing_symbols)
+        self.random.shuffle(satisficing_symbols)
         # Iteratively attempt to successfully build a line of dialogue by backward-chaining
         # and forward-chaining from this symbol
         for symbol in satisficing_symbols:
@@ -400,7 +400,7 @@ class Productionist(object):
         # rule-head groups, since the application rates of rules in different groups
         # only mean anything relative to the other rules in that same group, not to
         # rules in other groups)
-        random.shuffle(rule_heads)
+        self.random.shuffle(rule_heads)
         # Probabilistically sort each head group
         for head in rule_heads:
             rules_sharing_this_head = [rule for rule in rules if rule.head is head]
@@ -423,7 +423,7 @@ class Productionist(object):
             probability_ranges = (
                 self._fit_probability_distribution_to_rules_according_to_their_application_rates(rules=remaining_rules)
             )
-            x = random.random()
+            x = self.random.random()
             probabilistically_selected_rule = next(
                 rule for rule in remaining_rules if probability_ranges[rule][0] <= x <= probability_ranges[rule][1]
             )
@@ -890,6 +890,17 @@ class Condition(object):
         self.test = eval(condition)  # The condition is literally a lambda function
         self.arguments = self._init_parse_condition_for_its_arguments(condition=condition)
 
+    def __getstate__(self):
+        """Return the state of this object for pickling, which leaves out its (unpicklable) lambda function."""
+        state = dict(self.__dict__)
+        del state['test']
+        return state
+
+    def __setstate__(self, state):
+        """Restore this object from its pickled state, which requires recompiling its lambda function."""
+        self.__dict__.update(state)
+        self.test = eval(self.condition)
+
     @staticmethod
     def _init_parse_condition_for_its_arguments(condition):
         """Parse this condition's specification (a lambda function) to gather the arguments that it requires."""
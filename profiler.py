@@ -0,0 +1,214 @@
+import time
+from person import Person
+from productionist import Productionist
+
+
+class Profiler(object):
+    """Counters of the calls to, cumulative time spent in, and objects created by the phases of the simulation.
+
+    Each phase of Game.enact_lo_fi_simulation() and Game.enact_hi_fi_simulation() (births,
+    business churn, routines, observation and socializing, deterioration, decay, and so forth)
+    is a method of Game, and while the profiler is enabled, those methods and a handful of hot
+    leaf calls (e.g., Person._exchange_information()) are wrapped with timers; since nothing
+    is wrapped while it is disabled, a disabled profiler costs nothing. Code outside of these
+    methods can also be timed as a 'with profiler.phase(name):' block.
+    """
+
+    # The phases of the simulation that get timed while the profiler is enabled, as names of Game methods
+    phases = (
+        'potentially_establish_a_new_business',
+        'potentially_shut_down_businesses',
+        'simulate_births',
+        'simulate_life_events',
+        'enact_routines',
+        'have_people_socialize',
+        'index_who_is_where',
+        'decay_beliefs',
+        'prune_superseded_belief_facets',
+        'have_people_observe_and_socialize',
+        'deteriorate_mental_models',
+    )
+    # The leaf calls that get timed while the profiler is enabled, as (class, method name) pairs; because
+    # these are wrapped on the classes themselves, only one profiler at a time may time them, and it
+    # will count calls made in any gameplay instance
+    leaf_calls = (
+        (Person, 'observe'),
+        (Person, 'socialize'),
+        (Person, '_exchange_information'),
+        (Person, 'implant_knowledge'),
+        (Productionist, 'target_dialogue_move'),
+    )
+    # The unwrapped leaf calls, keyed by (class, method name), while some profiler is timing them
+    _original_leaf_methods = {}
+
+    def __init__(self, game):
+        """Initialize a Profiler object.
+
+        @param game: The gameplay instance whose simulation will be profiled.
+        """
+        self.game = game
+        self.enabled = False
+        # Dictionaries mapping the names of phases and leaf calls to their counters, namely
+        # a list of the form [calls, seconds, people created, places created, events created] (where
+        # events include pieces of evidence, which also draw event numbers);
+        # this timestep's counters get folded into the totals at the end of each timestep
+        self.totals = {}
+        self.this_timestep = {}
+        # Callbacks that get called with (game, counters) at the end of every timestep, where
+        # counters is a dictionary of the form that Profiler.report() returns
+        self.timestep_callbacks = []
+        # Callbacks that get called with (name, seconds) upon the completion of every timed call
+        self.phase_callbacks = []
+        self.times_leaf_calls = False
+
+    def enable(self):
+        """Start profiling, which wraps each of the phases and leaf calls with a timer."""
+        if self.enabled:
+            return
+        self.enabled = True
+        for method_name in self.phases:
+            # Wrap the bound method on this instance only, which shadows the method on the class
+            setattr(self.game, method_name, self._timed(
+                name='Game.{}'.format(method_name), method=getattr(self.game, method_name)
+            ))
+        if not Profiler._original_leaf_methods:  # Otherwise, another profiler is already timing them
+            self.times_leaf_calls = True
+            for cls, method_name in self.leaf_calls:
+                original_method = cls.__dict__[method_name]
+                Profiler._original_leaf_methods[(cls, method_name)] = original_method
+                setattr(cls, method_name, self._timed(
+                    name='{}.{}'.format(cls.__name__, method_name), method=original_method
+                ))
+
+    def disable(self):
+        """Stop profiling, which restores each of the phases and leaf calls to its unwrapped self."""
+        if not self.enabled:
+            return
+        self.enabled = False
+        for method_name in self.phases:
+            delattr(self.game, method_name)
+        if self.times_leaf_calls:
+            self.times_leaf_calls = False
+            for (cls, method_name), original_method in Profiler._original_leaf_methods.iteritems():
+                setattr(cls, method_name, original_method)
+            Profiler._original_leaf_methods = {}
+
+    def phase(self, name):
+        """Return a context manager that times the enclosed block of code, if profiling."""
+        if not self.enabled:
+            return _NO_OP_TIMER
+        return _PhaseTimer(profiler=self, name=name)
+
+    def add_timestep_callback(self, callback):
+        """Have the given callback get called with (game, counters) at the end of every timestep."""
+        self.timestep_callbacks.append(callback)
+
+    def add_phase_callback(self, callback):
+        """Have the given callback get called with (name, seconds) upon the completion of every timed call."""
+        self.phase_callbacks.append(callback)
+
+    def finish_timestep(self):
+        """Fold this timestep's counters into the totals, and pass them to any timestep callbacks."""
+        if not self.this_timestep:
+            return
+        if self.timestep_callbacks:
+            counters_this_timestep = self._format(self.this_timestep)
+            for callback in self.timestep_callbacks:
+                callback(self.game, counters_this_timestep)
+        for name, counter in self.this_timestep.iteritems():
+            if name not in self.totals:
+                self.totals[name] = [0, 0.0, 0, 0, 0]
+            total = self.totals[name]
+            for i in xrange(5):
+                total[i] += counter[i]
+        self.this_timestep = {}
+
+    def report(self):
+        """Return a dictionary mapping the name of each phase or leaf call to its cumulative counters."""
+        self.finish_timestep()
+        return self._format(self.totals)
+
+    def reset(self):
+        """Discard all counters."""
+        self.totals = {}
+        self.this_timestep = {}
+
+    def _object_counts(self):
+        """Return the running counts of people, places, and events created in this gameplay instance."""
+        game = self.game
+        return game.current_person_id, game.current_place_id, game.event_number
+
+    def _count(self, name, seconds, object_counts_before):
+        """Count a call to the named phase or leaf call, and pass it to any phase callbacks."""
+        if name not in self.this_timestep:
+            self.this_timestep[name] = [0, 0.0, 0, 0, 0]
+        counter = self.this_timestep[name]
+        people, places, events = self._object_counts()
+        counter[0] += 1
+        counter[1] += seconds
+        counter[2] += people - object_counts_before[0]
+        counter[3] += places - object_counts_before[1]
+        counter[4] += events - object_counts_before[2]
+        for callback in self.phase_callbacks:
+            callback(name, seconds)
+
+    def _timed(self, name, method):
+        """Return a version of the given method that counts its calls with this profiler."""
+        profiler = self
+
+        def timed_method(*args, **kwargs):
+            object_counts_before = profiler._object_counts()
+            start_time = time.time()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                profiler._count(name=name, seconds=time.time()-start_time, object_counts_before=object_counts_before)
+        timed_method.__name__ = method.__name__
+        timed_method.__doc__ = method.__doc__
+        return timed_method
+
+    @staticmethod
+    def _format(counters):
+        """Return the given counters as a dictionary of dictionaries."""
+        return {
+            name: {
+                "calls": counter[0], "time (s)": counter[1], "people created": counter[2],
+                "places created": counter[3], "events and evidence created": counter[4]
+            }
+            for name, counter in counters.iteritems()
+        }
+
+
+class _PhaseTimer(object):
+    """A context manager that counts a block of code with a profiler."""
+
+    def __init__(self, profiler, name):
+        """Initialize a _PhaseTimer object."""
+        self.profiler = profiler
+        self.name = name
+        self.object_counts_before = None
+        self.start_time = None
+
+    def __enter__(self):
+        self.object_counts_before = self.profiler._object_counts()
+        self.start_time = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler._count(
+            name=self.name, seconds=time.time()-self.start_time, object_counts_before=self.object_counts_before
+        )
+        return False
+
+
+class _NoOpTimer(object):
+    """A context manager that does nothing, which stands in for phase timers when not profiling."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NO_OP_TIMER = _NoOpTimer()
@@ -65,11 +65,10 @@ class Relationship(object):
         self.job_level_difference_effect_on_spark_increment = None
         self.update_spark_and_charge_increments_for_new_age_difference()
         self.update_spark_and_charge_increments_for_job_level_difference()
-        # This attribute records whether the other person has already called the
-        # progress_relationship() method of this object on this timestep -- it gets
-        # set to True by progress_relationship() and then turned back to False by
-        # Game.enact_hi_fi_simulation()
-        self.interacted_this_timestep = False
+        # This attribute records the interaction timestep (see Game.interaction_timestep) on which
+        # the other person last called the progress_relationship() method of this object, which
+        # tells whether they have already done so on this timestep
+        self.interaction_timestep_of_last_interaction = None
         # Keep track of all the conversations they've had during hi-fi timesteps
         self.conversations = []
 
@@ -356,7 +355,7 @@ class Relationship(object):
             elif owner.spouse in owner.relationships:
                 if self.spark > owner.relationships[owner.spouse] * 2:
                     owner.divorce(partner=owner.spouse)
-        self.interacted_this_timestep = True
+        self.interaction_timestep_of_last_interaction = owner.game.interaction_timestep
         # Call this method for the subject's own conception of this relationship
         # to update its attributes according to this interaction
         if not subject.relationships[owner].interacted_this_timestep:
@@ -415,6 +414,11 @@ class Relationship(object):
             owner.love_interest = None
             owner.spark_of_love_interest = 0.0
 
+    @property
+    def interacted_this_timestep(self):
+        """Return whether progress_relationship() has already been called for this relationship on this timestep."""
+        return self.interaction_timestep_of_last_interaction == self.owner.game.interaction_timestep
+
     @property
     def last_met_str(self):
         """Return a string representing the last time these two met."""
@@ -25,6 +25,7 @@ class DwellingPlace(object):
         self.block = lot.block
         self.residents = set()
         self.former_residents = set()
+        self.city.update_vacancy_of_home(self)
         self.transactions = []
         self.move_ins = []
         self.move_outs = []
@@ -34,6 +35,10 @@ class DwellingPlace(object):
         self.people_here_now = set()  # People at home on a specific time step (either a resident or visitor)
         self.demolition = None  # Potentially gets set by event.Demolition.__init__()
 
+    def __hash__(self):
+        """Return a hash of this dwelling place's ID, so that collections of them iterate in a reproducible order."""
+        return self.id
+
     def __str__(self):
         """Return string representation."""
         if self.demolition or self.apartment and self.complex.demolition:
@@ -119,4 +124,5 @@ class House(DwellingPlace):
     def __init__(self, lot, construction):
         super(House, self).__init__(lot, owners=construction.subjects)
         self.construction = construction
-        self.lot.building = self
\ No newline at end of file
+        self.lot.building = self
+        self.city.update_vacancy_of_lot(self.lot)
\ No newline at end of file
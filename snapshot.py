@@ -0,0 +1,168 @@
+import copy_reg
+import cPickle
+import datetime
+import glob
+import gzip
+import hashlib
+import os
+import sys
+import threading
+from person import Person
+from business import Business
+from residence import DwellingPlace
+from occupation import Occupation
+from city import Street, Parcel, Block, Lot
+
+
+# The version of the snapshot format; increment this whenever a change to the simulation would
+# make snapshots taken before it unsafe to resume (snapshots taken by other versions of the code
+# are also rejected by default, since they may not be consistent with it)
+SNAPSHOT_FORMAT_VERSION = 17
+# Source files in this directory that aren't part of the simulation, and so don't figure into
+# the fingerprint of the code that a snapshot records
+SOURCE_FILES_NOT_FINGERPRINTED = ('benchmark.py', 'test.py')
+# A game's object graph (people, their mental models, the evidence behind their beliefs, and so
+# forth) is deep enough that pickling it recurses far beyond Python's default recursion limit,
+# so snapshots are saved and loaded in a thread with a large stack and a raised recursion limit
+RECURSION_LIMIT = 1000000
+STACK_SIZE = 512 * 1024 * 1024
+# The classes whose hashes derive from their attributes, mapped to the attributes their hashes
+# require; while a game is being unpickled, its objects are added to sets and dictionaries before
+# their full state is restored, so these attributes are restored upon their very creation
+ATTRIBUTES_REQUIRED_FOR_HASHING = {
+    Person: ('id',),
+    Business: ('id',),
+    DwellingPlace: ('id',),
+    Street: ('id',),
+    Parcel: ('id',),
+    Block: ('id',),
+    Lot: ('id',),
+    Occupation: ('person',),
+}
+
+
+def save_snapshot(game, path, archive_knowledge=False):
+    """Save a snapshot of the complete state of a game to the given path.
+
+    A snapshot is a gzipped file holding two pickles: a header (see read_snapshot_header())
+    and then the game itself, which brings along everything reachable from it (the city, its
+    residents and companies, all events, and people's mental models, belief facets, evidence,
+    and relationships).
+
+    @param game: The gameplay instance to snapshot.
+    @param path: Where to write the snapshot.
+    @param archive_knowledge: Whether to first archive everyone's knowledge into a columnar
+                              encoding (see archive.py), which is far more compact to pickle
+                              than the objects themselves.
+    """
+    if archive_knowledge:
+        game.archive_knowledge()
+    header = {
+        "format version": SNAPSHOT_FORMAT_VERSION,
+        "code fingerprint": fingerprint_code(),
+        "seed": game.seed,
+        "date": game.date,
+        "ordinal date": game.ordinal_date,
+        "time of day": game.time_of_day,
+        "knowledge archived": archive_knowledge,
+        "date saved": str(datetime.datetime.now()),
+    }
+    with gzip.open(path, 'wb', compresslevel=1) as f:
+        cPickle.dump(header, f, cPickle.HIGHEST_PROTOCOL)
+        _call_with_a_deep_stack(cPickle.dump, game, f, cPickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot(path, allow_other_code_versions=False):
+    """Return the game saved in the snapshot at the given path.
+
+    @param path: The path to a snapshot saved by save_snapshot().
+    @param allow_other_code_versions: Whether to load a snapshot taken by a different version of
+                                      the code than this one (so long as its format version matches),
+                                      which may behave inconsistently once resumed.
+    """
+    with gzip.open(path, 'rb') as f:
+        header = cPickle.load(f)
+        if header["format version"] != SNAPSHOT_FORMAT_VERSION:
+            raise Exception(
+                "The snapshot at {} has format version {}, but this code reads version {}.".format(
+                    path, header["format version"], SNAPSHOT_FORMAT_VERSION
+                )
+            )
+        if not allow_other_code_versions and header["code fingerprint"] != fingerprint_code():
+            raise Exception(
+                "The snapshot at {} was taken by a different version of the code; take a new one, or "
+                "pass allow_other_code_versions=True to load it anyway.".format(path)
+            )
+        # Read the game in full before unpickling it, since unpickling straight from a gzip
+        # file (which gets read from in many small pieces) is much slower
+        pickled_game = f.read()
+    return _call_with_a_deep_stack(cPickle.loads, pickled_game)
+
+
+def read_snapshot_header(path):
+    """Return the header of the snapshot at the given path, which records its versioning and game date."""
+    with gzip.open(path, 'rb') as f:
+        return cPickle.load(f)
+
+
+def fingerprint_code():
+    """Return a fingerprint of the source code of the simulation, which is recorded in every snapshot."""
+    fingerprint = hashlib.md5()
+    for source_file in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py'))):
+        if os.path.basename(source_file) not in SOURCE_FILES_NOT_FINGERPRINTED:
+            with open(source_file, 'rb') as f:
+                fingerprint.update(f.read())
+    return fingerprint.hexdigest()
+
+
+def _call_with_a_deep_stack(function, *args):
+    """Return the result of calling the given function in a thread with a large stack and recursion limit."""
+    outcome = {}
+
+    def call():
+        try:
+            outcome["result"] = function(*args)
+        except Exception:
+            outcome["error"] = sys.exc_info()
+    original_recursion_limit = sys.getrecursionlimit()
+    original_stack_size = threading.stack_size(STACK_SIZE)
+    sys.setrecursionlimit(RECURSION_LIMIT)
+    try:
+        thread = threading.Thread(target=call)
+        thread.start()
+        thread.join()
+    finally:
+        sys.setrecursionlimit(original_recursion_limit)
+        threading.stack_size(original_stack_size)
+    if "error" in outcome:
+        error_type, error, traceback = outcome["error"]
+        raise error_type, error, traceback
+    return outcome["result"]
+
+
+def _reduce_object_hashed_by_its_attributes(obj):
+    """Return a tuple specifying how to pickle an object whose hash derives from its attributes."""
+    for cls, attributes in ATTRIBUTES_REQUIRED_FOR_HASHING.iteritems():
+        if isinstance(obj, cls):
+            attributes_required_for_hashing = {attribute: getattr(obj, attribute) for attribute in attributes}
+            return _recreate_object_hashed_by_its_attributes, (obj.__class__, attributes_required_for_hashing), obj.__dict__
+
+
+def _recreate_object_hashed_by_its_attributes(cls, attributes_required_for_hashing):
+    """Recreate an object whose hash derives from its attributes, so that it may be hashed before its state is restored."""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(attributes_required_for_hashing)
+    return obj
+_recreate_object_hashed_by_its_attributes.__safe_for_unpickling__ = True
+
+
+def _register_reducers_for_objects_hashed_by_their_attributes():
+    """Register how to pickle each class (and subclass) whose hash derives from its attributes."""
+    classes = list(ATTRIBUTES_REQUIRED_FOR_HASHING)
+    while classes:
+        cls = classes.pop()
+        copy_reg.pickle(cls, _reduce_object_hashed_by_its_attributes)
+        classes += cls.__subclasses__()
+
+
+_register_reducers_for_objects_hashed_by_their_attributes()
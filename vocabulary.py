@@ -0,0 +1,47 @@
+class Vocabulary(object):
+    """An interning table that maps strings (e.g., feature types and feature values) to small integer codes.
+
+    Each distinct string is held exactly once, so that, e.g., the many thousands of belief facets
+    of a given feature type all reference one shared string object; since dictionary lookups compare
+    keys by identity before equality, lookups keyed by interned strings (e.g., in
+    config.chance_of_memory_deterioration_on_a_given_timestep) also stay cheap. The codes are stable
+    for the life of a game, and are what a KnowledgeArchive uses to encode strings. Since a string
+    is never let go once it's been added, strings that are specific to a single timestep (namely
+    whereabouts feature types and evidence dates, of which there are ever more) are kept out of it.
+    """
+
+    def __init__(self, strings=()):
+        """Initialize a Vocabulary object.
+
+        @param strings: Strings to assign the first codes to, in order.
+        """
+        self.strings = []
+        self.codes = {}
+        for string in strings:
+            self.code(string)
+
+    def __getitem__(self, code):
+        """Return the string with the given code."""
+        return self.strings[code]
+
+    def __len__(self):
+        """Return the number of strings in this vocabulary."""
+        return len(self.strings)
+
+    def __contains__(self, string):
+        """Return whether the given string is in this vocabulary."""
+        return string in self.codes
+
+    def code(self, string):
+        """Return the code for the given string, adding it to this vocabulary if need be."""
+        try:
+            return self.codes[string]
+        except KeyError:
+            string = intern(str(string))
+            self.codes[string] = len(self.strings)
+            self.strings.append(string)
+            return len(self.strings) - 1
+
+    def intern(self, string):
+        """Return this vocabulary's own copy of the given string, adding it if need be."""
+        return self.strings[self.code(string)]